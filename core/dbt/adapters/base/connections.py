@@ -1,6 +1,8 @@
 import abc
 import os
-from time import sleep
+import threading
+from dataclasses import dataclass
+from time import monotonic, sleep
 import sys
 import traceback
 
@@ -19,6 +21,7 @@ from typing import (
     Union,
     Iterable,
     Callable,
+    Set,
 )
 
 import agate
@@ -37,8 +40,10 @@ from dbt.adapters.base.query_headers import (
     MacroQueryStringSetter,
 )
 from dbt.events import AdapterLogger
+from dbt.events.base_types import EventLevel
 from dbt.events.functions import fire_event
 from dbt.events.types import (
+    Note,
     NewConnection,
     ConnectionReused,
     ConnectionLeftOpenInCleanup,
@@ -56,6 +61,91 @@ SleepTime = Union[int, float]  # As taken by time.sleep.
 AdapterHandle = Any  # Adapter connection handle objects can be any class.
 
 
+@dataclass
+class ConnectionPoolStats:
+    leases: int = 0
+    connects: int = 0
+    # all times are in seconds
+    acquire_wait: float = 0.0
+    max_acquire_wait: float = 0.0
+    connect_time: float = 0.0
+
+
+# A bounded set of open handles that are leased to the connections of the
+# worker threads, so that a run opens at most `size` handles no matter how
+# many threads ask for a connection. A lease lasts until the connection is
+# released at the end of its `connection_named` scope. Leasing waits while
+# every handle is leased out, then reuses an idle handle or opens a new one.
+# The main thread's connection doesn't take part: it's often held while the
+# main thread waits on workers that need a handle, which would never finish
+# if the main thread's lease used up the last slot.
+class ConnectionPool:
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise dbt.exceptions.DbtRuntimeError(
+                f"The connection pool size must be at least 1, got {size}"
+            )
+        self.size = size
+        self.stats = ConnectionPoolStats()
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: List[AdapterHandle] = []
+        # ids of the handles that are leased out
+        self._leased: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def lease(
+        self, connection: Connection, opener: Callable[[Connection], Connection]
+    ) -> Connection:
+        start = monotonic()
+        self._slots.acquire()
+        waited = monotonic() - start
+        with self._lock:
+            self.stats.leases += 1
+            self.stats.acquire_wait += waited
+            self.stats.max_acquire_wait = max(self.stats.max_acquire_wait, waited)
+            handle = self._idle.pop() if self._idle else None
+
+        if handle is not None:
+            connection.handle = handle
+            connection.state = ConnectionState.OPEN
+        else:
+            start = monotonic()
+            try:
+                connection = opener(connection)
+            except BaseException:
+                self._slots.release()
+                raise
+            with self._lock:
+                self.stats.connects += 1
+                self.stats.connect_time += monotonic() - start
+
+        with self._lock:
+            self._leased.add(id(connection.handle))
+        return connection
+
+    def is_leased(self, handle: AdapterHandle) -> bool:
+        with self._lock:
+            return id(handle) in self._leased
+
+    def give_back(self, handle: AdapterHandle) -> None:
+        with self._lock:
+            self._leased.discard(id(handle))
+            self._idle.append(handle)
+        self._slots.release()
+
+    def discard(self, handle: AdapterHandle) -> None:
+        """Free the slot of a leased handle that won't be given back."""
+        with self._lock:
+            self._leased.discard(id(handle))
+        self._slots.release()
+
+    def drain(self) -> List[AdapterHandle]:
+        """Remove and return the idle handles."""
+        with self._lock:
+            handles, self._idle = self._idle, []
+        return handles
+
+
 class BaseConnectionManager(metaclass=abc.ABCMeta):
     """Methods to implement:
         - exception_handler
@@ -77,6 +167,10 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         self.thread_connections: Dict[Hashable, Connection] = {}
         self.lock: RLock = flags.MP_CONTEXT.RLock()
         self.query_header: Optional[MacroQueryStringSetter] = None
+        self.pool: Optional[ConnectionPool] = None
+        pool_size = getattr(flags.get_flags(), "CONNECTION_POOL_SIZE", None)
+        if pool_size:
+            self.pool = ConnectionPool(pool_size)
 
     def set_query_header(self, manifest: Manifest) -> None:
         self.query_header = MacroQueryStringSetter(self.profile, manifest)
@@ -166,7 +260,7 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
                 handle=None,
                 credentials=self.profile.credentials,
             )
-            conn.handle = LazyHandle(self.open)
+            conn.handle = LazyHandle(self._open_or_lease)
             # Add the connection to thread_connections for this thread
             self.set_thread_connection(conn)
             fire_event(
@@ -174,7 +268,7 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             )
         else:  # existing connection either wasn't open or didn't have the right name
             if conn.state != "open":
-                conn.handle = LazyHandle(self.open)
+                conn.handle = LazyHandle(self._open_or_lease)
             if conn.name != conn_name:
                 orig_conn_name: str = conn.name or ""
                 conn.name = conn_name
@@ -290,12 +384,60 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         """
         raise dbt.exceptions.NotImplementedError("`open` is not implemented for this adapter!")
 
+    def _open_or_lease(self, connection: Connection) -> Connection:
+        if self.pool is None or threading.current_thread() is threading.main_thread():
+            return self.open(connection)
+        return self.pool.lease(connection, self.open)
+
+    def _is_leased(self, connection: Connection) -> bool:
+        return (
+            self.pool is not None
+            and connection.state == ConnectionState.OPEN
+            and self.pool.is_leased(connection.handle)
+        )
+
+    @classmethod
+    def reset_pooled_handle(cls, connection: Connection) -> None:
+        """Prepare the handle of a pooled connection for its next lease. Raise
+        if the handle can't be reused.
+        """
+        if connection.transaction_open:
+            fire_event(Rollback(conn_name=cast_to_str(connection.name), node_info=get_node_info()))
+            connection.handle.rollback()
+            connection.transaction_open = False
+
+    def _return_to_pool(self, connection: Connection) -> None:
+        assert self.pool is not None
+        try:
+            self.reset_pooled_handle(connection)
+        except Exception:
+            fire_event(
+                RollbackFailed(
+                    conn_name=cast_to_str(connection.name),
+                    exc_info=traceback.format_exc(),
+                    node_info=get_node_info(),
+                )
+            )
+            # close the broken handle instead of handing it out again
+            handle = connection.handle
+            connection.transaction_open = False
+            self.close(connection)
+            self.pool.discard(handle)
+            return
+        self.pool.give_back(connection.handle)
+        connection.handle = None
+        connection.state = ConnectionState.CLOSED
+
     def release(self) -> None:
         with self.lock:
             conn = self.get_if_exists()
             if conn is None:
                 return
 
+        if self._is_leased(conn):
+            self._return_to_pool(conn)
+            return
+
         try:
             # always close the connection. close() calls _rollback() if there
             # is an open transaction
@@ -312,11 +454,30 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
                     fire_event(ConnectionLeftOpenInCleanup(conn_name=cast_to_str(connection.name)))
                 else:
                     fire_event(ConnectionClosedInCleanup(conn_name=cast_to_str(connection.name)))
+                if self._is_leased(connection):
+                    assert self.pool is not None
+                    self.pool.discard(connection.handle)
                 self.close(connection)
 
             # garbage collect these connections
             self.thread_connections.clear()
 
+        if self.pool is not None:
+            for handle in self.pool.drain():
+                if hasattr(handle, "close"):
+                    handle.close()
+            stats = self.pool.stats
+            fire_event(
+                Note(
+                    msg=(
+                        f"Connection pool: {stats.leases} leases, {stats.connects} connects "
+                        f"taking {stats.connect_time:.2f}s, waited {stats.acquire_wait:.2f}s "
+                        f"for a connection (at most {stats.max_acquire_wait:.2f}s)"
+                    )
+                ),
+                level=EventLevel.DEBUG,
+            )
+
     @abc.abstractmethod
     def begin(self) -> None:
         """Begin a transaction. (passable)"""
@@ -935,6 +935,22 @@ class BaseAdapter(metaclass=AdapterMeta):
         else:
             return column
 
+    @available
+    def bulk_load_csv_rows(
+        self, relation: BaseRelation, column_names_sql: str, agate_table: agate.Table
+    ) -> Optional[str]:
+        """Load the rows of a seed into the relation using the database's bulk
+        loading interface, and return the statement that was run. Adapters
+        without one return None, and the seed's rows are inserted in batches
+        by load_csv_rows instead. Seeds configured with `bulk_load: false`
+        are always inserted in batches.
+
+        :param relation: The relation to load the rows into.
+        :param column_names_sql: The quoted, comma-separated column names.
+        :param agate_table: The seed's rows.
+        """
+        return None
+
     ###
     # Conversions: These must be implemented by concrete implementations, for
     # converting agate types into their sql equivalents.
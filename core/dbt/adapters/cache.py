@@ -35,11 +35,14 @@ class _CachedRelation:
     :attr str identifier: The identifier of this relation.
     :attr Dict[_ReferenceKey, _CachedRelation] referenced_by: The relations
         that refer to this relation.
+    :attr Set[_ReferenceKey] references: The relations that this relation
+        refers to, the reverse of referenced_by.
     :attr BaseRelation inner: The underlying dbt relation.
     """
 
     def __init__(self, inner) -> None:
         self.referenced_by: Dict[_ReferenceKey, _CachedRelation] = {}
+        self.references: Set[_ReferenceKey] = set()
         self.inner = inner
 
     def __str__(self) -> str:
@@ -68,6 +71,7 @@ class _CachedRelation:
         new = self.__class__(self.inner.incorporate())
         new.__dict__.update(self.__dict__)
         new.referenced_by = deepcopy(self.referenced_by, memo)
+        new.references = deepcopy(self.references, memo)
 
     def is_referenced_by(self, key):
         return key in self.referenced_by
@@ -86,6 +90,7 @@ class _CachedRelation:
         :param _CachedRelation referrer: The node that refers to this node.
         """
         self.referenced_by[referrer.key()] = referrer
+        referrer.references.add(self.key())
 
     def collect_consequences(self):
         """Recursively collect a set of _ReferenceKeys that would
@@ -105,9 +110,8 @@ class _CachedRelation:
 
         :param Iterable[_ReferenceKey] keys: The keys to drop.
         """
-        keys = set(self.referenced_by) & set(keys)
         for key in keys:
-            self.referenced_by.pop(key)
+            self.referenced_by.pop(key, None)
 
     def rename(self, new_relation):
         """Rename this cached relation to new_relation.
@@ -169,6 +173,34 @@ class RelationsCache:
         self.relations: Dict[_ReferenceKey, _CachedRelation] = {}
         self.lock = threading.RLock()
         self.schemas: Set[Tuple[Optional[str], Optional[str]]] = set()
+        # The relations in each (database, schema), so a schema can be listed
+        # without scanning every relation. Each schema has its own lock, so
+        # threads reading different schemas don't wait on each other. Updates
+        # hold the global lock and take the lock of each schema they change.
+        self._relations_by_schema: Dict[
+            Tuple[Optional[str], Optional[str]], Dict[_ReferenceKey, _CachedRelation]
+        ] = {}
+        self._schema_locks: Dict[Tuple[Optional[str], Optional[str]], threading.RLock] = {}
+
+    def _schema_lock(self, schema_key: Tuple[Optional[str], Optional[str]]) -> threading.RLock:
+        lock = self._schema_locks.get(schema_key)
+        if lock is None:
+            with self.lock:
+                lock = self._schema_locks.setdefault(schema_key, threading.RLock())
+        return lock
+
+    def _index(self, relation: _CachedRelation) -> None:
+        key = relation.key()
+        schema_key = (key.database, key.schema)
+        with self._schema_lock(schema_key):
+            self._relations_by_schema.setdefault(schema_key, {})[key] = relation
+
+    def _unindex(self, key: _ReferenceKey) -> None:
+        schema_key = (key.database, key.schema)
+        with self._schema_lock(schema_key):
+            schema_relations = self._relations_by_schema.get(schema_key)
+            if schema_relations is not None:
+                schema_relations.pop(key, None)
 
     def add_schema(
         self,
@@ -240,7 +272,10 @@ class RelationsCache:
         """
         self.add_schema(relation.database, relation.schema)
         key = relation.key()
-        return self.relations.setdefault(key, relation)
+        cached = self.relations.setdefault(key, relation)
+        if cached is relation:
+            self._index(relation)
+        return cached
 
     def _add_link(self, referenced_key, dependent_key):
         """Add a link between two relations to the database. Both the old and
@@ -340,11 +375,17 @@ class RelationsCache:
         :param Iterable[_ReferenceKey] keys: The keys to remove.
         """
         # remove direct refs
+        removed = []
         for key in keys:
-            del self.relations[key]
-        # then remove all entries from each child
-        for cached in self.relations.values():
-            cached.release_references(keys)
+            removed.append(self.relations.pop(key))
+            self._unindex(key)
+        # then remove all entries from each relation they referred to. Every
+        # relation that referred to them was removed with them.
+        for relation in removed:
+            for referenced_key in relation.references:
+                referenced = self.relations.get(referenced_key)
+                if referenced is not None:
+                    referenced.release_references(keys)
 
     def drop(self, relation):
         """Drop the named relation and cascade it appropriately to all
@@ -386,13 +427,19 @@ class RelationsCache:
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
         relation = self.relations.pop(old_key)
+        self._unindex(old_key)
         new_key = new_relation.key()
 
         # relation has to rename its innards, so it needs the _CachedRelation.
         relation.rename(new_relation)
         # update all the relations that refer to it
-        for cached in self.relations.values():
-            if cached.is_referenced_by(old_key):
+        for dependent in relation.referenced_by.values():
+            dependent.references.discard(old_key)
+            dependent.references.add(new_key)
+        # and all the relations it refers to
+        for referenced_key in relation.references:
+            cached = self.relations.get(referenced_key)
+            if cached is not None and cached.is_referenced_by(old_key):
                 fire_event(
                     CacheAction(
                         action="update_reference",
@@ -405,6 +452,7 @@ class RelationsCache:
                 cached.rename_key(old_key, new_key)
 
         self.relations[new_key] = relation
+        self._index(relation)
         # also fixup the schemas!
         self.add_schema(new_key.database, new_key.schema)
 
@@ -478,14 +526,9 @@ class RelationsCache:
         :return List[BaseRelation]: The list of relations with the given
             schema
         """
-        database = lowercase(database)
-        schema = lowercase(schema)
-        with self.lock:
-            results = [
-                r.inner
-                for r in self.relations.values()
-                if (lowercase(r.schema) == schema and lowercase(r.database) == database)
-            ]
+        schema_key = (lowercase(database), lowercase(schema))
+        with self._schema_lock(schema_key):
+            results = [r.inner for r in self._relations_by_schema.get(schema_key, {}).values()]
 
         if None in results:
             raise NoneRelationFoundError()
@@ -496,18 +539,15 @@ class RelationsCache:
         with self.lock:
             self.relations.clear()
             self.schemas.clear()
+            self._relations_by_schema = {}
 
     def _list_relations_in_schema(
         self, database: Optional[str], schema: Optional[str]
     ) -> List[_CachedRelation]:
         """Get the relations in a schema. Callers should hold the lock."""
-        key = (lowercase(database), lowercase(schema))
-
-        to_remove: List[_CachedRelation] = []
-        for cachekey, relation in self.relations.items():
-            if (cachekey.database, cachekey.schema) == key:
-                to_remove.append(relation)
-        return to_remove
+        schema_key = (lowercase(database), lowercase(schema))
+        with self._schema_lock(schema_key):
+            return list(self._relations_by_schema.get(schema_key, {}).values())
 
     def _remove_all(self, to_remove: List[_CachedRelation]):
         """Remove all the listed relations. Ignore relations that have been
@@ -1,6 +1,6 @@
 import abc
 import time
-from typing import List, Optional, Tuple, Any, Iterable, Dict
+from typing import List, Optional, Tuple, Any, Iterable, Dict, Callable
 
 import agate
 
@@ -52,6 +52,23 @@ class SQLConnectionManager(BaseConnectionManager):
         bindings: Optional[Any] = None,
         abridge_sql_log: bool = False,
     ) -> Tuple[Connection, Any]:
+        return self.run_with_cursor(
+            sql,
+            lambda cursor: cursor.execute(sql, bindings),
+            auto_begin=auto_begin,
+            abridge_sql_log=abridge_sql_log,
+        )
+
+    def run_with_cursor(
+        self,
+        sql: str,
+        run: Callable[[Any], Any],
+        auto_begin: bool = True,
+        abridge_sql_log: bool = False,
+    ) -> Tuple[Connection, Any]:
+        """Call run with a new cursor of the thread's connection, logging and
+        timing it as the execution of sql, the way add_query does.
+        """
         connection = self.get_thread_connection()
         if auto_begin and connection.transaction_open is False:
             self.begin()
@@ -77,7 +94,7 @@ class SQLConnectionManager(BaseConnectionManager):
             pre = time.time()
 
             cursor = connection.handle.cursor()
-            cursor.execute(sql, bindings)
+            run(cursor)
 
             fire_event(
                 SQLQueryStatus(
@@ -97,29 +114,30 @@ class SQLConnectionManager(BaseConnectionManager):
             "`get_response` is not implemented for this adapter!"
         )
 
+    @classmethod
+    def _deduplicate_column_names(cls, column_names: List[str]) -> None:
+        unique_col_names: Dict[str, int] = dict()
+        for idx in range(len(column_names)):
+            col_name = column_names[idx]
+            if col_name in unique_col_names:
+                unique_col_names[col_name] += 1
+                column_names[idx] = f"{col_name}_{unique_col_names[col_name]}"
+            else:
+                unique_col_names[column_names[idx]] = 1
+
     @classmethod
     def process_results(
         cls, column_names: Iterable[str], rows: Iterable[Any]
     ) -> List[Dict[str, Any]]:
         # TODO CT-211
-        unique_col_names = dict()  # type: ignore[var-annotated]
-        # TODO CT-211
-        for idx in range(len(column_names)):  # type: ignore[arg-type]
-            # TODO CT-211
-            col_name = column_names[idx]  # type: ignore[index]
-            if col_name in unique_col_names:
-                unique_col_names[col_name] += 1
-                # TODO CT-211
-                column_names[idx] = f"{col_name}_{unique_col_names[col_name]}"  # type: ignore[index] # noqa
-            else:
-                # TODO CT-211
-                unique_col_names[column_names[idx]] = 1  # type: ignore[index]
+        cls._deduplicate_column_names(column_names)  # type: ignore[arg-type]
         return [dict(zip(column_names, row)) for row in rows]
 
     @classmethod
     def get_result_from_cursor(cls, cursor: Any, limit: Optional[int]) -> agate.Table:
         data: List[Any] = []
         column_names: List[str] = []
+        rows: List[Any] = []
 
         if cursor.description is not None:
             column_names = [col[0] for col in cursor.description]
@@ -127,9 +145,15 @@ class SQLConnectionManager(BaseConnectionManager):
                 rows = cursor.fetchmany(limit)
             else:
                 rows = cursor.fetchall()
-            data = cls.process_results(column_names, rows)
-
-        return dbt.clients.agate_helper.table_from_data_flat(data, column_names)
+            process_results = cls.process_results.__func__  # type: ignore[attr-defined]
+            if process_results is not SQLConnectionManager.process_results.__func__:  # type: ignore[attr-defined] # noqa
+                # keep building dictionaries for adapters that process them
+                data = cls.process_results(column_names, rows)
+                return dbt.clients.agate_helper.table_from_data_flat(data, column_names)
+            cls._deduplicate_column_names(column_names)
+
+        # build the table from the rows as they are, without a dict per row
+        return dbt.clients.agate_helper.table_from_rows_flat(rows, column_names)
 
     def execute(
         self, sql: str, auto_begin: bool = False, fetch: bool = False, limit: Optional[int] = None
@@ -122,10 +122,12 @@ class dbtRunner:
 # approach from https://github.com/pallets/click/issues/108#issuecomment-280489786
 def global_flags(func):
     @p.cache_selected_only
+    @p.connection_pool_size
     @p.debug
     @p.deprecated_print
     @p.enable_legacy_logger
     @p.fail_fast
+    @p.jinja_bytecode_cache
     @p.log_cache_events
     @p.log_file_max_bytes
     @p.log_format_file
@@ -136,17 +138,20 @@ def global_flags(func):
     @p.partial_parse
     @p.partial_parse_file_path
     @p.partial_parse_file_diff
+    @p.partial_parse_use_mtimes
     @p.populate_cache
     @p.print
     @p.printer_width
     @p.quiet
     @p.record_timing_info
+    @p.scheduling_policy
     @p.send_anonymous_usage_stats
     @p.single_threaded
     @p.static_parser
     @p.use_colors
     @p.use_colors_file
     @p.use_experimental_parser
+    @p.validate_parsed_nodes
     @p.version
     @p.version_check
     @p.write_json
@@ -270,6 +275,7 @@ def docs(ctx, **kwargs):
 @p.select
 @p.selector
 @p.empty_catalog
+@p.incremental_catalog
 @p.static
 @p.state
 @p.defer_state
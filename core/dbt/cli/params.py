@@ -61,6 +61,14 @@ config_dir = click.option(
     is_flag=True,
 )
 
+connection_pool_size = click.option(
+    "--connection-pool-size",
+    envvar="DBT_CONNECTION_POOL_SIZE",
+    help="Share a pool of at most this many open connections between all threads, instead of opening a connection for each thread.",
+    type=click.INT,
+    default=None,
+)
+
 debug = click.option(
     "--debug/--no-debug",
     "-d/ ",
@@ -141,6 +149,13 @@ indirect_selection = click.option(
     default="eager",
 )
 
+jinja_bytecode_cache = click.option(
+    "--jinja-bytecode-cache/--no-jinja-bytecode-cache",
+    envvar="DBT_JINJA_BYTECODE_CACHE",
+    help="Keep the compiled code of Jinja templates in the target directory, so that later invocations can reuse it instead of compiling the same templates again.",
+    default=False,
+)
+
 lock = click.option(
     "--lock",
     envvar=None,
@@ -294,6 +309,13 @@ partial_parse_file_diff = click.option(
     default=True,
 )
 
+partial_parse_use_mtimes = click.option(
+    "--partial-parse-use-mtimes/--no-partial-parse-use-mtimes",
+    envvar="DBT_PARTIAL_PARSE_USE_MTIMES",
+    help="When partially parsing, skip reading and hashing files whose modification time has not changed since the last parse. Disable this on filesystems where modification times are not reliable.",
+    default=True,
+)
+
 populate_cache = click.option(
     "--populate-cache/--no-populate-cache",
     envvar="DBT_POPULATE_CACHE",
@@ -439,6 +461,14 @@ models = click.option(*model_decls, **select_attrs)  # type: ignore[arg-type]
 raw_select = click.option(*select_decls, **select_attrs)  # type: ignore[arg-type]
 select = click.option(*select_decls, *model_decls, **select_attrs)  # type: ignore[arg-type]
 
+scheduling_policy = click.option(
+    "--scheduling-policy",
+    envvar="DBT_SCHEDULING_POLICY",
+    help="Choose the order in which runnable nodes are started. Depth starts the shallowest nodes in the DAG first. Critical-path uses the execution times in the previous run_results.json (from --state, or the target path) to start the nodes with the longest remaining path first.",
+    type=click.Choice(["depth", "critical-path"], case_sensitive=False),
+    default="depth",
+)
+
 selector = click.option(
     "--selector",
     envvar=None,
@@ -494,6 +524,13 @@ empty_catalog = click.option(
     is_flag=True,
 )
 
+incremental_catalog = click.option(
+    "--incremental-catalog/--no-incremental-catalog",
+    envvar="DBT_INCREMENTAL_CATALOG",
+    help="During `dbt docs generate`, update the catalog.json from --state (or the target path) in place: only relations that are missing from it, have moved, or were modified since it was generated are queried. Falls back to a full catalog when the adapter cannot report when relations were last modified and other invocations have run in the target path since.",
+    default=False,
+)
+
 source = click.option(
     "--source",
     envvar=None,
@@ -605,6 +642,13 @@ use_experimental_parser = click.option(
     help="Enable experimental parsing features.",
 )
 
+validate_parsed_nodes = click.option(
+    "--validate-parsed-nodes/--no-validate-parsed-nodes",
+    envvar="DBT_VALIDATE_PARSED_NODES",
+    help="Validate the nodes built by dbt's parsers against their JSON schema. Configs and yaml properties are validated separately, so disabling this can speed up parsing large projects.",
+    default=True,
+)
+
 vars = click.option(
     "--vars",
     envvar=None,
@@ -7,6 +7,7 @@ from dbt.cli.exceptions import (
     ResultExit,
 )
 from dbt.cli.flags import Flags
+from dbt.clients.jinja import bytecode_cache
 from dbt.config import RuntimeConfig
 from dbt.config.runtime import load_project, load_profile, UnsetProfile
 from dbt.events.base_types import EventLevel
@@ -222,6 +223,9 @@ def runtime_config(func):
 
         ctx.obj["runtime_config"] = config
 
+        if ctx.obj["flags"].JINJA_BYTECODE_CACHE:
+            ctx.with_resource(bytecode_cache(config.project_target_path))
+
         if dbt.tracking.active_user is not None:
             adapter_type = (
                 getattr(config.credentials, "type", None)
@@ -4,6 +4,7 @@ import agate
 import datetime
 import isodate
 import json
+import threading
 import dbt.utils
 from typing import Iterable, List, Dict, Union, Optional, Any
 
@@ -57,7 +58,9 @@ class ISODateTime(agate.data_types.DateTime):
 
 
 def build_type_tester(
-    text_columns: Iterable[str], string_null_values: Optional[Iterable[str]] = ("null", "")
+    text_columns: Iterable[str],
+    string_null_values: Optional[Iterable[str]] = ("null", ""),
+    limit: Optional[int] = None,
 ) -> agate.TypeTester:
 
     types = [
@@ -72,7 +75,7 @@ def build_type_tester(
         agate.data_types.Text(null_values=string_null_values),
     ]
     force = {k: agate.data_types.Text(null_values=string_null_values) for k in text_columns}
-    return agate.TypeTester(force=force, types=types)
+    return agate.TypeTester(force=force, limit=limit, types=types)
 
 
 DEFAULT_TYPE_TESTER = build_type_tester(())
@@ -137,6 +140,87 @@ def table_from_data_flat(data, column_names: Iterable[str]) -> agate.Table:
     )
 
 
+class LazyTable(agate.Table):
+    """An agate table that isn't built until it is used.
+
+    Inferring the column types and casting every value is most of the cost of
+    building a table from a query result, and many results are never used as
+    tables. agate keeps a table's state in underscored attributes, so the
+    first lookup of one of them builds the table in place.
+    """
+
+    def __init__(
+        self, rows: List[Any], column_names: Iterable[str], text_only_columns: Iterable[str]
+    ) -> None:
+        self._lock = threading.Lock()
+        self._pending = (rows, column_names, text_only_columns)
+
+    def _build(self) -> None:
+        if "_pending" not in self.__dict__:
+            return
+        with self.__dict__["_lock"]:
+            # another thread may have built the table while this one waited
+            if "_pending" not in self.__dict__:
+                return
+            rows, column_names, text_only_columns = self.__dict__["_pending"]
+            table = table_from_rows(
+                rows=rows, column_names=column_names, text_only_columns=text_only_columns
+            )
+            self.__dict__.update(table.__dict__)
+            # only drop the pending rows once the table is in place, so a
+            # failed build can be retried
+            del self.__dict__["_pending"]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        self._build()
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self._build()
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def table_from_rows_flat(rows: List[Any], column_names: List[str]) -> agate.Table:
+    """
+    Convert a list of rows, with values in the order of column_names, into an
+    Agate table the same way table_from_data_flat does. The values are
+    checked a column at a time, and the table is only built once it is used.
+    """
+    text_only_columns = set()
+    container_indexes = []
+    for idx, values in enumerate(zip(*rows)):
+        value_types = set(map(type, values))
+        if any(issubclass(t, (dict, list, tuple)) for t in value_types):
+            container_indexes.append(idx)
+            text_only_columns.add(column_names[idx])
+        elif any(issubclass(t, str) for t in value_types):
+            text_only_columns.add(column_names[idx])
+
+    if container_indexes:
+        # Represent container types as json strings
+        converted = []
+        for _row in rows:
+            row = list(_row)
+            for idx in container_indexes:
+                if isinstance(row[idx], (dict, list, tuple)):
+                    row[idx] = json.dumps(row[idx], cls=dbt.utils.JSONEncoder)
+            converted.append(row)
+        rows = converted
+
+    return LazyTable(rows, column_names, text_only_columns)
+
+
 def empty_table():
     "Returns an empty Agate table. To be used in place of None"
 
@@ -149,14 +233,32 @@ def as_matrix(table):
     return [r.values() for r in table.rows.values()]
 
 
-def from_csv(abspath, text_columns, delimiter=","):
-    type_tester = build_type_tester(text_columns=text_columns)
+# The number of rows of a csv file that types are first inferred from
+CSV_TYPE_INFERENCE_SAMPLE_SIZE = 10000
+
+
+def _table_from_csv(abspath, type_tester, delimiter):
     with open(abspath, encoding="utf-8") as fp:
         if fp.read(1) != BOM:
             fp.seek(0)
         return agate.Table.from_csv(fp, column_types=type_tester, delimiter=delimiter)
 
 
+def from_csv(abspath, text_columns, delimiter=","):
+    # Testing every value against every candidate type is most of the cost of
+    # loading a large file, so the types are inferred from a sample of rows.
+    # When all the rows can be cast to those types they are the same types
+    # inference over every row would pick, since each type is only chosen
+    # over the ones after it when it fits all of the values.
+    type_tester = build_type_tester(text_columns, limit=CSV_TYPE_INFERENCE_SAMPLE_SIZE)
+    try:
+        return _table_from_csv(abspath, type_tester, delimiter)
+    except agate.exceptions.CastError:
+        # a row after the sample doesn't fit, so look at all of them
+        type_tester = build_type_tester(text_columns)
+        return _table_from_csv(abspath, type_tester, delimiter)
+
+
 class _NullMarker:
     pass
 
@@ -1,5 +1,7 @@
 import codecs
+import importlib.util
 import linecache
+import marshal
 import os
 import re
 import tempfile
@@ -7,6 +9,7 @@ import threading
 from ast import literal_eval
 from contextlib import contextmanager
 from itertools import chain, islice
+from types import CodeType
 from typing import List, Union, Set, Optional, Dict, Any, Iterator, Type, NoReturn, Tuple, Callable
 
 import jinja2
@@ -22,6 +25,7 @@ from dbt.utils import (
     get_materialization_macro_name,
     get_test_macro_name,
     deep_map_render,
+    md5,
 )
 
 from dbt.clients._jinja_blocks import BlockIterator, BlockData, BlockTag
@@ -42,6 +46,7 @@ from dbt.exceptions import (
 )
 from dbt.flags import get_flags
 from dbt.node_types import ModelLanguage
+from dbt.version import __version__
 
 
 SUPPORTED_LANG_ARG = jinja2.nodes.Name("supported_languages", "param")
@@ -477,17 +482,13 @@ TEXT_FILTERS: Dict[str, Callable[[Any], Any]] = {
 }
 
 
-def get_environment(
-    node=None,
-    capture_macros: bool = False,
-    native: bool = False,
-) -> jinja2.Environment:
+def _create_environment(capture_macros: bool, native: bool) -> jinja2.Environment:
     args: Dict[str, List[Union[str, Type[jinja2.ext.Extension]]]] = {
         "extensions": ["jinja2.ext.do", "jinja2.ext.loopcontrols"]
     }
 
     if capture_macros:
-        args["undefined"] = create_undefined(node)
+        args["undefined"] = create_undefined()
 
     args["extensions"].append(MaterializationExtension)
     args["extensions"].append(DocumentationExtension)
@@ -508,6 +509,114 @@ def get_environment(
     return env
 
 
+# Environments are expensive to set up, so there's one of each flavor per
+# (native, capture_macros), shared by every template that gets rendered.
+_ENVIRONMENTS: Dict[Tuple[bool, bool], jinja2.Environment] = {}
+
+
+def get_environment(
+    node=None,
+    capture_macros: bool = False,
+    native: bool = False,
+) -> jinja2.Environment:
+    key = (native, capture_macros)
+    if key not in _ENVIRONMENTS:
+        _ENVIRONMENTS.setdefault(key, _create_environment(capture_macros, native))
+    env = _ENVIRONMENTS[key]
+
+    if capture_macros and node is not None:
+        # undefined values need to know the node they were found in
+        env = env.overlay(undefined=create_undefined(node))
+    return env
+
+
+class TemplateBytecodeCache:
+    """The compiled code of templates, keyed by a hash of their source, which
+    is kept in a file so that later invocations don't have to compile the same
+    templates again. The file is discarded if it was written by another
+    version of dbt, Jinja or Python.
+
+    The templates used by this invocation are always saved. Entries left over
+    from earlier invocations are only kept while the cache holds fewer than
+    max_entries, so templates that are edited or deleted eventually age out.
+    """
+
+    max_entries = 10000
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.codes: Dict[str, CodeType] = {}
+        # the keys compiled or looked up by this invocation, in order
+        self.used: Dict[str, None] = {}
+        self.dirty = False
+
+    @staticmethod
+    def _header() -> bytes:
+        return importlib.util.MAGIC_NUMBER + f"{__version__}:{jinja2.__version__}\n".encode()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "rb") as fp:
+                if fp.read(len(self._header())) != self._header():
+                    return
+                codes = marshal.load(fp)
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if isinstance(codes, dict):
+            self.codes = codes
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        codes = {key: self.codes[key] for key in self.used}
+        for key, code in self.codes.items():
+            if len(codes) >= self.max_entries:
+                break
+            codes.setdefault(key, code)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as fp:
+            fp.write(self._header())
+            marshal.dump(codes, fp)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def compile(self, env: jinja2.Environment, source: str, native: bool) -> CodeType:
+        key = md5(f"{native}:{source}")
+        self.used[key] = None
+        code = self.codes.get(key)
+        if code is None:
+            code = env.compile(source)
+            self.codes[key] = code
+            self.dirty = True
+        return code
+
+
+_bytecode_cache: Optional[TemplateBytecodeCache] = None
+
+BYTECODE_CACHE_FILE_NAME = "jinja_bytecode.cache"
+
+
+@contextmanager
+def bytecode_cache(target_path: str) -> Iterator[TemplateBytecodeCache]:
+    """Compile templates through a TemplateBytecodeCache stored in the target
+    directory, and save whatever was added to it on the way out.
+    """
+    global _bytecode_cache
+    cache = TemplateBytecodeCache(os.path.join(target_path, BYTECODE_CACHE_FILE_NAME))
+    cache.load()
+    _bytecode_cache = cache
+    try:
+        yield cache
+    finally:
+        _bytecode_cache = None
+        try:
+            cache.save()
+        except OSError:
+            # the cache only saves time, so never fail the invocation over it
+            pass
+
+
 @contextmanager
 def catch_jinja(node=None) -> Iterator[None]:
     try:
@@ -538,7 +647,12 @@ def get_template(
         env = get_environment(node, capture_macros, native=native)
 
         template_source = str(string)
-        return env.from_string(template_source, globals=ctx)
+        cache = _bytecode_cache
+        if cache is None or getattr(get_flags(), "MACRO_DEBUGGING", False):
+            return env.from_string(template_source, globals=ctx)
+
+        code = cache.compile(env, template_source, native)
+        return env.template_class.from_code(env, code, env.make_globals(ctx), None)
 
 
 def render_template(template, ctx: Dict[str, Any], node=None) -> str:
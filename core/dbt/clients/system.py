@@ -11,7 +11,19 @@ import subprocess
 import sys
 import tarfile
 from pathlib import Path
-from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import dbt.exceptions
 import requests
@@ -27,6 +39,12 @@ from dbt.exceptions import DbtInternalError
 from dbt.utils import _connection_exception_retry as connection_exception_retry
 from pathspec import PathSpec  # type: ignore
 
+# orjson is much faster than the json module, but it's optional
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 if sys.platform == "win32":
     from ctypes import WinDLL, c_bool
 else:
@@ -34,6 +52,73 @@ else:
     c_bool = None
 
 
+def _can_skip_ignored_directories(ignore_spec: Optional[PathSpec]) -> bool:
+    # A negated pattern (e.g. '!models/keep.sql') can re-include a file that
+    # lives in an ignored directory, so directories can only be skipped
+    # wholesale when there are none.
+    if ignore_spec is None:
+        return False
+    return all(pattern.include is not False for pattern in ignore_spec.patterns)
+
+
+def find_files(
+    root_path: str,
+    relative_path_to_search: str,
+    ignore_spec: Optional[PathSpec] = None,
+) -> List[str]:
+    """
+    Given an absolute `root_path` and a path relative to it, return the paths,
+    relative to `relative_path_to_search`, of all of the files found under it.
+    Files are returned in the same order as os.walk would find them, and
+    directories matched by `ignore_spec` aren't descended into. Nothing is
+    stat'ed beyond what os.scandir already provides.
+    """
+    absolute_path_to_search = os.path.join(os.path.normpath(root_path), relative_path_to_search)
+    skip_ignored_directories = _can_skip_ignored_directories(ignore_spec)
+    if (
+        skip_ignored_directories
+        and relative_path_to_search
+        and ignore_spec.match_file(os.path.join(relative_path_to_search, ""))  # type: ignore
+    ):
+        return []
+
+    found: List[str] = []
+    # a stack of (absolute directory path, directory path relative to the search path)
+    to_walk: List[Tuple[str, str]] = [(absolute_path_to_search, "")]
+    while to_walk:
+        current_path, relative_dir = to_walk.pop()
+        try:
+            with os.scandir(current_path) as entries:
+                entry_list = list(entries)
+        except OSError:
+            # os.walk silently skips directories it can't list
+            continue
+
+        subdirectories = []
+        for entry in entry_list:
+            relative_path = os.path.join(relative_dir, entry.name)
+            try:
+                # like os.walk, this follows symlinks to decide what's a directory...
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                found.append(relative_path)
+                continue
+            # ...but doesn't walk into symlinked directories
+            if entry.is_symlink():
+                continue
+            if skip_ignored_directories and ignore_spec.match_file(  # type: ignore
+                os.path.join(relative_path_to_search, relative_path, "")
+            ):
+                continue
+            subdirectories.append((entry.path, relative_path))
+        # walk the subdirectories in order, depth first
+        to_walk.extend(reversed(subdirectories))
+
+    return found
+
+
 def find_matching(
     root_path: str,
     relative_paths_to_search: List[str],
@@ -60,34 +145,21 @@ def find_matching(
     reobj = re.compile(regex, re.IGNORECASE)
 
     for relative_path_to_search in relative_paths_to_search:
-        # potential speedup for ignore_spec
-        # if ignore_spec.matches(relative_path_to_search):
-        #     continue
         absolute_path_to_search = os.path.join(root_path, relative_path_to_search)
-        walk_results = os.walk(absolute_path_to_search)
-
-        for current_path, subdirectories, local_files in walk_results:
-            # potential speedup for ignore_spec
-            # relative_dir = os.path.relpath(current_path, root_path) + os.sep
-            # if ignore_spec.match(relative_dir):
-            #     continue
-            for local_file in local_files:
-                absolute_path = os.path.join(current_path, local_file)
-                relative_path = os.path.relpath(absolute_path, absolute_path_to_search)
-                relative_path_to_root = os.path.join(relative_path_to_search, relative_path)
-
-                modification_time = os.path.getmtime(absolute_path)
-                if reobj.match(local_file) and (
-                    not ignore_spec or not ignore_spec.match_file(relative_path_to_root)
-                ):
-                    matching.append(
-                        {
-                            "searched_path": relative_path_to_search,
-                            "absolute_path": absolute_path,
-                            "relative_path": relative_path,
-                            "modification_time": modification_time,
-                        }
-                    )
+        for relative_path in find_files(root_path, relative_path_to_search, ignore_spec):
+            relative_path_to_root = os.path.join(relative_path_to_search, relative_path)
+            if reobj.match(os.path.basename(relative_path)) and (
+                not ignore_spec or not ignore_spec.match_file(relative_path_to_root)
+            ):
+                absolute_path = os.path.join(absolute_path_to_search, relative_path)
+                matching.append(
+                    {
+                        "searched_path": relative_path_to_search,
+                        "absolute_path": absolute_path,
+                        "relative_path": relative_path,
+                        "modification_time": os.path.getmtime(absolute_path),
+                    }
+                )
 
     return matching
 
@@ -162,6 +234,29 @@ def supports_symlinks() -> bool:
     return getattr(os, "symlink", None) is not None
 
 
+def _can_ignore_write_error(path: str, exc: Exception) -> bool:
+    # note that you can't just catch FileNotFound, because sometimes
+    # windows apparently raises something else.
+    # It's also not sufficient to look at the path length, because
+    # sometimes windows fails to write paths that are less than the length
+    # limit. So on windows, suppress all errors that happen from writing
+    # to disk.
+    if os.name != "nt":
+        return False
+    # sometimes we get a winerror of 3 which means the path was
+    # definitely too long, but other times we don't and it means the
+    # path was just probably too long. This is probably based on the
+    # windows/python version.
+    if getattr(exc, "winerror", 0) == 3:
+        reason = "Path was too long"
+    else:
+        reason = "Path was possibly too long"
+    # all our hard work and the path was still too long. Log and
+    # continue.
+    fire_event(SystemCouldNotWrite(path=path, reason=reason, exc=str(exc)))
+    return True
+
+
 def write_file(path: str, contents: str = "") -> bool:
     path = convert_path(path)
     try:
@@ -169,25 +264,7 @@ def write_file(path: str, contents: str = "") -> bool:
         with open(path, "w", encoding="utf-8") as f:
             f.write(str(contents))
     except Exception as exc:
-        # note that you can't just catch FileNotFound, because sometimes
-        # windows apparently raises something else.
-        # It's also not sufficient to look at the path length, because
-        # sometimes windows fails to write paths that are less than the length
-        # limit. So on windows, suppress all errors that happen from writing
-        # to disk.
-        if os.name == "nt":
-            # sometimes we get a winerror of 3 which means the path was
-            # definitely too long, but other times we don't and it means the
-            # path was just probably too long. This is probably based on the
-            # windows/python version.
-            if getattr(exc, "winerror", 0) == 3:
-                reason = "Path was too long"
-            else:
-                reason = "Path was possibly too long"
-            # all our hard work and the path was still too long. Log and
-            # continue.
-            fire_event(SystemCouldNotWrite(path=path, reason=reason, exc=str(exc)))
-        else:
+        if not _can_ignore_write_error(path, exc):
             raise
     return True
 
@@ -200,6 +277,89 @@ def write_json(path: str, data: Dict[str, Any]) -> bool:
     return write_file(path, json.dumps(data, cls=dbt.utils.JSONEncoder))
 
 
+class StreamedObject:
+    """The members of a JSON object, which write_json_stream encodes and writes
+    one at a time rather than all at once. The values can be streamed too.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, Any]]) -> None:
+        self.items = items
+
+
+class StreamedArray:
+    """Like StreamedObject, for the elements of a JSON array."""
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self.items = items
+
+
+class _JSONStreamWriter:
+    def __init__(self, fh: BinaryIO) -> None:
+        self.fh = fh
+        self.encoder = dbt.utils.JSONEncoder()
+        # match the separators of whichever encoder is used for the values
+        self.item_separator: bytes = b", " if orjson is None else b","
+        self.key_separator: bytes = b": " if orjson is None else b":"
+
+    def encode(self, value: Any) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    value, default=self.encoder.default, option=orjson.OPT_NON_STR_KEYS
+                )
+            except orjson.JSONEncodeError:
+                # e.g. an integer too big for orjson; let the json module try
+                pass
+        return self.encoder.encode(value).encode("utf-8")
+
+    def write(self, value: Any) -> None:
+        if isinstance(value, StreamedObject):
+            self.fh.write(b"{")
+            for index, (key, item) in enumerate(value.items):
+                if index:
+                    self.fh.write(self.item_separator)
+                self.fh.write(self.encode(key))
+                self.fh.write(self.key_separator)
+                self.write(item)
+            self.fh.write(b"}")
+        elif isinstance(value, StreamedArray):
+            self.fh.write(b"[")
+            for index, item in enumerate(value.items):
+                if index:
+                    self.fh.write(self.item_separator)
+                self.write(item)
+            self.fh.write(b"]")
+        else:
+            self.fh.write(self.encode(value))
+
+
+def write_json_stream(path: str, data: Any) -> bool:
+    """Write data to path as JSON, encoding any StreamedObject or StreamedArray
+    one member at a time, so that the whole document never has to be held in
+    memory. orjson is used to encode the values if it's installed.
+
+    The document is written to a temporary file that only replaces path once
+    it's complete, so a failure part way through leaves any previous file at
+    path intact.
+    """
+    path = convert_path(path)
+    tmp_path = f"{path}.tmp"
+    try:
+        make_directory(os.path.dirname(path))
+        try:
+            with open(tmp_path, "wb") as fh:
+                _JSONStreamWriter(fh).write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    except Exception as exc:
+        if not _can_ignore_write_error(path, exc):
+            raise
+    return True
+
+
 def _windows_rmdir_readonly(func: Callable[[str], Any], path: str, exc: Tuple[Any, OSError, Any]):
     exception_val = exc[1]
     if exception_val.errno == errno.EACCES:
@@ -6,7 +6,7 @@ import os
 import pickle
 
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Iterator, Tuple, Optional, Set
 
 from dbt.flags import get_flags
 from dbt.adapters.factory import get_adapter
@@ -124,6 +124,17 @@ def _get_tests_for_node(manifest: Manifest, unique_id: UniqueID) -> List[UniqueI
     return tests
 
 
+def _iter_bit_positions(bitset: int) -> Iterator[int]:
+    """Yield the positions of the bits that are set in the given bitset, in
+    ascending order"""
+    # bin() is much cheaper than shifting a large int one bit at a time
+    binary = bin(bitset)[:1:-1]
+    position = binary.find("1")
+    while position != -1:
+        yield position
+        position = binary.find("1", position + 1)
+
+
 class Linker:
     def __init__(self, data=None) -> None:
         if data is None:
@@ -219,37 +230,83 @@ class Linker:
         #  \/       |  test2 ----|  |
         # test1 ----|---------------|
 
+        # A node gets an edge from every test attached to one of its upstream
+        # nodes, as long as all of that test's dependencies are upstream of
+        # it too. Rather than walking the upstream graph of every node, the
+        # upstream nodes that tests are attached to or depend on are each
+        # given a bit, and the ancestor bitset of every node is propagated
+        # once, in topological order. That makes the cost proportional to the
+        # number of edges in the graph plus the number of candidate test edges.
+        bits: Dict[UniqueID, int] = {}
+        # tests attached to the node with a given bit position, from the child_map
+        tests_by_position: List[List[UniqueID]] = []
+        # bitsets of the nodes each test depends on
+        test_depends_on: Dict[UniqueID, int] = {}
+
+        def get_position(unique_id: UniqueID) -> int:
+            if unique_id not in bits:
+                bits[unique_id] = 1 << len(tests_by_position)
+                tests_by_position.append([])
+            return bits[unique_id].bit_length() - 1
+
         for node_id in self.graph:
+            tests = _get_tests_for_node(manifest, node_id)
+            if not tests:
+                continue
+            tests_by_position[get_position(node_id)].extend(tests)
+            for test_id in tests:
+                if test_id in test_depends_on:
+                    continue
+                depends_on = 0
+                for dependency in manifest.nodes[test_id].depends_on_nodes:
+                    if dependency in self.graph:
+                        depends_on |= 1 << get_position(dependency)
+                    else:
+                        # this test can never be upstream of anything
+                        depends_on = -1
+                        break
+                test_depends_on[test_id] = depends_on
+
+        # bitsets of the nodes with tests attached
+        tested_nodes = 0
+        for position, tests in enumerate(tests_by_position):
+            if tests:
+                tested_nodes |= 1 << position
+
+        # bitsets of all (indexed) upstream nodes of each node, not including itself
+        upstream: Dict[UniqueID, int] = {}
+        new_edges: List[Tuple[UniqueID, UniqueID]] = []
+        for node_id in nx.topological_sort(self.graph):
+            upstream_nodes = 0
+            for parent_id in self.graph.predecessors(node_id):
+                upstream_nodes |= upstream[parent_id] | bits.get(parent_id, 0)
+            upstream[node_id] = upstream_nodes
+
             # If node is executable (in manifest.nodes) and does _not_
             # represent a test, continue.
-            if (
+            if not (
                 node_id in manifest.nodes
                 and manifest.nodes[node_id].resource_type != NodeType.Test
             ):
-                # Get *everything* upstream of the node
-                all_upstream_nodes = nx.traversal.bfs_tree(self.graph, node_id, reverse=True)
-                # Get the set of upstream nodes not including the current node.
-                upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
-
-                # Get all tests that depend on any upstream nodes.
-                upstream_tests = []
-                for upstream_node in upstream_nodes:
-                    upstream_tests += _get_tests_for_node(manifest, upstream_node)
-
-                for upstream_test in upstream_tests:
-                    # Get the set of all nodes that the test depends on
-                    # including the upstream_node itself. This is necessary
-                    # because tests can depend on multiple nodes (ex:
-                    # relationship tests). Test nodes do not distinguish
-                    # between what node the test is "testing" and what
-                    # node(s) it depends on.
-                    test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
-
+                continue
+
+            upstream_tests: Set[UniqueID] = set()
+            for position in _iter_bit_positions(upstream_nodes & tested_nodes):
+                for upstream_test in tests_by_position[position]:
+                    if upstream_test in upstream_tests:
+                        continue
+                    upstream_tests.add(upstream_test)
+                    # Tests can depend on multiple nodes (ex: relationship
+                    # tests). Test nodes do not distinguish between what node
+                    # the test is "testing" and what node(s) it depends on.
                     # If the set of nodes that an upstream test depends on
                     # is a subset of all upstream nodes of the current node,
                     # add an edge from the upstream test to the current node.
-                    if test_depends_on.issubset(upstream_nodes):
-                        self.graph.add_edge(upstream_test, node_id, edge_type="parent_test")
+                    depends_on = test_depends_on[upstream_test]
+                    if depends_on != -1 and depends_on & upstream_nodes == depends_on:
+                        new_edges.append((upstream_test, node_id))
+
+        self.graph.add_edges_from(new_edges, edge_type="parent_test")
 
     def get_graph(self, manifest: Manifest) -> Graph:
         self.link_graph(manifest)
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import List, Iterator, Dict, Any, TypeVar, Generic, Optional
+from typing import List, Iterator, Dict, Any, TypeVar, Generic, Optional, Tuple
 
 from dbt.config import RuntimeConfig, Project, IsFQNResource
 from dbt.contracts.graph.model_config import BaseConfig, get_config_for, _listify
@@ -85,6 +85,21 @@ class RenderedConfig(ConfigSource):
         return model_configs
 
 
+# The project-level configs that ContextConfigGenerator resolved for each
+# (project, resource type, base, fqn prefix), for the active project they were
+# resolved for. A new active project starts a new cache.
+_project_config_cache: Tuple[Optional[RuntimeConfig], Dict[Tuple, BaseConfig]] = (None, {})
+
+
+def _get_project_config_cache(active_project: RuntimeConfig) -> Dict[Tuple, BaseConfig]:
+    global _project_config_cache
+    owner, cache = _project_config_cache
+    if owner is not active_project:
+        cache = {}
+        _project_config_cache = (active_project, cache)
+    return cache
+
+
 class BaseContextConfigGenerator(Generic[T]):
     def __init__(self, active_project: RuntimeConfig):
         self._active_project = active_project
@@ -103,20 +118,23 @@ class BaseContextConfigGenerator(Generic[T]):
             )
         return dependencies[project_name]
 
+    @staticmethod
+    def _level_config(level_config: Dict[str, Any]) -> Dict[str, Any]:
+        result = {}
+        for key, value in level_config.items():
+            if key.startswith("+"):
+                result[key[1:].strip()] = deepcopy(value)
+            elif not isinstance(value, dict):
+                result[key] = deepcopy(value)
+        return result
+
     def _project_configs(
         self, project: Project, fqn: List[str], resource_type: NodeType
     ) -> Iterator[Dict[str, Any]]:
         src = self.get_config_source(project)
         model_configs = src.get_config_dict(resource_type)
         for level_config in fqn_search(model_configs, fqn):
-            result = {}
-            for key, value in level_config.items():
-                if key.startswith("+"):
-                    result[key[1:].strip()] = deepcopy(value)
-                elif not isinstance(value, dict):
-                    result[key] = deepcopy(value)
-
-            yield result
+            yield self._level_config(level_config)
 
     def _active_project_configs(
         self, fqn: List[str], resource_type: NodeType
@@ -131,6 +149,17 @@ class BaseContextConfigGenerator(Generic[T]):
     def initial_result(self, resource_type: NodeType, base: bool) -> T:
         ...
 
+    def _calculate_project_config(
+        self, project: Project, fqn: List[str], resource_type: NodeType, base: bool
+    ) -> T:
+        """The config that the node's own project gives it, before patches and
+        config calls are applied.
+        """
+        result = self.initial_result(resource_type=resource_type, base=base)
+        for fqn_config in self._project_configs(project, fqn, resource_type):
+            result = self._update_from_config(result, fqn_config)
+        return result
+
     def calculate_node_config(
         self,
         config_call_dict: Dict[str, Any],
@@ -142,11 +171,7 @@ class BaseContextConfigGenerator(Generic[T]):
     ) -> BaseConfig:
         own_config = self.get_node_project(project_name)
 
-        result = self.initial_result(resource_type=resource_type, base=base)
-
-        project_configs = self._project_configs(own_config, fqn, resource_type)
-        for fqn_config in project_configs:
-            result = self._update_from_config(result, fqn_config)
+        result = self._calculate_project_config(own_config, fqn, resource_type, base)
 
         # When schema files patch config, it has lower precedence than
         # config in the models (config_call_dict), so we add the patch_config_dict
@@ -186,6 +211,29 @@ class ContextConfigGenerator(BaseContextConfigGenerator[C]):
     def get_config_source(self, project: Project) -> ConfigSource:
         return RenderedConfig(project)
 
+    def _calculate_project_config(
+        self, project: Project, fqn: List[str], resource_type: NodeType, base: bool
+    ) -> C:
+        # Nodes in the same directory share all but the last level of their
+        # fqn, so remember the config after each level and only merge in the
+        # levels that haven't been seen yet. The cached configs are never
+        # modified: updating a config returns a new one.
+        cache = _get_project_config_cache(self._active_project)
+        model_configs = self.get_config_source(project).get_config_dict(resource_type)
+        result: Optional[C] = None
+        for depth, level_config in enumerate(fqn_search(model_configs, fqn)):
+            key = (project.project_name, resource_type, base, tuple(fqn[:depth]))
+            cached = cache.get(key)
+            if cached is None:
+                if result is None:
+                    result = self.initial_result(resource_type=resource_type, base=base)
+                result = self._update_from_config(result, self._level_config(level_config))
+                cache[key] = result
+            else:
+                result = cached  # type: ignore[assignment]
+        assert result is not None  # fqn_search always yields the root level
+        return result
+
     def initial_result(self, resource_type: NodeType, base: bool) -> C:
         # defaults, own_config, config calls, active_config (if != own_config)
         config_cls = get_config_for(resource_type, base=base)
@@ -6,9 +6,128 @@ from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 from dbt.exceptions import DuplicateMacroNameError, PackageNotFoundForMacroError
 
 
-FlatNamespace = Dict[str, MacroGenerator]
+FlatNamespace = Mapping[str, MacroGenerator]
 NamespaceMember = Union[FlatNamespace, MacroGenerator]
-FullNamespace = Dict[str, NamespaceMember]
+FullNamespace = Mapping[str, NamespaceMember]
+MacroMap = Dict[str, Macro]
+
+
+# The MacroNamespaceIndex partitions a set of macros by package once, so
+# that it can be shared by every context that is built against the same
+# manifest. It holds Macro objects, not MacroGenerators: a MacroGenerator
+# needs the context and node it will be called from, so binding happens
+# per context, in the MacroNamespace, and only for macros that are looked up.
+# Once built, an index must not be modified.
+class MacroNamespaceIndex:
+    def __init__(
+        self,
+        root_package: str,
+        internal_packages: List[str],
+    ) -> None:
+        self.root_package = root_package
+        # internal packages comes from get_adapter_package_names
+        self.internal_package_names = set(internal_packages)
+        self.internal_package_names_order = internal_packages
+        # [package name][macro name] = Macro
+        self.internal_packages: Dict[str, MacroMap] = {}
+        self.packages: Dict[str, MacroMap] = {}
+        # the internal packages flattened in search order
+        self.global_project_namespace: MacroMap = {}
+
+    def _add_macro_to(self, hierarchy: Dict[str, MacroMap], macro: Macro):
+        if macro.package_name in hierarchy:
+            namespace = hierarchy[macro.package_name]
+        else:
+            namespace = {}
+            hierarchy[macro.package_name] = namespace
+
+        if macro.name in namespace:
+            raise DuplicateMacroNameError(namespace[macro.name], macro, macro.package_name)
+        namespace[macro.name] = macro
+
+    def add_macro(self, macro: Macro):
+        # internal macros (from plugins) will be processed separately from
+        # project macros, so store them in a different place
+        if macro.package_name in self.internal_package_names:
+            self._add_macro_to(self.internal_packages, macro)
+        else:
+            self._add_macro_to(self.packages, macro)
+
+    def add_macros(self, macros: Iterable[Macro]):
+        for macro in macros:
+            self.add_macro(macro)
+        self._build_global_project_namespace()
+
+    def _build_global_project_namespace(self):
+        # Iterate in reverse-order and overwrite: the packages that are first
+        # in the list are the ones we want to "win".
+        global_project_namespace: MacroMap = {}
+        for pkg in reversed(self.internal_package_names_order):
+            if pkg in self.internal_packages:
+                # add the macros pointed to by this package name
+                global_project_namespace.update(self.internal_packages[pkg])
+        self.global_project_namespace = global_project_namespace
+
+    def is_valid_for(self, root_package: str, internal_packages: List[str]) -> bool:
+        return (
+            self.root_package == root_package
+            and self.internal_package_names_order == internal_packages
+        )
+
+    @classmethod
+    def from_macros(
+        cls,
+        macros: Iterable[Macro],
+        root_package: str,
+        internal_packages: List[str],
+    ) -> "MacroNamespaceIndex":
+        index = cls(root_package, internal_packages)
+        index.add_macros(macros)
+        return index
+
+
+def get_macro_namespace_index(
+    manifest: Any,
+    root_package: str,
+    internal_packages: List[str],
+) -> MacroNamespaceIndex:
+    """Return the MacroNamespaceIndex for the macros in this manifest,
+    building and caching it on the manifest if it doesn't exist yet or is
+    out of date. Manifest.reset_macro_lookups resets the cached index.
+    """
+    index = getattr(manifest, "_macro_namespace_index", None)
+    if isinstance(index, MacroNamespaceIndex) and index.is_valid_for(
+        root_package, internal_packages
+    ):
+        return index
+    index = MacroNamespaceIndex.from_macros(
+        manifest.macros.values(), root_package, internal_packages
+    )
+    # Concurrent builders may race here, but the result is equivalent and
+    # an index is never modified after it has been built.
+    manifest._macro_namespace_index = index
+    return index
+
+
+# A read-only view of a {macro name: Macro} dictionary that returns
+# MacroGenerators bound to the owning MacroNamespace's context. This is
+# what is returned for package names, e.g. 'dbt_utils' in 'dbt_utils.star()'.
+class BoundMacroMap(Mapping):
+    def __init__(self, macros: MacroMap, namespace: "MacroNamespace") -> None:
+        self._macros = macros
+        self._namespace = namespace
+
+    def __getitem__(self, key: str) -> MacroGenerator:
+        return self._namespace.bind(self._macros[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._macros
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._macros)
+
+    def __len__(self) -> int:
+        return len(self._macros)
 
 
 # The point of this class is to collect the various macros
@@ -19,18 +138,70 @@ FullNamespace = Dict[str, NamespaceMember]
 # depends on the package of the node, so it only works for one
 # particular local package at a time for "flattening" into a context.
 # 'get_by_package' should work for any macro.
+# Macros are bound to MacroGenerators on first access and the generators
+# are reused for the lifetime of the namespace.
 class MacroNamespace(Mapping):
     def __init__(
         self,
-        global_namespace: FlatNamespace,  # root package macros
-        local_namespace: FlatNamespace,  # packages for *this* node
-        global_project_namespace: FlatNamespace,  # internal packages
-        packages: Dict[str, FlatNamespace],  # non-internal packages
+        global_namespace: MacroMap,  # root package macros
+        local_namespace: MacroMap,  # packages for *this* node
+        global_project_namespace: MacroMap,  # internal packages
+        packages: Dict[str, MacroMap],  # non-internal packages
+        ctx: Dict[str, Any],
+        node: Optional[Any] = None,
+        thread_ctx: Optional[MacroStack] = None,
     ):
-        self.global_namespace: FlatNamespace = global_namespace
-        self.local_namespace: FlatNamespace = local_namespace
-        self.packages: Dict[str, FlatNamespace] = packages
-        self.global_project_namespace: FlatNamespace = global_project_namespace
+        self.ctx = ctx
+        self.node = node
+        self.thread_ctx = thread_ctx
+        self._bound: Dict[str, MacroGenerator] = {}
+        self.global_namespace: FlatNamespace = BoundMacroMap(global_namespace, self)
+        self.local_namespace: FlatNamespace = BoundMacroMap(local_namespace, self)
+        self.packages: Dict[str, FlatNamespace] = {
+            package_name: BoundMacroMap(macros, self) for package_name, macros in packages.items()
+        }
+        self.global_project_namespace: FlatNamespace = BoundMacroMap(
+            global_project_namespace, self
+        )
+
+    @classmethod
+    def from_index(
+        cls,
+        index: MacroNamespaceIndex,
+        search_package: str,
+        ctx: Dict[str, Any],
+        node: Optional[Any] = None,
+        thread_ctx: Optional[MacroStack] = None,
+    ) -> "MacroNamespace":
+        local_namespace: MacroMap = {}
+        global_namespace: MacroMap = {}
+        # the package this node is in, if it isn't an internal package
+        if search_package not in index.internal_package_names:
+            local_namespace = index.packages.get(search_package, {})
+        # the root package, unless it's already the local package. Root
+        # macros override internal ones even when searching from an
+        # internal package, e.g. for run-operation with project="dbt"
+        if search_package != index.root_package:
+            global_namespace = index.packages.get(index.root_package, {})
+        return cls(
+            global_namespace=global_namespace,
+            local_namespace=local_namespace,
+            global_project_namespace=index.global_project_namespace,
+            packages=index.packages,
+            ctx=ctx,
+            node=node,
+            thread_ctx=thread_ctx,
+        )
+
+    def bind(self, macro: Macro) -> MacroGenerator:
+        # MacroGenerator is in clients/jinja.py
+        # a MacroGenerator object is a callable object that will
+        # execute the MacroGenerator.__call__ function
+        macro_func = self._bound.get(macro.unique_id)
+        if macro_func is None:
+            macro_func = MacroGenerator(macro, self.ctx, self.node, self.thread_ctx)
+            self._bound[macro.unique_id] = macro_func
+        return macro_func
 
     def _search_order(self) -> Iterable[Union[FullNamespace, FlatNamespace]]:
         yield self.local_namespace  # local package
@@ -78,9 +249,9 @@ class MacroNamespace(Mapping):
             raise PackageNotFoundForMacroError(package_name)
 
 
-# This class builds the MacroNamespace by adding macros to
-# internal_packages or packages, and locals/globals.
-# Call 'build_namespace' to return a MacroNamespace.
+# This class builds the MacroNamespace for one node, either from a
+# shared MacroNamespaceIndex (see 'build_namespace_from_index') or from
+# an arbitrary collection of macros (see 'build_namespace').
 # This is used by ManifestContext (and subclasses)
 class MacroNamespaceBuilder:
     def __init__(
@@ -94,77 +265,32 @@ class MacroNamespaceBuilder:
         self.root_package = root_package
         self.search_package = search_package
         # internal packages comes from get_adapter_package_names
-        self.internal_package_names = set(internal_packages)
-        self.internal_package_names_order = internal_packages
-        # macro_func is added here if in root package, since
-        # the root package acts as a "global" namespace, overriding
-        # everything else except local external package macro calls
-        self.globals: FlatNamespace = {}
-        # macro_func is added here if it's the package for this node
-        self.locals: FlatNamespace = {}
-        # Create a dictionary of [package name][macro name] =
-        #     MacroGenerator object which acts like a function
-        self.internal_packages: Dict[str, FlatNamespace] = {}
-        self.packages: Dict[str, FlatNamespace] = {}
+        self.internal_packages = internal_packages
         self.thread_ctx = thread_ctx
         self.node = node
-
-    def _add_macro_to(
-        self,
-        hierarchy: Dict[str, FlatNamespace],
-        macro: Macro,
-        macro_func: MacroGenerator,
-    ):
-        if macro.package_name in hierarchy:
-            namespace = hierarchy[macro.package_name]
-        else:
-            namespace = {}
-            hierarchy[macro.package_name] = namespace
-
-        if macro.name in namespace:
-            raise DuplicateMacroNameError(macro_func.macro, macro, macro.package_name)
-        hierarchy[macro.package_name][macro.name] = macro_func
+        self.index = MacroNamespaceIndex(root_package, internal_packages)
 
     def add_macro(self, macro: Macro, ctx: Dict[str, Any]):
-        macro_name: str = macro.name
-
-        # MacroGenerator is in clients/jinja.py
-        # a MacroGenerator object is a callable object that will
-        # execute the MacroGenerator.__call__ function
-        macro_func: MacroGenerator = MacroGenerator(macro, ctx, self.node, self.thread_ctx)
-
-        # internal macros (from plugins) will be processed separately from
-        # project macros, so store them in a different place
-        if macro.package_name in self.internal_package_names:
-            self._add_macro_to(self.internal_packages, macro, macro_func)
-        else:
-            # if it's not an internal package
-            self._add_macro_to(self.packages, macro, macro_func)
-            # add to locals if it's the package this node is in
-            if macro.package_name == self.search_package:
-                self.locals[macro_name] = macro_func
-            # add to globals if it's in the root package
-            elif macro.package_name == self.root_package:
-                self.globals[macro_name] = macro_func
+        self.index.add_macro(macro)
 
     def add_macros(self, macros: Iterable[Macro], ctx: Dict[str, Any]):
-        for macro in macros:
-            self.add_macro(macro, ctx)
+        self.index.add_macros(macros)
 
     def build_namespace(self, macros: Iterable[Macro], ctx: Dict[str, Any]) -> MacroNamespace:
         self.add_macros(macros, ctx)
+        return self.build_namespace_from_index(self.index, ctx)
 
-        # Iterate in reverse-order and overwrite: the packages that are first
-        # in the list are the ones we want to "win".
-        global_project_namespace: FlatNamespace = {}
-        for pkg in reversed(self.internal_package_names_order):
-            if pkg in self.internal_packages:
-                # add the macros pointed to by this package name
-                global_project_namespace.update(self.internal_packages[pkg])
+    def build_namespace_for_manifest(self, manifest: Any, ctx: Dict[str, Any]) -> MacroNamespace:
+        index = get_macro_namespace_index(manifest, self.root_package, self.internal_packages)
+        return self.build_namespace_from_index(index, ctx)
 
-        return MacroNamespace(
-            global_namespace=self.globals,  # root package macros
-            local_namespace=self.locals,  # packages for *this* node
-            global_project_namespace=global_project_namespace,  # internal packages
-            packages=self.packages,  # non internal_packages
+    def build_namespace_from_index(
+        self, index: MacroNamespaceIndex, ctx: Dict[str, Any]
+    ) -> MacroNamespace:
+        return MacroNamespace.from_index(
+            index,
+            self.search_package,
+            ctx,
+            self.node,
+            self.thread_ctx,
         )
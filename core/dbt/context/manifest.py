@@ -37,10 +37,11 @@ class ManifestContext(ConfiguredContext):
         self.namespace = self._build_namespace()
 
     def _build_namespace(self):
-        # this takes all the macros in the manifest and adds them
-        # to the MacroNamespaceBuilder stored in self.namespace
+        # this binds the macros in the manifest's shared MacroNamespaceIndex
+        # to this context. Macros are only turned into MacroGenerators when
+        # they are looked up in the namespace.
         builder = self._get_namespace_builder()
-        return builder.build_namespace(self.manifest.macros.values(), self._ctx)
+        return builder.build_namespace_for_manifest(self.manifest, self._ctx)
 
     def _get_namespace_builder(self) -> MacroNamespaceBuilder:
         # avoid an import loop
@@ -1,5 +1,9 @@
+import abc
+import bisect
+import copy
 import enum
 from collections import defaultdict
+from collections.abc import ItemsView, ValuesView
 from dataclasses import dataclass, field
 from itertools import chain, islice
 from mashumaro.mixins.msgpack import DataClassMessagePackMixin
@@ -531,6 +535,102 @@ def build_node_edges(nodes: List[ManifestNode]):
     return _sort_values(forward_edges), _sort_values(backward_edges)
 
 
+# Keeps the parent and child maps of a Manifest up to date between calls to
+# build_parent_and_child_maps. Only the members that were added, replaced,
+# removed or marked as changed since the last call have their edges
+# recalculated, and the result is the same as build_node_edges.
+class NodeEdgeIndex:
+    def __init__(self) -> None:
+        self.parent_map: Dict[str, List[str]] = {}
+        self.child_map: Dict[str, List[str]] = {}
+        # The member objects the edges were last calculated from
+        self.members: Dict[str, Any] = {}
+        # Children of unique_ids that aren't members, like disabled or missing
+        # nodes. They're moved into child_map if the member shows up.
+        self.orphaned_children: Dict[str, List[str]] = {}
+
+    def _link(self, unique_id: str, member: Any) -> None:
+        parents = sorted(member.depends_on_nodes)
+        self.parent_map[unique_id] = parents
+        for parent_id in parents:
+            if parent_id in self.child_map:
+                bisect.insort(self.child_map[parent_id], unique_id)
+            else:
+                self.orphaned_children.setdefault(parent_id, []).append(unique_id)
+
+    def _unlink(self, unique_id: str) -> None:
+        for parent_id in self.parent_map.pop(unique_id, []):
+            if parent_id in self.child_map:
+                self.child_map[parent_id].remove(unique_id)
+            else:
+                orphans = self.orphaned_children[parent_id]
+                orphans.remove(unique_id)
+                if not orphans:
+                    del self.orphaned_children[parent_id]
+
+    def rebuild(self, members: Dict[str, Any]) -> None:
+        self.members = members
+        self.child_map = {unique_id: [] for unique_id in members}
+        self.parent_map = {}
+        self.orphaned_children = {}
+        for unique_id, member in members.items():
+            parents = member.depends_on_nodes[:]
+            self.parent_map[unique_id] = parents
+            for parent_id in parents:
+                if parent_id in self.child_map:
+                    self.child_map[parent_id].append(unique_id)
+                else:
+                    self.orphaned_children.setdefault(parent_id, []).append(unique_id)
+        for edges in chain(self.parent_map.values(), self.child_map.values()):
+            edges.sort()
+
+    def update(self, members: Dict[str, Any], changed_ids: AbstractSet[str]) -> None:
+        removed = [unique_id for unique_id in self.members if unique_id not in members]
+        changed = [
+            unique_id
+            for unique_id, member in members.items()
+            if unique_id in changed_ids or self.members.get(unique_id) is not member
+        ]
+        # Past a point it's cheaper to start over
+        if len(removed) + len(changed) > len(members) // 2:
+            self.rebuild(members)
+            return
+
+        for unique_id in chain(removed, changed):
+            self._unlink(unique_id)
+        for unique_id in removed:
+            del self.members[unique_id]
+            # the children still list this unique_id as a parent
+            children = self.child_map.pop(unique_id)
+            if children:
+                self.orphaned_children[unique_id] = children
+        for unique_id in changed:
+            if unique_id not in self.child_map:
+                self.child_map[unique_id] = sorted(self.orphaned_children.pop(unique_id, []))
+        for unique_id in changed:
+            self.members[unique_id] = members[unique_id]
+            self._link(unique_id, members[unique_id])
+
+    def check(self, members: Dict[str, Any]) -> None:
+        """Raise if the maps differ from a full rebuild. Only used when
+        debugging, since this does all of the work the index avoids.
+        """
+        forward_edges, backward_edges = build_node_edges(list(members.values()))
+        for name, actual, expected in (
+            ("parent_map", self.parent_map, backward_edges),
+            ("child_map", self.child_map, forward_edges),
+        ):
+            if actual != expected:
+                mismatched = sorted(
+                    unique_id
+                    for unique_id in set(actual) | set(expected)
+                    if actual.get(unique_id) != expected.get(unique_id)
+                )
+                raise dbt.exceptions.DbtInternalError(
+                    f"Incrementally maintained {name} is inconsistent for: {mismatched[:10]}"
+                )
+
+
 # Build a map of children of macros and generic tests
 def build_macro_edges(nodes: List[Any]):
     forward_edges: Dict[str, List[str]] = {
@@ -543,6 +643,79 @@ def build_macro_edges(nodes: List[Any]):
     return _sort_values(forward_edges)
 
 
+# A dict whose values are converted by `_load` the first time they're looked
+# up. The result replaces the value in the dictionary, so each value is only
+# converted once.
+class _LazyDict(dict, abc.ABC):
+    @abc.abstractmethod
+    def _load(self, value):
+        raise NotImplementedError("_load not implemented")
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        loaded = self._load(value)
+        if loaded is not value:
+            super().__setitem__(key, loaded)
+        return loaded
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    # Overriding __iter__ makes dict(), {**...} and json go through
+    # keys() and __getitem__ instead of copying the stored values
+    def __iter__(self):
+        return super().__iter__()
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def copy(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, _LazyDict):
+            other = other.copy()
+        return self.copy() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+
+# The values in the 'graph' context variable. Each resource is only
+# serialized the first time it's looked up, instead of serializing the whole
+# manifest up front for a variable that most projects never use. The
+# resources are shallow-copied when the dict is built, so attributes set on
+# them afterwards (e.g. compiled_code while compiling) don't show up in the
+# graph, which is still a snapshot of the manifest as it was at build time.
+class LazyResourceDict(_LazyDict):
+    def __init__(self, resources: Mapping[str, Any]) -> None:
+        super().__init__({key: copy.copy(value) for key, value in resources.items()})
+
+    def _load(self, value):
+        if isinstance(value, dict):
+            return value
+        return value.to_dict(omit_none=False)
+
+
+# The resources of a manifest.json that was read back in, e.g. for --state.
+# Each resource is only deserialized the first time it's looked up, so
+# comparing a few selected nodes doesn't deserialize the whole manifest.
+class LazyArtifactResourceDict(_LazyDict):
+    def __init__(self, data: Dict[str, Any], from_dict: Callable[[Dict[str, Any]], Any]) -> None:
+        super().__init__(data)
+        self._from_dict = from_dict
+
+    def _load(self, value):
+        if isinstance(value, dict):
+            return self._from_dict(value)
+        return value
+
+
 def _deepcopy(value):
     return value.from_dict(value.to_dict(omit_none=True))
 
@@ -632,6 +805,33 @@ def _get_locality(macro: Macro, root_project_name: str, internal_packages: Set[s
         return Locality.Imported
 
 
+# Macros by name, with their locality for one root project and set of
+# internal packages, so that finding the candidates for a name doesn't scan
+# every macro in the manifest.
+class MacroNameLookup:
+    def __init__(
+        self,
+        macros: Mapping[str, Macro],
+        root_project_name: str,
+        adapter_type: Optional[str],
+        internal_packages: Set[str],
+    ) -> None:
+        self.root_project_name = root_project_name
+        self.adapter_type = adapter_type
+        self.storage: Dict[str, List[Tuple[Locality, Macro]]] = {}
+        for macro in macros.values():
+            locality = _get_locality(macro, root_project_name, internal_packages)
+            self.storage.setdefault(macro.name, []).append((locality, macro))
+
+    def is_valid_for(self, root_project_name: str, adapter_type: Optional[str]) -> bool:
+        # Changes to the macros themselves reset the lookup, see
+        # Manifest.reset_macro_lookups
+        return self.root_project_name == root_project_name and self.adapter_type == adapter_type
+
+    def get(self, name: str) -> List[Tuple[Locality, Macro]]:
+        return self.storage.get(name, [])
+
+
 class Searchable(Protocol):
     resource_type: NodeType
     package_name: str
@@ -679,6 +879,7 @@ class MacroMethods:
     def __init__(self):
         self.macros = []
         self.metadata = {}
+        self._macro_name_lookup: Optional[MacroNameLookup] = None
 
     def find_macro_by_name(
         self, name: str, root_project_name: str, package: Optional[str]
@@ -736,6 +937,18 @@ class MacroMethods:
 
         return candidates.last()
 
+    def _get_macro_name_lookup(self, root_project_name: str) -> MacroNameLookup:
+        # avoid an import cycle
+        from dbt.adapters.factory import get_adapter_package_names
+
+        adapter_type = self.metadata.adapter_type
+        lookup = self._macro_name_lookup
+        if lookup is None or not lookup.is_valid_for(root_project_name, adapter_type):
+            packages = set(get_adapter_package_names(adapter_type))
+            lookup = MacroNameLookup(self.macros, root_project_name, adapter_type, packages)
+            self._macro_name_lookup = lookup
+        return lookup
+
     def _find_macros_by_name(
         self,
         name: str,
@@ -743,18 +956,9 @@ class MacroMethods:
         filter: Optional[Callable[[MacroCandidate], bool]] = None,
     ) -> CandidateList:
         """Find macros by their name."""
-        # avoid an import cycle
-        from dbt.adapters.factory import get_adapter_package_names
-
         candidates: CandidateList = CandidateList()
-        packages = set(get_adapter_package_names(self.metadata.adapter_type))
-        for unique_id, macro in self.macros.items():
-            if macro.name != name:
-                continue
-            candidate = MacroCandidate(
-                locality=_get_locality(macro, root_project_name, packages),
-                macro=macro,
-            )
+        for locality, macro in self._get_macro_name_lookup(root_project_name).get(name):
+            candidate = MacroCandidate(locality=locality, macro=macro)
             if filter is None or filter(candidate):
                 candidates.append(candidate)
 
@@ -833,6 +1037,23 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         default_factory=MP_CONTEXT.Lock,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    # A dbt.context.macros.MacroNamespaceIndex, shared by the contexts built
+    # against this manifest
+    _macro_namespace_index: Optional[Any] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
+    _macro_name_lookup: Optional[MacroNameLookup] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
+    _edge_index: Optional[NodeEdgeIndex] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
+    # unique_ids of the nodes, sources, etc. whose depends_on may have been
+    # changed in place since the parent and child maps were last built, which
+    # build_parent_and_child_maps can't otherwise see
+    _edge_changes: Optional[Set[str]] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
 
     def __pre_serialize__(self):
         # serialization won't work with anything except an empty source_patches because
@@ -852,17 +1073,13 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         manifest!
         """
         self.flat_graph = {
-            "exposures": {k: v.to_dict(omit_none=False) for k, v in self.exposures.items()},
-            "groups": {k: v.to_dict(omit_none=False) for k, v in self.groups.items()},
-            "metrics": {k: v.to_dict(omit_none=False) for k, v in self.metrics.items()},
-            "nodes": {k: v.to_dict(omit_none=False) for k, v in self.nodes.items()},
-            "sources": {k: v.to_dict(omit_none=False) for k, v in self.sources.items()},
-            "semantic_models": {
-                k: v.to_dict(omit_none=False) for k, v in self.semantic_models.items()
-            },
-            "saved_queries": {
-                k: v.to_dict(omit_none=False) for k, v in self.saved_queries.items()
-            },
+            "exposures": LazyResourceDict(self.exposures),
+            "groups": LazyResourceDict(self.groups),
+            "metrics": LazyResourceDict(self.metrics),
+            "nodes": LazyResourceDict(self.nodes),
+            "sources": LazyResourceDict(self.sources),
+            "semantic_models": LazyResourceDict(self.semantic_models),
+            "saved_queries": LazyResourceDict(self.saved_queries),
         }
 
     def build_disabled_by_file_id(self):
@@ -965,20 +1182,36 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         copy.build_flat_graph()
         return copy
 
+    def mark_edges_changed(self, unique_id: str) -> None:
+        """Record that the depends_on of the given member may have changed in
+        place, so its edges are recalculated by the next call to
+        build_parent_and_child_maps.
+        """
+        if self._edge_changes is None:
+            self._edge_changes = set()
+        self._edge_changes.add(unique_id)
+
     def build_parent_and_child_maps(self):
-        edge_members = list(
+        edge_members = dict(
             chain(
-                self.nodes.values(),
-                self.sources.values(),
-                self.exposures.values(),
-                self.metrics.values(),
-                self.semantic_models.values(),
-                self.saved_queries.values(),
+                self.nodes.items(),
+                self.sources.items(),
+                self.exposures.items(),
+                self.metrics.items(),
+                self.semantic_models.items(),
+                self.saved_queries.items(),
             )
         )
-        forward_edges, backward_edges = build_node_edges(edge_members)
-        self.child_map = forward_edges
-        self.parent_map = backward_edges
+        if self._edge_index is None:
+            self._edge_index = NodeEdgeIndex()
+            self._edge_index.rebuild(edge_members)
+        else:
+            self._edge_index.update(edge_members, self._edge_changes or set())
+            if getattr(get_flags(), "DEBUG", False):
+                self._edge_index.check(edge_members)
+        self._edge_changes = set()
+        self.child_map = self._edge_index.child_map
+        self.parent_map = self._edge_index.parent_map
 
     def build_macro_child_map(self):
         edge_members = list(
@@ -1405,6 +1638,19 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
 
         self.macros[macro.unique_id] = macro
         source_file.macros.append(macro.unique_id)
+        self.reset_macro_lookups()
+
+    def remove_macro(self, unique_id: str) -> Macro:
+        macro = self.macros.pop(unique_id)
+        self.reset_macro_lookups()
+        return macro
+
+    def reset_macro_lookups(self) -> None:
+        """Drop the lookups built from the macros. This must be called
+        whenever a macro is added, removed, replaced or patched.
+        """
+        self._macro_namespace_index = None
+        self._macro_name_lookup = None
 
     def has_file(self, source_file: SourceFile) -> bool:
         key = source_file.file_id
@@ -1419,12 +1665,14 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         # sources can't be overwritten!
         _check_duplicates(source, self.sources)
         self.sources[source.unique_id] = source  # type: ignore
+        self.mark_edges_changed(source.unique_id)
         source_file.sources.append(source.unique_id)
 
     def add_node_nofile(self, node: ManifestNode):
         # nodes can't be overwritten!
         _check_duplicates(node, self.nodes)
         self.nodes[node.unique_id] = node
+        self.mark_edges_changed(node.unique_id)
 
     def add_node(self, source_file: AnySourceFile, node: ManifestNode, test_from=None):
         self.add_node_nofile(node)
@@ -1444,11 +1692,13 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     def add_exposure(self, source_file: SchemaSourceFile, exposure: Exposure):
         _check_duplicates(exposure, self.exposures)
         self.exposures[exposure.unique_id] = exposure
+        self.mark_edges_changed(exposure.unique_id)
         source_file.exposures.append(exposure.unique_id)
 
     def add_metric(self, source_file: SchemaSourceFile, metric: Metric, generated: bool = False):
         _check_duplicates(metric, self.metrics)
         self.metrics[metric.unique_id] = metric
+        self.mark_edges_changed(metric.unique_id)
         if not generated:
             source_file.metrics.append(metric.unique_id)
         else:
@@ -1491,11 +1741,13 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     def add_semantic_model(self, source_file: SchemaSourceFile, semantic_model: SemanticModel):
         _check_duplicates(semantic_model, self.semantic_models)
         self.semantic_models[semantic_model.unique_id] = semantic_model
+        self.mark_edges_changed(semantic_model.unique_id)
         source_file.semantic_models.append(semantic_model.unique_id)
 
     def add_saved_query(self, source_file: SchemaSourceFile, saved_query: SavedQuery) -> None:
         _check_duplicates(saved_query, self.saved_queries)
         self.saved_queries[saved_query.unique_id] = saved_query
+        self.mark_edges_changed(saved_query.unique_id)
         source_file.saved_queries.append(saved_query.unique_id)
 
     # end of methods formerly in ParseResult
@@ -1541,6 +1793,8 @@ class MacroManifest(MacroMethods):
     def __init__(self, macros) -> None:
         self.macros = macros
         self.metadata = ManifestMetadata()
+        self._macro_namespace_index: Optional[Any] = None
+        self._macro_name_lookup = None
         # This is returned by the 'graph' context property
         # in the ProviderContext class.
         self.flat_graph: Dict[str, Any] = {}
@@ -1549,6 +1803,17 @@ class MacroManifest(MacroMethods):
 AnyManifest = Union[Manifest, MacroManifest]
 
 
+@dataclass
+class _ManifestNodeField(dbtClassMixin):
+    node: ManifestNode
+
+
+def _deserialize_manifest_node(data: Dict[str, Any]) -> ManifestNode:
+    # mashumaro picks the class from the ManifestNode union for fields, so
+    # wrap the node in one to deserialize it the way WritableManifest would
+    return _ManifestNodeField.from_dict({"node": data}).node
+
+
 @dataclass
 @schema_version("manifest", 11)
 class WritableManifest(ArtifactMixin):
@@ -1627,14 +1892,57 @@ class WritableManifest(ArtifactMixin):
         manifest_schema_version = get_artifact_schema_version(data)
         if manifest_schema_version <= 10:
             data = upgrade_manifest_json(data, manifest_schema_version)
-        return cls.from_dict(data)
+        return cls.from_dict_lazily(data)
+
+    @classmethod
+    def from_dict_lazily(cls, data: Dict[str, Any]) -> "WritableManifest":
+        """Like from_dict, but the nodes, sources, macros, exposures and metrics
+        are only deserialized when they're looked up.
+        """
+        lazy_fields: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "nodes": _deserialize_manifest_node,
+            "sources": SourceDefinition.from_dict,
+            "macros": Macro.from_dict,
+            "exposures": Exposure.from_dict,
+            "metrics": Metric.from_dict,
+        }
+        manifest = cls.from_dict({**data, **{name: {} for name in lazy_fields}})
+        for name, from_dict in lazy_fields.items():
+            setattr(manifest, name, LazyArtifactResourceDict(data.get(name) or {}, from_dict))
+        return manifest
+
+    _streamed_fields = (
+        "nodes",
+        "sources",
+        "macros",
+        "docs",
+        "exposures",
+        "metrics",
+        "groups",
+        "disabled",
+        "parent_map",
+        "child_map",
+        "saved_queries",
+        "semantic_models",
+    )
+
+    @staticmethod
+    def _remove_internal_node_fields(node: Dict[str, Any]) -> Dict[str, Any]:
+        if "config_call_dict" in node:
+            del node["config_call_dict"]
+        if "defer_relation" in node:
+            del node["defer_relation"]
+        return node
 
     def __post_serialize__(self, dct):
         for unique_id, node in dct["nodes"].items():
-            if "config_call_dict" in node:
-                del node["config_call_dict"]
-            if "defer_relation" in node:
-                del node["defer_relation"]
+            self._remove_internal_node_fields(node)
+        return dct
+
+    def _serialize_member(self, field_name: str, member: Any) -> Any:
+        dct = super()._serialize_member(field_name, member)
+        if field_name == "nodes":
+            self._remove_internal_node_fields(dct)
         return dct
 
 
@@ -36,8 +36,6 @@ from typing import (
     Tuple,
 )
 
-from dbt.clients.system import write_json
-
 
 @dataclass
 class TimingInfo(dbtClassMixin):
@@ -254,6 +252,8 @@ class RunResultsArtifact(ExecutionResult, ArtifactMixin):
     results: Sequence[RunResultOutput]
     args: Dict[str, Any] = field(default_factory=dict)
 
+    _streamed_fields = ("results",)
+
     @classmethod
     def from_execution_results(
         cls,
@@ -292,9 +292,6 @@ class RunResultsArtifact(ExecutionResult, ArtifactMixin):
                 result["relation_name"] = ""
         return cls.from_dict(data)
 
-    def write(self, path: str):
-        write_json(path, self.to_dict(omit_none=False))
-
 
 # due to issues with typing.Union collapsing subclasses, this can't subclass
 # PartialResult
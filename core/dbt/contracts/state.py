@@ -1,60 +1,79 @@
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Type, TypeVar
 
 from dbt.contracts.graph.manifest import WritableManifest
 from dbt.contracts.results import FreshnessExecutionResultArtifact
 from dbt.contracts.results import RunResultsArtifact
+from dbt.contracts.util import ArtifactMixin
 from dbt.events.functions import fire_event
 from dbt.events.types import WarnStateTargetEqual
 from dbt.exceptions import IncompatibleSchemaError
 
 
+T = TypeVar("T", bound=ArtifactMixin)
+
+
 class PreviousState:
+    """The artifacts of a previous invocation. Each artifact is only read the
+    first time it's used, so e.g. selecting on `result:error` never reads the
+    previous manifest.
+    """
+
     def __init__(self, state_path: Path, target_path: Path, project_root: Path) -> None:
         self.state_path: Path = state_path
         self.target_path: Path = target_path
         self.project_root: Path = project_root
-        self.manifest: Optional[WritableManifest] = None
-        self.results: Optional[RunResultsArtifact] = None
-        self.sources: Optional[FreshnessExecutionResultArtifact] = None
-        self.sources_current: Optional[FreshnessExecutionResultArtifact] = None
+        # the artifacts that have been read (or set) so far, by attribute name
+        self._artifacts: Dict[str, Any] = {}
 
         if self.state_path == self.target_path:
             fire_event(WarnStateTargetEqual(state_path=str(self.state_path)))
 
-        # Note: if state_path is absolute, project_root will be ignored.
-        manifest_path = self.project_root / self.state_path / "manifest.json"
-        if manifest_path.exists() and manifest_path.is_file():
-            try:
-                self.manifest = WritableManifest.read_and_check_versions(str(manifest_path))
-            except IncompatibleSchemaError as exc:
-                exc.add_filename(str(manifest_path))
-                raise
-
-        results_path = self.project_root / self.state_path / "run_results.json"
-        if results_path.exists() and results_path.is_file():
-            try:
-                self.results = RunResultsArtifact.read_and_check_versions(str(results_path))
-            except IncompatibleSchemaError as exc:
-                exc.add_filename(str(results_path))
-                raise
-
-        sources_path = self.project_root / self.state_path / "sources.json"
-        if sources_path.exists() and sources_path.is_file():
-            try:
-                self.sources = FreshnessExecutionResultArtifact.read_and_check_versions(
-                    str(sources_path)
-                )
-            except IncompatibleSchemaError as exc:
-                exc.add_filename(str(sources_path))
-                raise
-
-        sources_current_path = self.project_root / self.target_path / "sources.json"
-        if sources_current_path.exists() and sources_current_path.is_file():
-            try:
-                self.sources_current = FreshnessExecutionResultArtifact.read_and_check_versions(
-                    str(sources_current_path)
-                )
-            except IncompatibleSchemaError as exc:
-                exc.add_filename(str(sources_current_path))
-                raise
+    def _read_artifact(self, name: str, cls: Type[T], path: Path) -> Optional[T]:
+        if name not in self._artifacts:
+            artifact: Optional[T] = None
+            if path.exists() and path.is_file():
+                try:
+                    artifact = cls.read_and_check_versions(str(path))
+                except IncompatibleSchemaError as exc:
+                    exc.add_filename(str(path))
+                    raise
+            self._artifacts[name] = artifact
+        return self._artifacts[name]
+
+    # Note: if state_path is absolute, project_root will be ignored.
+    @property
+    def manifest(self) -> Optional[WritableManifest]:
+        path = self.project_root / self.state_path / "manifest.json"
+        return self._read_artifact("manifest", WritableManifest, path)
+
+    @manifest.setter
+    def manifest(self, value: Optional[WritableManifest]) -> None:
+        self._artifacts["manifest"] = value
+
+    @property
+    def results(self) -> Optional[RunResultsArtifact]:
+        path = self.project_root / self.state_path / "run_results.json"
+        return self._read_artifact("results", RunResultsArtifact, path)
+
+    @results.setter
+    def results(self, value: Optional[RunResultsArtifact]) -> None:
+        self._artifacts["results"] = value
+
+    @property
+    def sources(self) -> Optional[FreshnessExecutionResultArtifact]:
+        path = self.project_root / self.state_path / "sources.json"
+        return self._read_artifact("sources", FreshnessExecutionResultArtifact, path)
+
+    @sources.setter
+    def sources(self, value: Optional[FreshnessExecutionResultArtifact]) -> None:
+        self._artifacts["sources"] = value
+
+    @property
+    def sources_current(self) -> Optional[FreshnessExecutionResultArtifact]:
+        path = self.project_root / self.target_path / "sources.json"
+        return self._read_artifact("sources_current", FreshnessExecutionResultArtifact, path)
+
+    @sources_current.setter
+    def sources_current(self, value: Optional[FreshnessExecutionResultArtifact]) -> None:
+        self._artifacts["sources_current"] = value
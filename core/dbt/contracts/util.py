@@ -1,8 +1,13 @@
 import dataclasses
 from datetime import datetime
-from typing import List, Tuple, ClassVar, Type, TypeVar, Dict, Any, Optional
+from typing import List, Tuple, ClassVar, Type, TypeVar, Dict, Any, Optional, Mapping
 
-from dbt.clients.system import write_json, read_json
+from dbt.clients.system import (
+    read_json,
+    write_json_stream,
+    StreamedArray,
+    StreamedObject,
+)
 from dbt.exceptions import (
     DbtInternalError,
     DbtRuntimeError,
@@ -62,8 +67,45 @@ class Mergeable(Replaceable):
 
 
 class Writable:
+    # Fields holding mappings or lists of nodes, results and the like. These
+    # are serialized and written one member at a time, so the whole artifact is
+    # never held in memory as a dict.
+    _streamed_fields: ClassVar[Tuple[str, ...]] = ()
+
     def write(self, path: str):
-        write_json(path, self.to_dict(omit_none=False))  # type: ignore
+        if not self._streamed_fields:
+            write_json_stream(path, self.to_dict(omit_none=False))  # type: ignore
+            return
+
+        streamed = {
+            name: getattr(self, name)
+            for name in self._streamed_fields
+            if getattr(self, name) is not None
+        }
+        # serialize everything else as usual, leaving the streamed fields empty
+        placeholders: Dict[str, Any] = {
+            name: {} if isinstance(value, Mapping) else [] for name, value in streamed.items()
+        }
+        dct = dataclasses.replace(self, **placeholders).to_dict(omit_none=False)  # type: ignore
+
+        def value(key: str) -> Any:
+            if key not in streamed:
+                return dct[key]
+            elif isinstance(streamed[key], Mapping):
+                return StreamedObject(
+                    (k, self._serialize_member(key, v)) for k, v in streamed[key].items()
+                )
+            else:
+                return StreamedArray(self._serialize_member(key, v) for v in streamed[key])
+
+        write_json_stream(path, StreamedObject((key, value(key)) for key in dct))
+
+    def _serialize_member(self, field_name: str, member: Any) -> Any:
+        if isinstance(member, dbtClassMixin):
+            return member.to_dict(omit_none=False)
+        elif isinstance(member, list):
+            return [self._serialize_member(field_name, item) for item in member]
+        return member
 
 
 class AdditionalPropertiesMixin:
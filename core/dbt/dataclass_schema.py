@@ -80,10 +80,16 @@ class dbtClassMixin(DataClassDictMixin):
         json_schema = json_schema_obj.to_dict()
         return json_schema
 
+    # Validators are cached per class, like the schemas, so that references
+    # in the schema are only resolved once instead of on every call.
+    @classmethod
+    @functools.lru_cache
+    def _validator(cls) -> jsonschema.Draft7Validator:
+        return jsonschema.Draft7Validator(cls.json_schema())
+
     @classmethod
     def validate(cls, data):
-        json_schema = cls.json_schema()
-        validator = jsonschema.Draft7Validator(json_schema)
+        validator = cls._validator()
         error = next(iter(validator.iter_errors(data)), None)
         if error is not None:
             raise ValidationError.create_from(error) from error
@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum
 import os
 import threading
@@ -5,7 +6,6 @@ from dbt.events import types_pb2
 import sys
 from google.protobuf.json_format import ParseDict, MessageToDict, MessageToJson
 from google.protobuf.message import Message
-from dbt.events.helpers import get_json_string_utcnow
 from typing import Optional
 
 if sys.version_info >= (3, 8):
@@ -138,18 +138,19 @@ def msg_from_base_event(event: BaseEvent, level: Optional[EventLevel] = None):
     # level in EventInfo must be a string, not an EventLevel
     msg_level: str = level.value if level else event.level_tag().value
     assert msg_level is not None
-    event_info = {
-        "level": msg_level,
-        "msg": event.message(),
-        "invocation_id": get_invocation_id(),
-        "extra": get_global_metadata_vars(),
-        "ts": get_json_string_utcnow(),
-        "pid": get_pid(),
-        "thread": get_thread_name(),
-        "code": event.code(),
-        "name": type(event).__name__,
-    }
-    new_event = ParseDict({"info": event_info}, msg_cls())
+    # Set the EventInfo fields directly rather than going through ParseDict,
+    # which would convert the timestamp to a string and back again.
+    new_event = msg_cls()
+    event_info = new_event.info
+    event_info.level = msg_level
+    event_info.msg = event.message()
+    event_info.invocation_id = get_invocation_id()
+    event_info.extra.update(get_global_metadata_vars())
+    event_info.ts.FromDatetime(datetime.utcnow())
+    event_info.pid = get_pid()
+    event_info.thread = get_thread_name()
+    event_info.code = event.code()
+    event_info.name = type(event).__name__
     new_event.data.CopyFrom(event.pb_msg)
     return new_event
 
@@ -14,9 +14,19 @@ class EventManager:
         self.invocation_id: str = str(uuid4())
 
     def fire_event(self, e: BaseEvent, level: Optional[EventLevel] = None) -> None:
+        test_binary_serialization = os.environ.get("DBT_TEST_BINARY_SERIALIZATION")
+        msg_level: EventLevel = level if level else e.level_tag()
+        loggers = [
+            logger for logger in self.loggers if logger.is_enabled_for(msg_level, type(e).__name__)
+        ]
+        # Building the message renders the event text and copies it into a
+        # new protobuf, so skip it when nothing is going to consume it.
+        if not loggers and not self.callbacks and not test_binary_serialization:
+            return
+
         msg = msg_from_base_event(e, level=level)
 
-        if os.environ.get("DBT_TEST_BINARY_SERIALIZATION"):
+        if test_binary_serialization:
             print(f"--- {msg.info.name}")
             try:
                 msg.SerializeToString()
@@ -25,7 +35,7 @@ class EventManager:
                     f"{msg.info.name} is not serializable to binary. Originating exception: {exc}, {traceback.format_exc()}"
                 )
 
-        for logger in self.loggers:
+        for logger in loggers:
             if logger.filter(msg):  # type: ignore
                 logger.write_line(msg)
 
@@ -1,12 +1,11 @@
 from dbt.constants import METADATA_ENV_PREFIX
 from dbt.events.base_types import BaseEvent, EventLevel, EventMsg
 from dbt.events.eventmgr import EventManager, IEventManager
-from dbt.events.logger import LoggerConfig, NoFilter, LineFormat
+from dbt.events.logger import LoggerConfig, LineFormat
 from dbt.exceptions import scrub_secrets, env_secrets
 from dbt.events.types import Note
 from dbt.flags import get_flags, ENABLE_LEGACY_LOGGER
 from dbt.logger import GLOBAL_LOGGER, make_log_dir_if_missing
-from functools import partial
 import json
 import os
 import sys
@@ -26,6 +25,13 @@ metadata_vars: Optional[Dict[str, str]] = None
 # the type class from the msg and then get the information from the class.
 nofile_codes = ["Z012", "Z013", "Z014", "Z015"]
 
+# These events are only logged when --log-cache-events is set.
+cache_event_names = ["CacheAction", "CacheDumpGraph"]
+
+
+def _get_ignored_event_names(log_cache_events: bool) -> List[str]:
+    return [] if log_cache_events else cache_event_names
+
 
 def setup_event_logger(flags, callbacks: List[Callable[[EventMsg], None]] = []) -> None:
     cleanup_event_logger()
@@ -101,24 +107,12 @@ def _get_stdout_config(
         use_colors=use_colors,
         line_format=line_format,
         scrubber=env_scrubber,
-        filter=partial(
-            _stdout_filter,
-            log_cache_events,
-            line_format,
-        ),
+        ignored_event_names=_get_ignored_event_names(log_cache_events),
         invocation_id=EVENT_MANAGER.invocation_id,
         output_stream=sys.stdout,
     )
 
 
-def _stdout_filter(
-    log_cache_events: bool,
-    line_format: LineFormat,
-    msg: EventMsg,
-) -> bool:
-    return msg.info.name not in ["CacheAction", "CacheDumpGraph"] or log_cache_events
-
-
 def _get_logfile_config(
     log_path: str,
     use_colors: bool,
@@ -133,17 +127,16 @@ def _get_logfile_config(
         use_colors=use_colors,
         level=level,  # File log is *always* debug level
         scrubber=env_scrubber,
-        filter=partial(_logfile_filter, bool(get_flags().LOG_CACHE_EVENTS), line_format),
+        filter=_logfile_filter,
+        ignored_event_names=_get_ignored_event_names(bool(get_flags().LOG_CACHE_EVENTS)),
         invocation_id=EVENT_MANAGER.invocation_id,
         output_file_name=log_path,
         output_file_max_bytes=log_file_max_bytes,
     )
 
 
-def _logfile_filter(log_cache_events: bool, line_format: LineFormat, msg: EventMsg) -> bool:
-    return msg.info.code not in nofile_codes and not (
-        msg.info.name in ["CacheAction", "CacheDumpGraph"] and not log_cache_events
-    )
+def _logfile_filter(msg: EventMsg) -> bool:
+    return msg.info.code not in nofile_codes
 
 
 def _get_logbook_log_config(
@@ -156,11 +149,6 @@ def _get_logbook_log_config(
         log_cache_events,
     )
     config.name = "logbook_log"
-    config.filter = (
-        NoFilter
-        if log_cache_events
-        else lambda e: e.info.name not in ["CacheAction", "CacheDumpGraph"]
-    )
     config.logger = GLOBAL_LOGGER
     config.output_stream = None
     return config
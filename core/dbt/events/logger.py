@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from logging.handlers import RotatingFileHandler
-from typing import Optional, TextIO, Any, Callable
+from typing import Optional, TextIO, Any, Callable, Collection
 
 from colorama import Style
 
@@ -81,6 +81,9 @@ class LoggerConfig:
     output_file_name: Optional[str] = None
     output_file_max_bytes: Optional[int] = 10 * 1024 * 1024  # 10 mb
     logger: Optional[Any] = None
+    # Names of events this logger never writes. Unlike the filter, these
+    # are checked before the event message is built.
+    ignored_event_names: Collection[str] = ()
 
 
 class _Logger:
@@ -90,7 +93,11 @@ class _Logger:
         self.scrubber: Scrubber = config.scrubber
         self.level: EventLevel = config.level
         self.invocation_id: Optional[str] = config.invocation_id
+        self.ignored_event_names: Collection[str] = frozenset(config.ignored_event_names)
         self._python_logger: Optional[logging.Logger] = config.logger
+        # A logger passed in through the config (i.e. logbook) does its own
+        # level filtering, so we only know the level of the ones we create.
+        self._level_is_known: bool = False
 
         if config.output_stream is not None:
             stream_handler = logging.StreamHandler(config.output_stream)
@@ -112,8 +119,20 @@ class _Logger:
         log.handlers.clear()
         log.propagate = False
         log.addHandler(handler)
+        self._level_is_known = True
         return log
 
+    def is_enabled_for(self, level: EventLevel, event_name: str) -> bool:
+        """Cheaply check whether this logger could write an event of the given
+        level and name, without building the event message. The logger's
+        filter still has the final say.
+        """
+        if self._python_logger is None or event_name in self.ignored_event_names:
+            return False
+        if self._level_is_known:
+            return _log_level_map[level] >= _log_level_map[self.level]
+        return True
+
     def create_line(self, msg: EventMsg) -> str:
         raise NotImplementedError()
 
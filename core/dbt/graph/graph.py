@@ -1,5 +1,4 @@
-from typing import Set, Iterable, Iterator, Optional, NewType
-from itertools import product
+from typing import Dict, List, Set, Iterable, Iterator, Optional, NewType
 import networkx as nx  # type: ignore
 from functools import partial
 
@@ -8,6 +7,32 @@ from dbt.exceptions import DbtInternalError
 UniqueId = NewType("UniqueId", str)
 
 
+class _Adjacency:
+    """The children and parents of every node of a networkx graph, as lists
+    of node indexes.
+    """
+
+    def __init__(self, graph, exclude_edge_type: Optional[str] = None) -> None:
+        self.size = (graph.number_of_nodes(), graph.number_of_edges())
+        self.node_ids: List[UniqueId] = list(graph.nodes())
+        self.indexes: Dict[UniqueId, int] = {
+            node_id: index for index, node_id in enumerate(self.node_ids)
+        }
+        self.children: List[List[int]] = [[] for _ in self.node_ids]
+        self.parents: List[List[int]] = [[] for _ in self.node_ids]
+        for parent, child, edge_type in graph.edges(data="edge_type"):
+            if exclude_edge_type is not None and edge_type == exclude_edge_type:
+                continue
+            parent_index, child_index = self.indexes[parent], self.indexes[child]
+            self.children[parent_index].append(child_index)
+            self.parents[child_index].append(parent_index)
+
+    def matches(self, graph) -> bool:
+        # graphs are built before they're wrapped, but be safe if nodes or
+        # edges are added afterwards
+        return self.size == (graph.number_of_nodes(), graph.number_of_edges())
+
+
 class Graph:
     """A wrapper around the networkx graph that understands SelectionCriteria
     and how they interact with the graph.
@@ -15,6 +40,9 @@ class Graph:
 
     def __init__(self, graph) -> None:
         self.graph = graph
+        # integer-indexed adjacency lists (without parent_test edges) for
+        # traversals, built on first use
+        self._adjacency: Optional[_Adjacency] = None
 
     def nodes(self) -> Set[UniqueId]:
         return set(self.graph.nodes())
@@ -27,20 +55,51 @@ class Graph:
 
     def ancestors(self, node: UniqueId, max_depth: Optional[int] = None) -> Set[UniqueId]:
         """Returns all nodes having a path to `node` in `graph`"""
-        if not self.graph.has_node(node):
-            raise DbtInternalError(f"Node {node} not found in the graph!")
-        filtered_graph = self.exclude_edge_type("parent_test")
-        return {
-            child
-            for _, child in nx.bfs_edges(filtered_graph, node, reverse=True, depth_limit=max_depth)
-        }
+        return set(self.reachable([node], max_depth, reverse=True))
 
     def descendants(self, node: UniqueId, max_depth: Optional[int] = None) -> Set[UniqueId]:
         """Returns all nodes reachable from `node` in `graph`"""
-        if not self.graph.has_node(node):
-            raise DbtInternalError(f"Node {node} not found in the graph!")
-        filtered_graph = self.exclude_edge_type("parent_test")
-        return {child for _, child in nx.bfs_edges(filtered_graph, node, depth_limit=max_depth)}
+        return set(self.reachable([node], max_depth))
+
+    def _get_adjacency(self) -> "_Adjacency":
+        if self._adjacency is None or not self._adjacency.matches(self.graph):
+            self._adjacency = _Adjacency(self.graph, exclude_edge_type="parent_test")
+        return self._adjacency
+
+    def reachable(
+        self,
+        selected: Iterable[UniqueId],
+        max_depth: Optional[int] = None,
+        reverse: bool = False,
+    ) -> Dict[UniqueId, int]:
+        """Returns all nodes reachable from any of the `selected` nodes (or
+        having a path to one of them, if `reverse`) in at most `max_depth`
+        steps, with the length of the shortest such path. All of the selected
+        nodes are expanded together in a single breadth-first pass.
+        """
+        adjacency = self._get_adjacency()
+        neighbors = adjacency.parents if reverse else adjacency.children
+        frontier = []
+        for node in selected:
+            if node not in adjacency.indexes:
+                raise DbtInternalError(f"Node {node} not found in the graph!")
+            frontier.append(adjacency.indexes[node])
+
+        # the selected nodes aren't marked as reached up front: they're only
+        # part of the result if they can be reached from another one
+        depths: Dict[int, int] = {}
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for index in frontier:
+                for neighbor in neighbors[index]:
+                    if neighbor not in depths:
+                        depths[neighbor] = depth
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        return {adjacency.node_ids[index]: depth for index, depth in depths.items()}
 
     def exclude_edge_type(self, edge_type_to_exclude):
         return nx.subgraph_view(
@@ -58,18 +117,12 @@ class Graph:
     def select_children(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        descendants: Set[UniqueId] = set()
-        for node in selected:
-            descendants.update(self.descendants(node, max_depth))
-        return descendants
+        return set(self.reachable(selected, max_depth))
 
     def select_parents(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        ancestors: Set[UniqueId] = set()
-        for node in selected:
-            ancestors.update(self.ancestors(node, max_depth))
-        return ancestors
+        return set(self.reachable(selected, max_depth, reverse=True))
 
     def select_successors(self, selected: Set[UniqueId]) -> Set[UniqueId]:
         successors: Set[UniqueId] = set()
@@ -83,49 +136,43 @@ class Graph:
         removed nodes are preserved as explicit new edges.
         """
 
-        new_graph = self.graph.copy()
         include_nodes = set(selected)
-
-        still_removing = True
-        while still_removing:
-            nodes_to_remove = list(
-                node
-                for node in new_graph
-                if node not in include_nodes
-                and (new_graph.in_degree(node) * new_graph.out_degree(node)) == 0
-            )
-            if len(nodes_to_remove) == 0:
-                still_removing = False
-            else:
-                new_graph.remove_nodes_from(nodes_to_remove)
-
-        # sort remaining nodes by degree
-        remaining_nodes = list(new_graph.nodes())
-        remaining_nodes.sort(
-            key=lambda node: new_graph.in_degree(node) * new_graph.out_degree(node)
-        )
-
-        for node in remaining_nodes:
-            if node not in include_nodes:
-                source_nodes = [x for x, _ in new_graph.in_edges(node)]
-                target_nodes = [x for _, x in new_graph.out_edges(node)]
-
-                new_edges = product(source_nodes, target_nodes)
-                non_cyclic_new_edges = [
-                    (source, target)
-                    for source, target in new_edges
-                    if source != target and not new_graph.has_edge(source, target)
-                ]  # removes cyclic refs and edges already existing in new graph
-
-                new_graph.add_edges_from(non_cyclic_new_edges)
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise ValueError(
                     "Couldn't find model '{}' -- does it exist or is it disabled?".format(node)
                 )
 
+        new_graph = self.graph.__class__()
+        new_graph.graph.update(self.graph.graph)
+        new_graph.add_nodes_from(
+            (node, data) for node, data in self.graph.nodes(data=True) if node in include_nodes
+        )
+
+        # There's an edge between two selected nodes if the second one can
+        # be reached from the first through nodes that weren't selected, so
+        # walk out from each selected node and stop at the selected ones.
+        successors = self.graph.succ
+        for source in new_graph:
+            # edges that were already in the graph keep their data
+            new_graph.add_edges_from(
+                (source, target, data)
+                for target, data in successors[source].items()
+                if target in include_nodes and target != source
+            )
+            seen = {source}
+            to_visit = [node for node in successors[source] if node not in include_nodes]
+            while to_visit:
+                node = to_visit.pop()
+                if node in seen:
+                    continue
+                seen.add(node)
+                if node in include_nodes:
+                    if node not in successors[source]:
+                        new_graph.add_edge(source, node)
+                else:
+                    to_visit.extend(successors[node])
+
         return Graph(new_graph)
 
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
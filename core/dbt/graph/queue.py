@@ -1,8 +1,10 @@
+import heapq
 import networkx as nx  # type: ignore
 import threading
+import time
 
 from queue import PriorityQueue
-from typing import Dict, Set, List, Generator, Optional
+from typing import Dict, Set, List, Iterable, Optional, Tuple
 
 from .graph import UniqueId
 from dbt.contracts.graph.nodes import (
@@ -17,14 +19,28 @@ from dbt.node_types import NodeType
 
 class GraphQueue:
     """A fancy queue that is backed by the dependency graph.
-    Note: this will mutate input!
+
+    The graph is copied into lists indexed by the position of each node, with
+    a count of the parents each node is still waiting for, so marking a node
+    as done only visits its children.
+
+    Nodes are handed out by their depth in the graph, or, given the execution
+    time of each node in a previous run, by the longest remaining path from
+    them to the end of the graph so that the nodes on the critical path start
+    first.
 
     This queue is thread-safe for `mark_done` calls, though you must ensure
     that separate threads do not call `.empty()` or `__len__()` and `.get()` at
     the same time, as there is an unlocked race!
     """
 
-    def __init__(self, graph: nx.DiGraph, manifest: Manifest, selected: Set[UniqueId]) -> None:
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        manifest: Manifest,
+        selected: Set[UniqueId],
+        execution_times: Optional[Dict[UniqueId, float]] = None,
+    ) -> None:
         self.graph = graph
         self.manifest = manifest
         self._selected = selected
@@ -37,10 +53,31 @@ class GraphQueue:
         self.queued: Set[UniqueId] = set()
         # this lock controls most things
         self.lock = threading.Lock()
+        # the time spent holding the lock in get() and mark_done(), in seconds
+        self.lock_hold_time = 0.0
+        self.max_lock_hold_time = 0.0
+        # the graph, by node index
+        self._node_ids: List[UniqueId] = list(graph.nodes())
+        self._indexes: Dict[UniqueId, int] = {
+            node_id: idx for idx, node_id in enumerate(self._node_ids)
+        }
+        self._children: List[List[int]] = [
+            [self._indexes[child] for child in graph.successors(node_id)]
+            for node_id in self._node_ids
+        ]
+        self._remaining_parents: List[int] = [
+            graph.in_degree(node_id) for node_id in self._node_ids
+        ]
+        # the number of nodes that are not done yet
+        self._remaining = len(self._node_ids)
+        # the expected execution time of each node, if known
+        self._durations: Optional[List[float]] = self._get_durations(execution_times)
         # store the 'score' of each node as a number. Lower is higher priority.
-        self._scores = self._get_scores(self.graph)
+        self._scores: List[float] = self._get_scores()
+        if self._durations is not None:
+            self._scores = self._get_critical_path_scores(self._scores, self._durations)
         # populate the initial queue
-        self._find_new_additions(list(self.graph.nodes()))
+        self._find_new_additions(range(len(self._node_ids)))
         # awaits after task end
         self.some_task_done = threading.Condition(self.lock)
 
@@ -57,59 +94,92 @@ class GraphQueue:
             return False
         return True
 
-    @staticmethod
-    def _grouped_topological_sort(
-        graph: nx.DiGraph,
-    ) -> Generator[List[str], None, None]:
-        """Topological sort of given graph that groups ties.
-
-        Adapted from `nx.topological_sort`, this function returns a topo sort of a graph however
-        instead of arbitrarily ordering ties in the sort order, ties are grouped together in
-        lists.
-
-        Args:
-            graph: The graph to be sorted.
-
-        Returns:
-            A generator that yields lists of nodes, one list per graph depth level.
-        """
-        indegree_map = {v: d for v, d in graph.in_degree() if d > 0}
-        zero_indegree = [v for v, d in graph.in_degree() if d == 0]
-
-        while zero_indegree:
-            yield zero_indegree
-            new_zero_indegree = []
-            for v in zero_indegree:
-                for _, child in graph.edges(v):
-                    indegree_map[child] -= 1
-                    if not indegree_map[child]:
-                        new_zero_indegree.append(child)
-            zero_indegree = new_zero_indegree
-
-    def _get_scores(self, graph: nx.DiGraph) -> Dict[str, int]:
+    def _get_durations(
+        self, execution_times: Optional[Dict[UniqueId, float]]
+    ) -> Optional[List[float]]:
+        if not execution_times:
+            return None
+        known = [execution_times[n] for n in self._node_ids if n in execution_times]
+        if not known:
+            return None
+        # nodes that didn't run before are expected to take an average time
+        default = sum(known) / len(known)
+        return [execution_times.get(node_id, default) for node_id in self._node_ids]
+
+    def _get_scores(self) -> List[float]:
         """Scoring nodes for processing order.
 
-        Scores are calculated by the graph depth level. Lowest score (0) should be processed first.
-
-        Args:
-            graph: The graph to be scored.
+        The score of a node is its depth in the graph: the length of the
+        longest path to it from a node without parents. Lowest score (0)
+        should be processed first.
 
         Returns:
-            A dictionary consisting of `node name`:`score` pairs.
+            The score of each node, by node index.
         """
-        # split graph by connected subgraphs
-        subgraphs = (graph.subgraph(x) for x in nx.connected_components(nx.Graph(graph)))
-
-        # score all nodes in all subgraphs
-        scores = {}
-        for subgraph in subgraphs:
-            grouped_nodes = self._grouped_topological_sort(subgraph)
-            for level, group in enumerate(grouped_nodes):
-                for node in group:
-                    scores[node] = level
-
+        scores: List[float] = [0] * len(self._node_ids)
+        remaining_parents = list(self._remaining_parents)
+        level = [idx for idx, count in enumerate(remaining_parents) if count == 0]
+        depth = 0
+        while level:
+            next_level = []
+            for idx in level:
+                scores[idx] = depth
+                for child in self._children[idx]:
+                    remaining_parents[child] -= 1
+                    if not remaining_parents[child]:
+                        next_level.append(child)
+            level = next_level
+            depth += 1
         return scores
 
+    def _get_critical_path_scores(
+        self, depths: List[float], durations: List[float]
+    ) -> List[float]:
+        """Score each node by the longest remaining path from it: its own
+        duration plus the longest remaining path of its children. Nodes with
+        the longest remaining path are scored lowest, to go first.
+        """
+        remaining_path = [0.0] * len(self._node_ids)
+        # children are deeper than their parents, so visit the deepest first
+        for idx in sorted(range(len(self._node_ids)), key=depths.__getitem__, reverse=True):
+            longest_child = max((remaining_path[c] for c in self._children[idx]), default=0.0)
+            remaining_path[idx] = durations[idx] + longest_child
+        return [-path for path in remaining_path]
+
+    def predicted_makespan(self, threads: int) -> Optional[float]:
+        """Simulate running the whole graph with the given number of threads,
+        using the expected execution times, and return how long it would
+        take. Returns None if the execution times are unknown.
+        """
+        if self._durations is None:
+            return None
+        remaining_parents = list(self._remaining_parents)
+        ready: List[Tuple[float, UniqueId, int]] = [
+            (self._scores[idx], self._node_ids[idx], idx)
+            for idx, count in enumerate(remaining_parents)
+            if count == 0
+        ]
+        heapq.heapify(ready)
+        running: List[Tuple[float, int]] = []
+        now = 0.0
+        while ready or running:
+            while ready and len(running) < max(threads, 1):
+                _, _, idx = heapq.heappop(ready)
+                heapq.heappush(running, (now + self._durations[idx], idx))
+            now, idx = heapq.heappop(running)
+            for child in self._children[idx]:
+                remaining_parents[child] -= 1
+                if not remaining_parents[child]:
+                    heapq.heappush(ready, (self._scores[child], self._node_ids[child], child))
+        return now
+
+    def _record_lock_hold(self, start: float) -> None:
+        """Callers must hold the lock."""
+        held = time.perf_counter() - start
+        self.lock_hold_time += held
+        if held > self.max_lock_hold_time:
+            self.max_lock_hold_time = held
+
     def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
         """Get a node off the inner priority queue. By default, this blocks.
 
@@ -124,7 +194,9 @@ class GraphQueue:
         """
         _, node_id = self.inner.get(block=block, timeout=timeout)
         with self.lock:
+            start = time.perf_counter()
             self._mark_in_progress(node_id)
+            self._record_lock_hold(start)
         return self.manifest.expect(node_id)
 
     def __len__(self) -> int:
@@ -135,7 +207,7 @@ class GraphQueue:
         This takes the lock.
         """
         with self.lock:
-            return len(self.graph) - len(self.in_progress)
+            return self._remaining - len(self.in_progress)
 
     def empty(self) -> bool:
         """The graph queue is 'empty' if it all remaining nodes in the graph
@@ -156,13 +228,14 @@ class GraphQueue:
         """
         return node in self.in_progress or node in self.queued
 
-    def _find_new_additions(self, candidates) -> None:
+    def _find_new_additions(self, candidates: Iterable[int]) -> None:
         """Find any nodes in the graph that need to be added to the internal
         queue and add them.
         """
-        for node in candidates:
-            if self.graph.in_degree(node) == 0 and not self._already_known(node):
-                self.inner.put((self._scores[node], node))
+        for idx in candidates:
+            node = self._node_ids[idx]
+            if self._remaining_parents[idx] == 0 and not self._already_known(node):
+                self.inner.put((self._scores[idx], node))
                 self.queued.add(node)
 
     def mark_done(self, node_id: UniqueId) -> None:
@@ -173,12 +246,16 @@ class GraphQueue:
         :param str node_id: The node ID to mark as complete.
         """
         with self.lock:
+            start = time.perf_counter()
             self.in_progress.remove(node_id)
-            successors = list(self.graph.successors(node_id))
-            self.graph.remove_node(node_id)
-            self._find_new_additions(successors)
+            self._remaining -= 1
+            children = self._children[self._indexes[node_id]]
+            for child in children:
+                self._remaining_parents[child] -= 1
+            self._find_new_additions(children)
             self.inner.task_done()
             self.some_task_done.notify_all()
+            self._record_lock_hold(start)
 
     def _mark_in_progress(self, node_id: UniqueId) -> None:
         """Mark the node as 'in progress'.
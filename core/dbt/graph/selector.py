@@ -1,8 +1,8 @@
-from typing import Set, List, Optional, Tuple
+from typing import Dict, Set, List, Optional, Tuple
 
 from .graph import Graph, UniqueId
 from .queue import GraphQueue
-from .selector_methods import MethodManager
+from .selector_methods import MethodManager, SelectorIndex
 from .selector_spec import SelectionCriteria, SelectionSpec, IndirectSelection
 
 from dbt.events.functions import fire_event, warn_or_error
@@ -306,20 +306,30 @@ class NodeSelector(MethodManager):
             - selectors can filter the nodes after all of them have been
               selected
         """
-        selected_nodes, indirect_only = self.select_nodes(spec)
+        # all the criteria of the spec share one set of lookup indexes
+        self.index = SelectorIndex(self.manifest)
+        try:
+            selected_nodes, indirect_only = self.select_nodes(spec)
+        finally:
+            self.index = None
         filtered_nodes = self.filter_selection(selected_nodes)
 
         return filtered_nodes
 
-    def get_graph_queue(self, spec: SelectionSpec) -> GraphQueue:
+    def get_graph_queue(
+        self,
+        spec: SelectionSpec,
+        execution_times: Optional[Dict[UniqueId, float]] = None,
+    ) -> GraphQueue:
         """Returns a queue over nodes in the graph that tracks progress of
-        dependecies.
+        dependecies. If the execution times of the nodes are given, nodes on
+        the critical path are handed out first.
         """
         selected_nodes = self.get_selected(spec)
         selected_resources.set_selected_resources(selected_nodes)
         new_graph = self.full_graph.get_subset_graph(selected_nodes)
         # should we give a way here for consumers to mutate the graph?
-        return GraphQueue(new_graph.graph, self.manifest, selected_nodes)
+        return GraphQueue(new_graph.graph, self.manifest, selected_nodes, execution_times)
 
 
 class ResourceTypeSelector(NodeSelector):
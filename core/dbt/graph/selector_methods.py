@@ -1,4 +1,5 @@
 import abc
+import time
 from fnmatch import fnmatch
 from itertools import chain
 from pathlib import Path
@@ -28,7 +29,10 @@ from dbt.exceptions import (
     DbtRuntimeError,
 )
 from dbt.node_types import NodeType
+from dbt.events.base_types import EventLevel
 from dbt.events.contextvars import get_project_root
+from dbt.events.functions import fire_event
+from dbt.events.types import Note
 
 
 SELECTOR_GLOB = "*"
@@ -59,6 +63,15 @@ class MethodName(StrEnum):
     SavedQuery = "saved_query"
 
 
+def _flat_fqn(fqn: List[str]) -> List[str]:
+    # Dots in model names act as namespace separators
+    return [item for segment in fqn for item in segment.split(".")]
+
+
+def _has_wildcard(selector_part: str) -> bool:
+    return any(wildcard in selector_part for wildcard in ("*", "?", "[", "]"))
+
+
 def is_selected_node(fqn: List[str], node_selector: str, is_versioned: bool) -> bool:
     # If qualified_name exactly matches model name (fqn's leaf), return True
     if is_versioned:
@@ -71,15 +84,14 @@ def is_selected_node(fqn: List[str], node_selector: str, is_versioned: bool) ->
     else:
         if fqn[-1] == node_selector:
             return True
-    # Flatten node parts. Dots in model names act as namespace separators
-    flat_fqn = [item for segment in fqn for item in segment.split(".")]
+    flat_fqn = _flat_fqn(fqn)
     # Selector components cannot be more than fqn's
     if len(flat_fqn) < len(node_selector.split(".")):
         return False
 
     slurp_from_ix: Optional[int] = None
     for i, selector_part in enumerate(node_selector.split(".")):
-        if any(wildcard in selector_part for wildcard in ("*", "?", "[", "]")):
+        if _has_wildcard(selector_part):
             slurp_from_ix = i
             break
         elif flat_fqn[i] == selector_part:
@@ -104,13 +116,172 @@ def is_selected_node(fqn: List[str], node_selector: str, is_versioned: bool) ->
 SelectorTarget = Union[SourceDefinition, ManifestNode, Exposure, Metric]
 
 
+class _ConfigIndex:
+    def __init__(self) -> None:
+        # config value (or list element) -> nodes
+        self.by_value: Dict[Any, Set[UniqueId]] = {}
+        self.true: Set[UniqueId] = set()
+        self.false: Set[UniqueId] = set()
+
+
+class SelectorIndex:
+    """Inverted indexes over the nodes of a manifest, so that selector
+    methods can look up the nodes that match a selector instead of checking
+    every node. Each index is built the first time it's needed, and one
+    SelectorIndex is shared by all the criteria of a selection.
+
+    The indexes cover the same nodes as the SelectorMethod iterators that
+    the methods would otherwise use.
+    """
+
+    def __init__(self, manifest: Manifest) -> None:
+        self.manifest = manifest
+        self._tags: Optional[Dict[str, Set[UniqueId]]] = None
+        self._packages: Optional[Dict[str, Set[UniqueId]]] = None
+        self._paths: Optional[Dict[Path, Set[UniqueId]]] = None
+        self._fqn_prefixes: Optional[Dict[Tuple[str, ...], Set[UniqueId]]] = None
+        self._fqn_names: Optional[Dict[str, Set[UniqueId]]] = None
+        self._fqn_nodes: Dict[UniqueId, Any] = {}
+        self._configs: Dict[Tuple[str, ...], _ConfigIndex] = {}
+
+    def _all_nodes(self) -> Iterator[Tuple[str, SelectorTarget]]:
+        return chain(
+            self.manifest.nodes.items(),
+            self.manifest.sources.items(),
+            self.manifest.exposures.items(),
+            self.manifest.metrics.items(),
+            self.manifest.semantic_models.items(),  # type: ignore[arg-type]
+        )
+
+    def _non_source_nodes(self) -> Iterator[Tuple[str, Any]]:
+        return chain(
+            self.manifest.nodes.items(),
+            self.manifest.exposures.items(),
+            self.manifest.metrics.items(),
+            self.manifest.semantic_models.items(),
+            self.manifest.saved_queries.items(),
+        )
+
+    @property
+    def tags(self) -> Dict[str, Set[UniqueId]]:
+        if self._tags is None:
+            self._tags = {}
+            for unique_id, node in self._all_nodes():
+                for tag in getattr(node, "tags", ()):
+                    self._tags.setdefault(tag, set()).add(UniqueId(unique_id))
+        return self._tags
+
+    @property
+    def packages(self) -> Dict[str, Set[UniqueId]]:
+        if self._packages is None:
+            self._packages = {}
+            for unique_id, node in self._all_nodes():
+                self._packages.setdefault(node.package_name, set()).add(UniqueId(unique_id))
+        return self._packages
+
+    @property
+    def paths(self) -> Dict[Path, Set[UniqueId]]:
+        """The nodes by their file path, every parent directory of it, and
+        the path of the yaml file that patches them.
+        """
+        if self._paths is None:
+            self._paths = {}
+            for unique_id, node in self._all_nodes():
+                ofp = Path(node.original_file_path)
+                paths = [ofp, *ofp.parents]
+                if getattr(node, "patch_path", None):
+                    paths.append(Path(node.patch_path.split("://")[1]))  # type: ignore
+                for path in paths:
+                    self._paths.setdefault(path, set()).add(UniqueId(unique_id))
+        return self._paths
+
+    def _build_fqn_indexes(self) -> None:
+        self._fqn_prefixes = {}
+        self._fqn_names = {}
+        for unique_id, node in self._non_source_nodes():
+            uid = UniqueId(unique_id)
+            self._fqn_nodes[uid] = node
+            fqn = node.fqn
+            names = {fqn[-1]}
+            if node.is_versioned:
+                names.update((fqn[-2], "_".join(fqn[-2:])))
+            for name in names:
+                self._fqn_names.setdefault(name, set()).add(uid)
+            # prefixes of the fqn, with and without its package
+            for flat_fqn in (_flat_fqn(fqn), _flat_fqn(fqn[1:])):
+                for end in range(1, len(flat_fqn) + 1):
+                    prefix = tuple(flat_fqn[:end])
+                    self._fqn_prefixes.setdefault(prefix, set()).add(uid)
+
+    def fqn_candidates(self, qualified_name: str) -> Optional[Dict[UniqueId, Any]]:
+        """Return a superset of the nodes whose fqn matches the qualified
+        name, or None if it starts with a wildcard.
+        """
+        parts = qualified_name.split(".")
+        prefix: List[str] = []
+        for part in parts:
+            if _has_wildcard(part):
+                break
+            prefix.append(part)
+        if not prefix:
+            return None
+        if self._fqn_prefixes is None or self._fqn_names is None:
+            self._build_fqn_indexes()
+        assert self._fqn_prefixes is not None and self._fqn_names is not None
+        candidates = (
+            self._fqn_prefixes.get(tuple(prefix), set())
+            | self._fqn_names.get(qualified_name, set())
+            | self._fqn_names.get("_".join(parts[-2:]), set())
+        )
+        return {unique_id: self._fqn_nodes[unique_id] for unique_id in candidates}
+
+    def config(self, parts: List[str]) -> _ConfigIndex:
+        key = tuple(parts)
+        if key not in self._configs:
+            index = _ConfigIndex()
+            configurable_nodes: Iterator[Tuple[str, ResultNode]] = chain(
+                self.manifest.nodes.items(), self.manifest.sources.items()
+            )
+            for unique_id, node in configurable_nodes:
+                uid = UniqueId(unique_id)
+                try:
+                    value = _getattr_descend(node.config, parts)
+                except AttributeError:
+                    continue
+                if isinstance(value, list):
+                    values = value
+                    if True in value:
+                        index.true.add(uid)
+                    if False in value:
+                        index.false.add(uid)
+                else:
+                    values = [value]
+                    if value is True:
+                        index.true.add(uid)
+                    elif value is False:
+                        index.false.add(uid)
+                for item in values:
+                    try:
+                        index.by_value.setdefault(item, set()).add(uid)
+                    except TypeError:
+                        # unhashable values are never equal to a selector
+                        pass
+            self._configs[key] = index
+        return self._configs[key]
+
+
 class SelectorMethod(metaclass=abc.ABCMeta):
     def __init__(
-        self, manifest: Manifest, previous_state: Optional[PreviousState], arguments: List[str]
+        self,
+        manifest: Manifest,
+        previous_state: Optional[PreviousState],
+        arguments: List[str],
+        index: Optional[SelectorIndex] = None,
     ) -> None:
         self.manifest: Manifest = manifest
         self.previous_state = previous_state
         self.arguments: List[str] = arguments
+        self.index = index
 
     def parsed_nodes(
         self, included_nodes: Set[UniqueId]
@@ -237,6 +408,14 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 
         :param str selector: The selector or node name
         """
+        candidates = None if self.index is None else self.index.fqn_candidates(selector)
+        if candidates is not None:
+            for node, real_node in candidates.items():
+                if node in included_nodes:
+                    if self.node_is_match(selector, real_node.fqn, real_node.is_versioned):
+                        yield node
+            return
+
         non_source_nodes = list(self.non_source_nodes(included_nodes))
         for node, real_node in non_source_nodes:
             if self.node_is_match(selector, real_node.fqn, real_node.is_versioned):
@@ -246,6 +425,12 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 class TagSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included that have the specified tag"""
+        if self.index is not None:
+            for tag, nodes in self.index.tags.items():
+                if fnmatch(tag, selector):
+                    yield from (node for node in nodes if node in included_nodes)
+            return
+
         for node, real_node in self.all_nodes(included_nodes):
             if hasattr(real_node, "tags") and any(
                 fnmatch(tag, selector) for tag in real_node.tags
@@ -411,6 +596,12 @@ class PathSelectorMethod(SelectorMethod):
         else:
             root = Path.cwd()
         paths = set(p.relative_to(root) for p in root.glob(selector))
+        if self.index is not None:
+            for path in paths:
+                nodes = self.index.paths.get(path, ())
+                yield from (node for node in nodes if node in included_nodes)
+            return
+
         for node, real_node in self.all_nodes(included_nodes):
             ofp = Path(real_node.original_file_path)
             if ofp in paths:
@@ -437,6 +628,12 @@ class FileSelectorMethod(SelectorMethod):
 class PackageSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yields nodes from included that have the specified package"""
+        if self.index is not None:
+            for package_name, nodes in self.index.packages.items():
+                if fnmatch(package_name, selector):
+                    yield from (node for node in nodes if node in included_nodes)
+            return
+
         for node, real_node in self.all_nodes(included_nodes):
             if fnmatch(real_node.package_name, selector):
                 yield node
@@ -477,6 +674,15 @@ class ConfigSelectorMethod(SelectorMethod):
         # make the comparison case-insensitive
         if parts == ["severity"]:
             selector = CaseInsensitive(selector)
+        elif self.index is not None and isinstance(selector, str):
+            index = self.index.config(parts)
+            matches = set(index.by_value.get(selector, ()))
+            if CaseInsensitive(selector) == "true":
+                matches.update(index.true)
+            elif CaseInsensitive(selector) == "false":
+                matches.update(index.false)
+            yield from (node for node in matches if node in included_nodes)
+            return
 
         # search sources is kind of useless now source configs only have
         # 'enabled', which you can't really filter on anyway, but maybe we'll
@@ -549,6 +755,8 @@ class StateSelectorMethod(SelectorMethod):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.modified_macros: Optional[List[str]] = None
+        # the modified macros and every macro that depends on one of them
+        self.affected_macros: Set[str] = set()
 
     def _macros_modified(self) -> List[str]:
         # we checked in the caller!
@@ -572,47 +780,44 @@ class StateSelectorMethod(SelectorMethod):
 
         return modified
 
-    def recursively_check_macros_modified(self, node, visited_macros):
-        if not hasattr(node, "depends_on"):
-            return False
-
-        for macro_uid in node.depends_on.macros:
-            if macro_uid in visited_macros:
-                continue
-            visited_macros.append(macro_uid)
-
-            if macro_uid in self.modified_macros:
-                return True
-
-            # this macro hasn't been modified, but depends on other
-            # macros which each need to be tested for modification
-            macro_node = self.manifest.macros[macro_uid]
-            if len(macro_node.depends_on.macros) > 0:
-                upstream_macros_changed = self.recursively_check_macros_modified(
-                    macro_node, visited_macros
-                )
-                if upstream_macros_changed:
-                    return True
-                continue
+    def _macros_affected(self, modified: List[str]) -> Set[str]:
+        """Return the modified macros along with every macro that calls one of
+        them, directly or through other macros.
+        """
+        macros = self.manifest.macros
+        child_map = self.manifest.build_macro_child_map()
+        to_visit = list(modified)
+        # deleted macros aren't in the child map, so look for their callers
+        deleted = {uid for uid in modified if uid not in macros}
+        if deleted:
+            to_visit.extend(
+                uid
+                for uid, macro in macros.items()
+                if not deleted.isdisjoint(macro.depends_on.macros)
+            )
 
-            # this macro hasn't been modified, but we haven't checked
-            # the other macros the node depends on, so keep looking
-            if len(node.depends_on.macros) > len(visited_macros):
+        affected: Set[str] = set()
+        while to_visit:
+            macro_uid = to_visit.pop()
+            if macro_uid in affected:
                 continue
+            affected.add(macro_uid)
+            to_visit.extend(child for child in child_map.get(macro_uid, []) if child in macros)
+        return affected
 
-        return False
-
-    def check_macros_modified(self, node):
+    def _find_affected_macros(self) -> None:
         # check if there are any changes in macros the first time
         if self.modified_macros is None:
             self.modified_macros = self._macros_modified()
+            if self.modified_macros:
+                self.affected_macros = self._macros_affected(self.modified_macros)
+
+    def check_macros_modified(self, node):
+        self._find_affected_macros()
         # no macros have been modified, skip looping entirely
-        if not self.modified_macros:
+        if not self.affected_macros or not hasattr(node, "depends_on"):
             return False
-        # recursively loop through upstream macros to see if any is modified
-        else:
-            visited_macros = []
-            return self.recursively_check_macros_modified(node, visited_macros)
+        return not self.affected_macros.isdisjoint(node.depends_on.macros)
 
     # TODO check modifed_content and check_modified macro seems a bit redundent
     def check_modified_content(
@@ -698,7 +903,14 @@ class StateSelectorMethod(SelectorMethod):
 
         manifest: WritableManifest = self.previous_state.manifest
 
+        start = time.perf_counter()
+        if selector in ("modified", "unmodified", "modified.macros"):
+            self._find_affected_macros()
+        macros_elapsed = time.perf_counter() - start
+
+        compared = 0
         for node, real_node in self.all_nodes(included_nodes):
+            compared += 1
             previous_node: Optional[SelectorTarget] = None
 
             if node in manifest.nodes:
@@ -721,6 +933,15 @@ class StateSelectorMethod(SelectorMethod):
             if checker(previous_node, real_node, **keyword_args):  # type: ignore
                 yield node
 
+        fire_event(
+            Note(
+                msg=f"Compared {compared} nodes for state:{selector} in "
+                f"{time.perf_counter() - start:.3f}s, {macros_elapsed:.3f}s of which "
+                f"finding {len(self.affected_macros)} modified macros and their callers"
+            ),
+            level=EventLevel.DEBUG,
+        )
+
 
 class ResultSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
@@ -851,6 +1072,8 @@ class MethodManager:
     ) -> None:
         self.manifest = manifest
         self.previous_state = previous_state
+        # shared by the methods while a selection is in progress
+        self.index: Optional[SelectorIndex] = None
 
     def get_method(self, method: MethodName, method_arguments: List[str]) -> SelectorMethod:
 
@@ -860,4 +1083,4 @@ class MethodManager:
                 f"method name, but it is not handled"
             )
         cls: Type[SelectorMethod] = self.SELECTOR_METHODS[method]
-        return cls(self.manifest, self.previous_state, method_arguments)
+        return cls(self.manifest, self.previous_state, method_arguments, self.index)
@@ -91,9 +91,18 @@
 
 {% macro default__load_csv_rows(model, agate_table) %}
 
+  {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
+
+  {# Use the adapter's bulk loading interface if it has one, unless the seed sets bulk_load: false #}
+  {% if config.get('bulk_load', default=true) %}
+    {% set bulk_load_sql = adapter.bulk_load_csv_rows(this, cols_sql, agate_table) %}
+    {% if bulk_load_sql is not none %}
+      {{ return(bulk_load_sql) }}
+    {% endif %}
+  {% endif %}
+
   {% set batch_size = get_batch_size() %}
 
-  {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
   {% set bindings = [] %}
 
   {% set statements = [] %}
@@ -25,6 +25,7 @@ from dbt.exceptions import (
     InvalidAccessTypeError,
 )
 from dbt import hooks
+from dbt.flags import get_flags
 from dbt.node_types import NodeType, ModelLanguage, AccessType
 from dbt.parser.search import FileBlock
 
@@ -243,7 +244,9 @@ class ConfiguredParser(
         dct.update(kwargs)
 
         try:
-            return self.parse_from_dict(dct, validate=True)
+            # nodes built here can skip schema validation, since their config
+            # has already been validated when it was calculated
+            return self.parse_from_dict(dct, validate=get_flags().VALIDATE_PARSED_NODES)
         except ValidationError as exc:
             # this is a bit silly, but build an UnparsedNode just for error
             # message reasons
@@ -5,6 +5,7 @@ import datetime
 import os
 import traceback
 from typing import (
+    BinaryIO,
     Dict,
     Optional,
     Mapping,
@@ -77,6 +78,7 @@ from dbt.contracts.files import FileHash, ParseFileType, SchemaSourceFile
 from dbt.parser.read_files import (
     ReadFilesFromFileSystem,
     load_source_file,
+    load_source_file_contents,
     FileDiff,
     ReadFilesFromDiff,
     ReadFiles,
@@ -226,6 +228,53 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
         return dct
 
 
+# The partial parse file starts with this header, which holds everything
+# 'is_partial_parsable' checks, followed by the saved manifest. This lets
+# a stale file be rejected without decoding the whole manifest.
+@dataclass
+class PartialParseHeader(dbtClassMixin):
+    dbt_version: str
+    state_check: ManifestStateCheck
+
+
+PARTIAL_PARSE_HEADER_KEY = "partial_parse_header"
+
+
+def write_partial_parse_file(path: str, manifest: Manifest) -> None:
+    header = PartialParseHeader(
+        dbt_version=manifest.metadata.dbt_version,
+        state_check=manifest.state_check,
+    )
+    header_msgpack = extended_mashumaro_encoder({PARTIAL_PARSE_HEADER_KEY: header.to_dict()})
+    manifest_msgpack = manifest.to_msgpack(extended_mashumaro_encoder)
+    make_directory(os.path.dirname(path))
+    with open(path, "wb") as fp:
+        fp.write(header_msgpack)
+        fp.write(manifest_msgpack)
+
+
+def read_partial_parse_header(fp: BinaryIO) -> Optional[PartialParseHeader]:
+    """Read the header from an open partial parse file and leave the file
+    positioned at the start of the saved manifest. Returns None for files
+    written without a header, with the file positioned back at the start.
+    """
+    unpacker = msgpack.Unpacker(fp, ext_hook=extended_msgpack_decoder, raw=False)
+    header = None
+    if unpacker.read_map_header() == 1 and unpacker.unpack() == PARTIAL_PARSE_HEADER_KEY:
+        header = PartialParseHeader.from_dict(unpacker.unpack())
+        fp.seek(unpacker.tell())
+    else:
+        fp.seek(0)
+    return header
+
+
+def read_partial_parse_manifest(fp: BinaryIO) -> Manifest:
+    """Decode the saved manifest from a partial parse file positioned by
+    'read_partial_parse_header'.
+    """
+    return Manifest.from_msgpack(fp.read(), decoder=extended_mashumuro_decoder)  # type: ignore
+
+
 # The ManifestLoader loads the manifest. The standard way to use the
 # ManifestLoader is using the 'get_full_manifest' class method, but
 # many tests use abbreviated processes.
@@ -358,7 +407,8 @@ class ManifestLoader:
             file_reader = ReadFilesFromFileSystem(
                 all_projects=self.all_projects,
                 files=self.manifest.files,
-                saved_files=saved_files,
+                # saved files are only used to skip unmodified files
+                saved_files=saved_files if get_flags().PARTIAL_PARSE_USE_MTIMES else {},
             )
 
         # Set the files in the manifest and save the project_parser_files
@@ -615,6 +665,7 @@ class ManifestLoader:
             if "MacroParser" in parser_files:
                 parser = MacroParser(project, self.manifest)
                 for file_id in parser_files["MacroParser"]:
+                    load_source_file_contents(self.manifest.files[file_id])
                     block = FileBlock(self.manifest.files[file_id])
                     parser.parse_file(block)
                     # increment parsed path count for performance tracking
@@ -624,6 +675,7 @@ class ManifestLoader:
             if "GenericTestParser" in parser_files:
                 parser = GenericTestParser(project, self.manifest)
                 for file_id in parser_files["GenericTestParser"]:
+                    load_source_file_contents(self.manifest.files[file_id])
                     block = FileBlock(self.manifest.files[file_id])
                     parser.parse_file(block)
                     # increment parsed path count for performance tracking
@@ -672,6 +724,7 @@ class ManifestLoader:
                     # Came out of here with UnpatchedSourceDefinition containing configs at the source level
                     # and not configs at the table level (as expected)
                 else:
+                    load_source_file_contents(block.file)
                     parser.parse_file(block)
                 project_parsed_path_count += 1
 
@@ -750,10 +803,7 @@ class ManifestLoader:
                     UnableToPartialParse(reason="saved manifest contained the wrong version")
                 )
                 self.manifest.metadata.dbt_version = __version__
-            manifest_msgpack = self.manifest.to_msgpack(extended_mashumaro_encoder)
-            make_directory(os.path.dirname(path))
-            with open(path, "wb") as fp:
-                fp.write(manifest_msgpack)
+            write_partial_parse_file(path, self.manifest)
         except Exception:
             raise
 
@@ -784,15 +834,20 @@ class ManifestLoader:
         """Compare the global hashes of the read-in parse results' values to
         the known ones, and return if it is ok to re-use the results.
         """
+        return self.is_state_partial_parsable(manifest.metadata.dbt_version, manifest.state_check)
+
+    def is_state_partial_parsable(
+        self, dbt_version: str, state_check: ManifestStateCheck
+    ) -> Tuple[bool, Optional[str]]:
         valid = True
         reparse_reason = None
 
-        if manifest.metadata.dbt_version != __version__:
+        if dbt_version != __version__:
             # #3757 log both versions because of reports of invalid cases of mismatch.
             fire_event(UnableToPartialParse(reason="of a version mismatch"))
             # If the version is wrong, the other checks might not work
             return False, ReparseReason.version_mismatch
-        if self.manifest.state_check.vars_hash != manifest.state_check.vars_hash:
+        if self.manifest.state_check.vars_hash != state_check.vars_hash:
             fire_event(
                 UnableToPartialParse(
                     reason="config vars, config profile, or config target have changed"
@@ -800,31 +855,25 @@ class ManifestLoader:
             )
             fire_event(
                 Note(
-                    msg=f"previous checksum: {self.manifest.state_check.vars_hash.checksum}, current checksum: {manifest.state_check.vars_hash.checksum}"
+                    msg=f"previous checksum: {self.manifest.state_check.vars_hash.checksum}, current checksum: {state_check.vars_hash.checksum}"
                 ),
                 level=EventLevel.DEBUG,
             )
             valid = False
             reparse_reason = ReparseReason.vars_changed
-        if self.manifest.state_check.profile_hash != manifest.state_check.profile_hash:
+        if self.manifest.state_check.profile_hash != state_check.profile_hash:
             # Note: This should be made more granular. We shouldn't need to invalidate
             # partial parsing if a non-used profile section has changed.
             fire_event(UnableToPartialParse(reason="profile has changed"))
             valid = False
             reparse_reason = ReparseReason.profile_changed
-        if (
-            self.manifest.state_check.project_env_vars_hash
-            != manifest.state_check.project_env_vars_hash
-        ):
+        if self.manifest.state_check.project_env_vars_hash != state_check.project_env_vars_hash:
             fire_event(
                 UnableToPartialParse(reason="env vars used in dbt_project.yml have changed")
             )
             valid = False
             reparse_reason = ReparseReason.proj_env_vars_changed
-        if (
-            self.manifest.state_check.profile_env_vars_hash
-            != manifest.state_check.profile_env_vars_hash
-        ):
+        if self.manifest.state_check.profile_env_vars_hash != state_check.profile_env_vars_hash:
             fire_event(UnableToPartialParse(reason="env vars used in profiles.yml have changed"))
             valid = False
             reparse_reason = ReparseReason.prof_env_vars_changed
@@ -832,7 +881,7 @@ class ManifestLoader:
         missing_keys = {
             k
             for k in self.manifest.state_check.project_hashes
-            if k not in manifest.state_check.project_hashes
+            if k not in state_check.project_hashes
         }
         if missing_keys:
             fire_event(UnableToPartialParse(reason="a project dependency has been added"))
@@ -840,8 +889,8 @@ class ManifestLoader:
             reparse_reason = ReparseReason.deps_changed
 
         for key, new_value in self.manifest.state_check.project_hashes.items():
-            if key in manifest.state_check.project_hashes:
-                old_value = manifest.state_check.project_hashes[key]
+            if key in state_check.project_hashes:
+                old_value = state_check.project_hashes[key]
                 if new_value != old_value:
                     fire_event(UnableToPartialParse(reason="a project config has changed"))
                     valid = False
@@ -878,14 +927,24 @@ class ManifestLoader:
 
         if os.path.exists(path):
             try:
+                manifest: Optional[Manifest] = None
                 with open(path, "rb") as fp:
-                    manifest_mp = fp.read()
-                manifest: Manifest = Manifest.from_msgpack(manifest_mp, decoder=extended_mashumuro_decoder)  # type: ignore
-                # keep this check inside the try/except in case something about
-                # the file has changed in weird ways, perhaps due to being a
-                # different version of dbt
-                is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
-                if is_partial_parsable:
+                    # keep these checks inside the try/except in case something about
+                    # the file has changed in weird ways, perhaps due to being a
+                    # different version of dbt
+                    header = read_partial_parse_header(fp)
+                    if header is not None:
+                        # Check the header first so that the saved manifest is
+                        # only decoded if it can be used
+                        is_partial_parsable, reparse_reason = self.is_state_partial_parsable(
+                            header.dbt_version, header.state_check
+                        )
+                        if is_partial_parsable:
+                            manifest = read_partial_parse_manifest(fp)
+                    else:
+                        manifest = read_partial_parse_manifest(fp)
+                        is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
+                if manifest is not None and is_partial_parsable:
                     # We don't want to have stale generated_at dates
                     manifest.metadata.generated_at = datetime.datetime.utcnow()
                     # or invocation_ids
@@ -1525,6 +1584,7 @@ def _process_refs(
 
         target_model_id = target_model.unique_id
         node.depends_on.add_node(target_model_id)
+        manifest.mark_edges_changed(node.unique_id)
 
 
 def _process_metric_node(
@@ -1563,6 +1623,7 @@ def _process_metric_node(
             )
 
         metric.depends_on.add_node(target_semantic_model.unique_id)
+        manifest.mark_edges_changed(metric.unique_id)
 
     elif metric.type is MetricType.DERIVED or metric.type is MetricType.RATIO:
         input_metrics = metric.input_metrics
@@ -1598,6 +1659,7 @@ def _process_metric_node(
             )
             metric.type_params.input_measures.extend(target_metric.type_params.input_measures)
             metric.depends_on.add_node(target_metric.unique_id)
+            manifest.mark_edges_changed(metric.unique_id)
     else:
         assert_values_exhausted(metric.type)
 
@@ -1654,6 +1716,7 @@ def _process_metrics_for_node(
         target_metric_id = target_metric.unique_id
 
         node.depends_on.add_node(target_metric_id)
+        manifest.mark_edges_changed(node.unique_id)
 
 
 def remove_dependent_project_references(manifest, external_node_unique_id):
@@ -1662,6 +1725,7 @@ def remove_dependent_project_references(manifest, external_node_unique_id):
         # child node may have been modified and already recreated its depends_on.nodes list
         if external_node_unique_id in node.depends_on_nodes:
             node.depends_on_nodes.remove(external_node_unique_id)
+        manifest.mark_edges_changed(child_id)
         node.created_at = time.time()
 
 
@@ -1685,6 +1749,7 @@ def _process_sources_for_exposure(manifest: Manifest, current_project: str, expo
             continue
         target_source_id = target_source.unique_id
         exposure.depends_on.add_node(target_source_id)
+        manifest.mark_edges_changed(exposure.unique_id)
 
 
 def _process_sources_for_metric(manifest: Manifest, current_project: str, metric: Metric):
@@ -1707,6 +1772,7 @@ def _process_sources_for_metric(manifest: Manifest, current_project: str, metric
             continue
         target_source_id = target_source.unique_id
         metric.depends_on.add_node(target_source_id)
+        manifest.mark_edges_changed(metric.unique_id)
 
 
 def _process_sources_for_node(manifest: Manifest, current_project: str, node: ManifestNode):
@@ -1735,6 +1801,7 @@ def _process_sources_for_node(manifest: Manifest, current_project: str, node: Ma
             continue
         target_source_id = target_source.unique_id
         node.depends_on.add_node(target_source_id)
+        manifest.mark_edges_changed(node.unique_id)
 
 
 # This is called in task.rpc.sql_commands when a "dynamic" node is
@@ -493,7 +493,7 @@ class PartialParsing:
                     source_file.macros.remove(unique_id)
                 continue
 
-            base_macro = self.saved_manifest.macros.pop(unique_id)
+            base_macro = self.saved_manifest.remove_macro(unique_id)
 
             # Recursively check children of this macro
             # The macro_child_map might not exist if a macro is removed by
@@ -853,7 +853,7 @@ class PartialParsing:
             macro_unique_id = schema_file.macro_patches[macro["name"]]
             del schema_file.macro_patches[macro["name"]]
         if macro_unique_id and macro_unique_id in self.saved_manifest.macros:
-            macro = self.saved_manifest.macros.pop(macro_unique_id)
+            macro = self.saved_manifest.remove_macro(macro_unique_id)
             macro_file_id = macro.file_id
             if macro_file_id in self.new_files:
                 self.saved_files[macro_file_id] = deepcopy(self.new_files[macro_file_id])
@@ -15,7 +15,7 @@ from dbt.config import Project
 from dbt.dataclass_schema import dbtClassMixin
 from dbt.parser.schemas import yaml_from_file, schema_file_keys
 from dbt.exceptions import ParsingError
-from dbt.parser.search import filesystem_search
+from dbt.parser.search import ProjectFileIndex
 from typing import Optional, Dict, List, Mapping, MutableMapping
 from dbt.events.types import InputFileDiffError
 from dbt.events.functions import fire_event
@@ -54,22 +54,26 @@ def load_source_file(
         project_name=project_name,
     )
 
-    skip_loading_schema_file = False
-    if (
-        parse_file_type == ParseFileType.Schema
-        and saved_files
-        and source_file.file_id in saved_files
-    ):
+    # If the file hasn't been modified since the saved manifest was written,
+    # reuse the saved checksum instead of reading and hashing the file. The
+    # contents of non-schema files are loaded later, only if the file is
+    # actually parsed (see load_source_file_contents).
+    skip_loading_file = False
+    if saved_files and source_file.file_id in saved_files:
         old_source_file = saved_files[source_file.file_id]
         if (
             source_file.path.modification_time != 0.0
             and old_source_file.path.modification_time == source_file.path.modification_time
+            and old_source_file.parse_file_type == parse_file_type
         ):
             source_file.checksum = old_source_file.checksum
-            source_file.dfy = old_source_file.dfy
-            skip_loading_schema_file = True
+            if isinstance(source_file, SchemaSourceFile) and isinstance(
+                old_source_file, SchemaSourceFile
+            ):
+                source_file.dfy = old_source_file.dfy
+            skip_loading_file = True
 
-    if not skip_loading_schema_file:
+    if not skip_loading_file:
         # We strip the file_contents before generating the checksum because we want
         # the checksum to match the stored file contents
         file_contents = load_file_contents(path.absolute_path, strip=True)
@@ -84,6 +88,14 @@ def load_source_file(
     return source_file
 
 
+# Load the contents of a file whose checksum was reused from the saved
+# manifest in load_source_file. Schema files don't need this because their
+# parsed yaml dictionary is reused instead.
+def load_source_file_contents(source_file: AnySourceFile) -> None:
+    if source_file.contents is None and isinstance(source_file.path, FilePath):
+        source_file.contents = load_file_contents(source_file.path.absolute_path, strip=True)
+
+
 # Do some minimal validation of the yaml in a schema file.
 # Check version, that key values are lists and that each element in
 # the lists has a 'name' key
@@ -113,8 +125,19 @@ def validate_yaml(file_path, dct):
 
 
 # Special processing for big seed files
-def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
-    if match.seed_too_large():
+def load_seed_source_file(match: FilePath, project_name, saved_files=None) -> SourceFile:
+    file_id = f"{project_name}://{match.original_file_path}"
+    old_source_file = saved_files.get(file_id) if saved_files else None
+    if (
+        old_source_file is not None
+        and match.modification_time != 0.0
+        and old_source_file.path.modification_time == match.modification_time
+    ):
+        # Unmodified since the saved manifest was written, so there's
+        # no need to check the size or hash the contents again.
+        source_file = SourceFile(path=match, checksum=old_source_file.checksum)
+        source_file.contents = ""
+    elif match.seed_too_large():
         # We don't want to calculate a hash of this file. Use the path.
         source_file = SourceFile.big_seed(match)
     else:
@@ -127,16 +150,16 @@ def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
     return source_file
 
 
-# Use the FilesystemSearcher to get a bunch of FilePaths, then turn
+# Use the ProjectFileIndex to get a bunch of FilePaths, then turn
 # them into a bunch of FileSource objects
-def get_source_files(project, paths, extension, parse_file_type, saved_files, ignore_spec):
+def get_source_files(project, paths, extension, parse_file_type, saved_files, file_index):
     # file path list
-    fp_list = filesystem_search(project, paths, extension, ignore_spec)
+    fp_list = file_index.search(paths, extension)
     # file block list
     fb_list = []
     for fp in fp_list:
         if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
+            fb_list.append(load_seed_source_file(fp, project.project_name, saved_files))
         # singular tests live in /tests but only generic tests live
         # in /tests/generic so we want to skip those
         else:
@@ -151,12 +174,12 @@ def get_source_files(project, paths, extension, parse_file_type, saved_files, ig
     return fb_list
 
 
-def read_files_for_parser(project, files, parse_ft, file_type_info, saved_files, ignore_spec):
+def read_files_for_parser(project, files, parse_ft, file_type_info, saved_files, file_index):
     dirs = file_type_info["paths"]
     parser_files = []
     for extension in file_type_info["extensions"]:
         source_files = get_source_files(
-            project, dirs, extension, parse_ft, saved_files, ignore_spec
+            project, dirs, extension, parse_ft, saved_files, file_index
         )
         for sf in source_files:
             files[sf.file_id] = sf
@@ -187,7 +210,7 @@ class ReadFiles(Protocol):
 class ReadFilesFromFileSystem:
     all_projects: Mapping[str, Project]
     files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
-    # saved_files is only used to compare schema files
+    # saved_files is used to skip reading files that haven't been modified
     saved_files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
     # project_parser_files = {
     #   "my_project": {
@@ -204,6 +227,8 @@ class ReadFilesFromFileSystem:
 
     def read_files_for_project(self, project, file_types):
         dbt_ignore_spec = generate_dbt_ignore_spec(project.project_root)
+        # lists each of the project's directories only once for all file types
+        file_index = ProjectFileIndex(project, dbt_ignore_spec)
         project_files = self.project_parser_files[project.project_name] = {}
 
         for parse_ft, file_type_info in file_types.items():
@@ -213,7 +238,7 @@ class ReadFilesFromFileSystem:
                 parse_ft,
                 file_type_info,
                 self.saved_files,
-                dbt_ignore_spec,
+                file_index,
             )
 
 
@@ -30,6 +30,7 @@ from dbt.contracts.files import FileHash
 from dbt.utils import md5, get_pseudo_test_path
 from dbt.clients.jinja import get_rendered, add_rendered_test_kwargs
 from dbt.adapters.factory import get_adapter, get_adapter_package_names
+from dbt.flags import get_flags
 from dbt.node_types import NodeType
 from dbt.context.macro_resolver import MacroResolver
 
@@ -130,8 +131,7 @@ class SchemaGenericTestParser(SimpleParser):
             "file_key_name": file_key_name,
         }
         try:
-            GenericTestNode.validate(dct)
-            return GenericTestNode.from_dict(dct)
+            return self.parse_from_dict(dct, validate=get_flags().VALIDATE_PARSED_NODES)
         except ValidationError as exc:
             # this is a bit silly, but build an UnparsedNode just for error
             # message reasons
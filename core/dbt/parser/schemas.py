@@ -922,3 +922,4 @@ class MacroPatchParser(PatchParser[UnparsedMacroUpdate, ParsedMacroPatch]):
         macro.meta = patch.meta
         macro.docs = patch.docs
         macro.arguments = patch.arguments
+        self.manifest.reset_macro_lookups()
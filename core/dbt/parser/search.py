@@ -1,10 +1,23 @@
+import fnmatch
 import os
+import re
 from dataclasses import dataclass
-from typing import List, Callable, Iterable, Set, Union, Iterator, TypeVar, Generic, Optional
+from typing import (
+    List,
+    Callable,
+    Dict,
+    Iterable,
+    Set,
+    Union,
+    Iterator,
+    TypeVar,
+    Generic,
+    Optional,
+)
 from pathspec import PathSpec  # type: ignore
 
 from dbt.clients.jinja import extract_toplevel_blocks, BlockTag
-from dbt.clients.system import find_matching
+from dbt.clients.system import find_files, find_matching
 from dbt.config import Project
 from dbt.contracts.files import FilePath, AnySourceFile
 from dbt.exceptions import ParsingError, DbtInternalError
@@ -85,6 +98,54 @@ def filesystem_search(
     return file_path_list
 
 
+# The files in a project are searched for by (file type, extension), and a
+# lot of those searches cover the same directories: models are searched for
+# both .sql and .py files, and schema files are searched for in all of the
+# model, seed, snapshot, analysis and macro paths. This lists each directory
+# once and only looks up the modification time of the files that match.
+class ProjectFileIndex:
+    def __init__(self, project: Project, ignore_spec: Optional[PathSpec] = None) -> None:
+        self.project_root = project.project_root
+        self.ignore_spec = ignore_spec
+        self._files_by_dir: Dict[str, List[str]] = {}
+        self._modification_times: Dict[str, float] = {}
+
+    def _files_in(self, relative_dir: str) -> List[str]:
+        key = os.path.normpath(relative_dir)
+        if key not in self._files_by_dir:
+            self._files_by_dir[key] = find_files(self.project_root, relative_dir, self.ignore_spec)
+        return self._files_by_dir[key]
+
+    def _modification_time(self, absolute_path: str) -> float:
+        if absolute_path not in self._modification_times:
+            self._modification_times[absolute_path] = os.path.getmtime(absolute_path)
+        return self._modification_times[absolute_path]
+
+    def search(self, relative_dirs: List[str], extension: str) -> List[FilePath]:
+        """Return the same FilePaths as filesystem_search would."""
+        reobj = re.compile(fnmatch.translate("[!.#~]*" + extension), re.IGNORECASE)
+        root = os.path.normpath(self.project_root)
+        file_path_list = []
+        for relative_dir in relative_dirs:
+            for relative_path in self._files_in(relative_dir):
+                if not reobj.match(os.path.basename(relative_path)):
+                    continue
+                if self.ignore_spec and self.ignore_spec.match_file(
+                    os.path.join(relative_dir, relative_path)
+                ):
+                    continue
+                absolute_path = os.path.join(root, relative_dir, relative_path)
+                file_path_list.append(
+                    FilePath(
+                        searched_path=relative_dir,
+                        relative_path=relative_path,
+                        modification_time=self._modification_time(absolute_path),
+                        project_root=self.project_root,
+                    )
+                )
+        return file_path_list
+
+
 Block = Union[BlockContents, FullBlock]
 
 BlockSearchResult = TypeVar("BlockSearchResult", BlockContents, FullBlock)
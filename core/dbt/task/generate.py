@@ -1,14 +1,20 @@
+import itertools
 import os
 import shutil
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple, Set, Iterable
 import agate
+import pytz
 
 from dbt.dataclass_schema import ValidationError
+from dbt.clients.agate_helper import get_column_value_uncased
 from dbt.clients.system import load_file_contents
 
 from .compile import CompileTask
+from .runnable import RESULT_FILE_NAME
 
+from dbt.adapters.base.impl import GET_RELATION_LAST_MODIFIED_MACRO_NAME
+from dbt.adapters.capability import Capability
 from dbt.adapters.factory import get_adapter
 from dbt.contracts.graph.nodes import ResultNode
 from dbt.contracts.graph.manifest import Manifest
@@ -23,17 +29,20 @@ from dbt.contracts.results import (
     StatsDict,
     ColumnMetadata,
     CatalogArtifact,
+    RunResultsArtifact,
 )
-from dbt.exceptions import DbtInternalError, AmbiguousCatalogMatchError
+from dbt.exceptions import DbtInternalError, DbtRuntimeError, AmbiguousCatalogMatchError
 from dbt.graph import ResourceTypeSelector
 from dbt.node_types import NodeType
 from dbt.include.global_project import DOCS_INDEX_FILE_PATH
+from dbt.events.base_types import EventLevel
 from dbt.events.functions import fire_event
 from dbt.events.types import (
     WriteCatalogFailure,
     CatalogWritten,
     CannotGenerateDocs,
     BuildingCatalog,
+    Note,
 )
 from dbt.parser.manifest import write_manifest
 import dbt.utils
@@ -98,6 +107,59 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
             self[key] = table
         return table
 
+    @classmethod
+    def from_table(cls, catalog_table: agate.Table) -> "Catalog":
+        """Build a catalog straight from the adapter's catalog table.
+
+        Only the first row of each relation is turned into a dictionary, to
+        build the table metadata and stats. Columns are read off each row by
+        position instead.
+        """
+        column_names = catalog_table.column_names
+        required = ("table_schema", "table_name", "column_name", "column_index", "column_type")
+        if not all(name in column_names for name in required):
+            # let the slow path raise its usual errors
+            return cls(
+                [
+                    dict(zip(column_names, map(dbt.utils._coerce_decimal, row)))
+                    for row in catalog_table
+                ]
+            )
+
+        def position(name: str) -> Optional[int]:
+            return column_names.index(name) if name in column_names else None
+
+        database_idx = position("table_database")
+        schema_idx = column_names.index("table_schema")
+        table_name_idx = column_names.index("table_name")
+        name_idx = column_names.index("column_name")
+        index_idx = column_names.index("column_index")
+        type_idx = column_names.index("column_type")
+        comment_idx = position("column_comment")
+
+        catalog = cls([])
+        for row in catalog_table.rows:
+            database = None if database_idx is None else row[database_idx]
+            key = CatalogKey(
+                None if database is None else str(database),
+                str(row[schema_idx]),
+                str(row[table_name_idx]),
+            )
+            table = catalog.get(key)
+            if table is None:
+                table = build_catalog_table(
+                    dict(zip(column_names, map(dbt.utils._coerce_decimal, row)))
+                )
+                catalog[key] = table
+            column = ColumnMetadata(
+                type=row[type_idx],
+                index=int(row[index_idx]),
+                name=row[name_idx],
+                comment=None if comment_idx is None else row[comment_idx],
+            )
+            table.columns[column.name] = column
+        return catalog
+
     def add_column(self, data: PrimitiveDict):
         table = self.get_table(data)
         column_data = get_stripped_prefix(data, "column_")
@@ -180,6 +242,13 @@ def format_stats(stats: PrimitiveDict) -> StatsDict:
     return stats_collector
 
 
+def _as_utc(dt: datetime) -> datetime:
+    # catalog timestamps are naive UTC, database timestamps may be either
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=pytz.UTC)
+    return dt.astimezone(pytz.UTC)
+
+
 def mapping_key(node: ResultNode) -> CatalogKey:
     dkey = dbt.utils.lowercase(node.database)
     return CatalogKey(dkey, node.schema.lower(), node.identifier.lower())
@@ -206,6 +275,14 @@ def get_unique_id_mapping(
 
 class GenerateTask(CompileTask):
     def run(self) -> CatalogArtifact:
+        previous_catalog: Optional[CatalogArtifact] = None
+        nothing_run_since = False
+        if getattr(self.args, "incremental_catalog", False):
+            previous_catalog = self._read_previous_catalog()
+            if previous_catalog is not None:
+                # compiling overwrites run_results.json, so read it first
+                nothing_run_since = self._nothing_run_since(previous_catalog)
+
         compile_results = None
         if self.args.compile:
             compile_results = CompileTask.run(self)
@@ -235,38 +312,66 @@ class GenerateTask(CompileTask):
         if self.manifest is None:
             raise DbtInternalError("self.manifest was None in run!")
 
-        if self.args.empty_catalog:
+        # Get a list of nodes we need from the catalog
+        selected_nodes: Optional[List[ResultNode]] = None
+        if self.job_queue is not None:
+            selected_node_ids = self.job_queue.get_selected_nodes()
+            selected_nodes = self._get_nodes_from_ids(self.manifest, selected_node_ids)
+        if previous_catalog is not None:
+            candidates = selected_nodes
+            if candidates is None:
+                candidates = self._get_nodes_from_ids(
+                    self.manifest, itertools.chain(self.manifest.nodes, self.manifest.sources)
+                )
+            changed_ids = self._get_changed_ids(candidates, previous_catalog, nothing_run_since)
+            if changed_ids is None:
+                fire_event(
+                    Note(
+                        msg="Could not tell which relations changed since the previous "
+                        "catalog was generated, building a full catalog"
+                    ),
+                    level=EventLevel.DEBUG,
+                )
+                previous_catalog = None
+            else:
+                selected_nodes = [
+                    node
+                    for node in candidates
+                    if self._needs_catalog_update(node, previous_catalog, changed_ids)
+                ]
+
+        if self.args.empty_catalog or (previous_catalog is not None and not selected_nodes):
             catalog_table: agate.Table = agate.Table([])
             exceptions: List[Exception] = []
         else:
             adapter = get_adapter(self.config)
             with adapter.connection_named("generate_catalog"):
                 fire_event(BuildingCatalog())
-                # Get a list of relations we need from the catalog
                 relations = None
-                if self.job_queue is not None:
-                    selected_node_ids = self.job_queue.get_selected_nodes()
-                    selected_nodes = self._get_nodes_from_ids(self.manifest, selected_node_ids)
+                if selected_nodes is not None:
                     relations = {
-                        adapter.Relation.create_from(adapter.config, node_id)
-                        for node_id in selected_nodes
+                        adapter.Relation.create_from(adapter.config, node)
+                        for node in selected_nodes
                     }
 
                 # This generates the catalog as an agate.Table
                 catalog_table, exceptions = adapter.get_filtered_catalog(self.manifest, relations)
 
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
-
-        catalog = Catalog(catalog_data)
+        catalog = Catalog.from_table(catalog_table)
 
         errors: Optional[List[str]] = None
         if exceptions:
             errors = [str(e) for e in exceptions]
 
         nodes, sources = catalog.make_unique_id_map(self.manifest)
+        if previous_catalog is not None and selected_nodes is not None:
+            nodes, sources = self._merge_previous_catalog(
+                self.manifest,
+                previous_catalog,
+                {node.unique_id for node in selected_nodes},
+                nodes,
+                sources,
+            )
         results = self.get_catalog_results(
             nodes=nodes,
             sources=sources,
@@ -316,6 +421,131 @@ class GenerateTask(CompileTask):
                 selected.append(source)
         return selected
 
+    def _read_previous_catalog(self) -> Optional[CatalogArtifact]:
+        if self.previous_state is not None:
+            state_dir = self.previous_state.project_root / self.previous_state.state_path
+            path = os.path.join(state_dir, CATALOG_FILENAME)
+        else:
+            path = os.path.join(self.config.project_target_path, CATALOG_FILENAME)
+        if not os.path.isfile(path):
+            return None
+        try:
+            return CatalogArtifact.read_and_check_versions(path)
+        except DbtRuntimeError:
+            # an unreadable or outdated catalog is rebuilt from scratch
+            return None
+
+    def _nothing_run_since(self, previous_catalog: CatalogArtifact) -> bool:
+        """Return whether the run_results.json in the target path was written
+        by the invocation that generated the previous catalog, i.e. no other
+        invocation has built anything in this target since.
+        """
+        if previous_catalog.metadata.invocation_id is None:
+            return False
+        path = os.path.join(self.config.project_target_path, RESULT_FILE_NAME)
+        if not os.path.isfile(path):
+            return False
+        try:
+            run_results = RunResultsArtifact.read_and_check_versions(path)
+        except DbtRuntimeError:
+            return False
+        return run_results.metadata.invocation_id == previous_catalog.metadata.invocation_id
+
+    def _get_changed_ids(
+        self,
+        nodes: List[ResultNode],
+        previous_catalog: CatalogArtifact,
+        nothing_run_since: bool,
+    ) -> Optional[Set[str]]:
+        """Return the unique IDs of the nodes whose relations may have changed
+        since the previous catalog was generated, or None if that can't be
+        determined.
+        """
+        if nothing_run_since:
+            return set()
+        adapter = get_adapter(self.config)
+        if not adapter.supports(Capability.TableLastModifiedMetadata):
+            return None
+        with adapter.connection_named("generate_catalog"):
+            return self._get_modified_ids(
+                adapter, nodes, _as_utc(previous_catalog.metadata.generated_at)
+            )
+
+    def _get_modified_ids(self, adapter, nodes: List[ResultNode], since: datetime) -> Set[str]:
+        """Ask the database when each node's relation was last modified, and
+        return the unique IDs of the nodes that were modified at or after
+        `since`, or whose relations could not be found.
+        """
+        # relations and their unique IDs by (schema, identifier), per information schema
+        grouped: Dict[Any, Tuple[List[Any], Dict[Tuple[str, str], str]]] = {}
+        for node in nodes:
+            relation = adapter.Relation.create_from(adapter.config, node)
+            relations, unique_ids = grouped.setdefault(
+                relation.information_schema_only(), ([], {})
+            )
+            relations.append(relation)
+            unique_ids[
+                (str(relation.schema).lower(), str(relation.identifier).lower())
+            ] = node.unique_id
+
+        modified: Set[str] = set()
+        for information_schema, (relations, unique_ids) in grouped.items():
+            result = adapter.execute_macro(
+                GET_RELATION_LAST_MODIFIED_MACRO_NAME,
+                kwargs={"information_schema": information_schema, "relations": relations},
+                manifest=self.manifest,
+            )
+            unchanged: Set[str] = set()
+            for row in result.table:
+                key = (
+                    str(get_column_value_uncased("schema", row)).lower(),
+                    str(get_column_value_uncased("identifier", row)).lower(),
+                )
+                last_modified = get_column_value_uncased("last_modified", row)
+                if key in unique_ids and last_modified is not None:
+                    if _as_utc(last_modified) < since:
+                        unchanged.add(unique_ids[key])
+            modified.update(set(unique_ids.values()) - unchanged)
+        return modified
+
+    @staticmethod
+    def _needs_catalog_update(
+        node: ResultNode, previous_catalog: CatalogArtifact, changed_ids: Set[str]
+    ) -> bool:
+        if node.unique_id in changed_ids:
+            return True
+        if node.resource_type == NodeType.Source:
+            table = previous_catalog.sources.get(node.unique_id)
+        else:
+            table = previous_catalog.nodes.get(node.unique_id)
+        # the relation is new or has moved since the previous catalog
+        return table is None or table.key() != mapping_key(node)
+
+    @staticmethod
+    def _merge_previous_catalog(
+        manifest: Manifest,
+        previous_catalog: CatalogArtifact,
+        updated_ids: Set[str],
+        nodes: Dict[str, CatalogTable],
+        sources: Dict[str, CatalogTable],
+    ) -> Tuple[Dict[str, CatalogTable], Dict[str, CatalogTable]]:
+        """Keep the previous catalog's tables for the nodes and sources that
+        are still in the manifest and were not queried again.
+        """
+        merged_nodes = {
+            unique_id: table
+            for unique_id, table in previous_catalog.nodes.items()
+            if unique_id in manifest.nodes and unique_id not in updated_ids
+        }
+        merged_nodes.update(nodes)
+        merged_sources = {
+            unique_id: table
+            for unique_id, table in previous_catalog.sources.items()
+            if unique_id in manifest.sources and unique_id not in updated_ids
+        }
+        merged_sources.update(sources)
+        return merged_nodes, merged_sources
+
     def get_node_selector(self) -> ResourceTypeSelector:
         if self.manifest is None or self.graph is None:
             raise DbtInternalError("manifest and graph must be set to perform node selection")
@@ -1,7 +1,7 @@
 import os
 import time
 from abc import abstractmethod
-from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from multiprocessing.dummy import Pool as ThreadPool
 from pathlib import Path
@@ -20,13 +20,16 @@ from dbt.contracts.results import (
     RunningStatus,
     RunResult,
     RunStatus,
+    RunResultsArtifact,
     BaseResult,
 )
 from dbt.contracts.state import PreviousState
+from dbt.events.base_types import EventLevel
 from dbt.events.contextvars import log_contextvars, task_contextvars
 from dbt.events.functions import fire_event, warn_or_error
 from dbt.events.types import (
     Formatting,
+    Note,
     LogCancelLine,
     DefaultSelector,
     NodeStart,
@@ -137,7 +140,25 @@ class GraphRunnableTask(ConfiguredTask):
     def get_graph_queue(self) -> GraphQueue:
         selector = self.get_node_selector()
         spec = self.get_selection_spec()
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, self.get_previous_execution_times())
+
+    def get_previous_execution_times(self) -> Optional[Dict[UniqueId, float]]:
+        """With the critical-path scheduling policy, return the execution time
+        of each node in the previous run, from --state or the target path.
+        """
+        if getattr(get_flags(), "SCHEDULING_POLICY", "depth") != "critical-path":
+            return None
+        results: Optional[RunResultsArtifact] = None
+        if self.previous_state is not None and self.previous_state.results is not None:
+            results = self.previous_state.results
+        elif os.path.isfile(self.result_path()):
+            try:
+                results = RunResultsArtifact.read_and_check_versions(self.result_path())
+            except DbtRuntimeError:
+                results = None
+        if results is None:
+            return None
+        return {UniqueId(result.unique_id): result.execution_time for result in results.results}
 
     def _runtime_initialize(self):
         self.compile_manifest()
@@ -268,6 +289,9 @@ class GraphRunnableTask(ConfiguredTask):
                 raise DbtInternalError("Got to run_queue callback with no job queue set")
             self.job_queue.mark_done(result.node.unique_id)
 
+        started_at = time.time()
+        predicted_makespan = self.job_queue.predicted_makespan(self.config.threads)
+
         while not self.job_queue.empty():
             node = self.job_queue.get()
             self._raise_set_error()
@@ -290,6 +314,25 @@ class GraphRunnableTask(ConfiguredTask):
             # wait until every task will be complete
             self.job_queue.join()
 
+        fire_event(
+            Note(
+                msg=(
+                    f"Held the job queue lock for {self.job_queue.lock_hold_time:.3f}s, "
+                    f"at most {self.job_queue.max_lock_hold_time:.3f}s at a time"
+                )
+            ),
+            level=EventLevel.DEBUG,
+        )
+        if predicted_makespan is not None:
+            fire_event(
+                Note(
+                    msg=(
+                        f"Critical path schedule: predicted to take {predicted_makespan:.2f}s, "
+                        f"took {time.time() - started_at:.2f}s"
+                    )
+                )
+            )
+
         # if an error got set during join(), raise it.
         self._raise_set_error()
 
@@ -485,14 +528,26 @@ class GraphRunnableTask(ConfiguredTask):
                 )
             )
 
-        if self.args.write_json:
-            write_manifest(self.manifest, self.config.project_target_path)
-            if hasattr(result, "write"):
-                result.write(self.result_path())
-
-        self.task_end_messages(result.results)
+        if self.args.write_json and not self.config.args.single_threaded:
+            # write the artifacts on a dedicated thread while the end of run
+            # messages are printed
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts") as tpe:
+                written = tpe.submit(self._write_artifacts, result)
+                self.task_end_messages(result.results)
+            written.result()
+        else:
+            if self.args.write_json:
+                self._write_artifacts(result)
+            self.task_end_messages(result.results)
         return result
 
+    def _write_artifacts(self, result) -> None:
+        if self.manifest is None:
+            raise DbtInternalError("manifest was None in _write_artifacts")
+        write_manifest(self.manifest, self.config.project_target_path)
+        if hasattr(result, "write"):
+            result.write(self.result_path())
+
     @classmethod
     def interpret_results(cls, results):
         if results is None:
@@ -12,6 +12,7 @@ from dbt.adapters.factory import Adapter
 from dbt.cli.main import dbtRunner
 from dbt.logger import log_manager
 from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.manifest import read_partial_parse_header, read_partial_parse_manifest
 from dbt.events.functions import (
     fire_event,
     capture_stdout_logs,
@@ -153,8 +154,8 @@ def get_manifest(project_root) -> Optional[Manifest]:
     path = os.path.join(project_root, "target", "partial_parse.msgpack")
     if os.path.exists(path):
         with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+            read_partial_parse_header(fp)
+            manifest: Manifest = read_partial_parse_manifest(fp)
         return manifest
     else:
         return None
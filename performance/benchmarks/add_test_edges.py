@@ -0,0 +1,78 @@
+"""Benchmark Linker.add_test_edges, which `dbt build` uses to make nodes wait
+for the tests of their upstream nodes, on a synthetic layered DAG.
+
+    python performance/benchmarks/add_test_edges.py --nodes 20000
+
+The graph has the shape of a typical project: sources feed staging models,
+which feed several layers of intermediate and mart models. Every model gets a
+`unique` and a `not_null` test and one in ten gets a relationship test.
+"""
+import argparse
+import random
+import time
+from unittest import mock
+
+from dbt.compilation import Linker
+from dbt.node_types import NodeType
+
+
+def build_graph(num_nodes: int, seed: int):
+    rng = random.Random(seed)
+    linker = Linker()
+    test_depends_on = {}
+    layers = [[f"source.s{i}" for i in range(max(1, num_nodes // 20))]]
+    for node_id in layers[0]:
+        linker.add_node(node_id)
+
+    # split the models (and their tests) across six layers
+    models_per_layer = max(1, num_nodes // 4 // 6)
+    for depth in range(6):
+        layer = []
+        for i in range(models_per_layer):
+            node_id = f"model.l{depth}_m{i}"
+            parents = rng.sample(layers[-1], min(len(layers[-1]), rng.randint(1, 3)))
+            if depth > 1 and rng.random() < 0.3:
+                parents += rng.sample(layers[-2], 1)
+            for parent_id in parents:
+                linker.dependency(node_id, parent_id)
+            test_depends_on[f"test.unique_{node_id}"] = [node_id]
+            test_depends_on[f"test.not_null_{node_id}"] = [node_id]
+            if rng.random() < 0.1:
+                test_depends_on[f"test.relationships_{node_id}"] = [node_id, parents[0]]
+            layer.append(node_id)
+        layers.append(layer)
+
+    nodes = {}
+    child_map = {}
+    for test_id, depends_on in test_depends_on.items():
+        for dependency in depends_on:
+            linker.dependency(test_id, dependency)
+            child_map.setdefault(dependency, []).append(test_id)
+        nodes[test_id] = mock.Mock(resource_type=NodeType.Test, depends_on_nodes=depends_on)
+    for layer in layers[1:]:
+        for node_id in layer:
+            nodes[node_id] = mock.Mock(resource_type=NodeType.Model, depends_on_nodes=[])
+    manifest = mock.Mock(nodes=nodes, child_map=child_map)
+    return linker, manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nodes", type=int, default=20000, help="approximate size of the graph")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    linker, manifest = build_graph(args.nodes, args.seed)
+    num_nodes = linker.graph.number_of_nodes()
+    num_edges = linker.graph.number_of_edges()
+
+    start = time.perf_counter()
+    linker.add_test_edges(manifest)
+    elapsed = time.perf_counter() - start
+
+    added = linker.graph.number_of_edges() - num_edges
+    print(f"{num_nodes} nodes, {num_edges} edges: added {added} test edges in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark Graph.get_subset_graph, which builds the graph of the selected
+nodes that the job queue runs, on a synthetic layered DAG.
+
+    python performance/benchmarks/get_subset_graph.py --nodes 12000
+
+The graph has the shape of a typical project: sources feed staging models,
+which feed several layers of intermediate and mart models, and every model has
+a couple of tests. The subset graph is built for selections of a few different
+sizes, from a narrow `-s tag:nightly` style selection to every model.
+"""
+import argparse
+import random
+import time
+
+from dbt.compilation import Linker
+from dbt.graph.graph import Graph
+
+
+def build_graph(num_nodes: int, seed: int):
+    rng = random.Random(seed)
+    linker = Linker()
+    layers = [[f"source.s{i}" for i in range(max(1, num_nodes // 20))]]
+    for node_id in layers[0]:
+        linker.add_node(node_id)
+
+    # split the models (and their tests) across six layers
+    models_per_layer = max(1, num_nodes // 3 // 6)
+    for depth in range(6):
+        layer = []
+        for i in range(models_per_layer):
+            node_id = f"model.l{depth}_m{i}"
+            parents = rng.sample(layers[-1], min(len(layers[-1]), rng.randint(1, 3)))
+            if depth > 1 and rng.random() < 0.3:
+                parents += rng.sample(layers[-2], 1)
+            for parent_id in parents:
+                linker.dependency(node_id, parent_id)
+            linker.dependency(f"test.unique_{node_id}", node_id)
+            linker.dependency(f"test.not_null_{node_id}", node_id)
+            layer.append(node_id)
+        layers.append(layer)
+
+    models = [node_id for layer in layers[1:] for node_id in layer]
+    return Graph(linker.graph), models
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nodes", type=int, default=12000, help="approximate size of the graph")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    graph, models = build_graph(args.nodes, args.seed)
+    rng = random.Random(args.seed)
+    num_nodes = graph.graph.number_of_nodes()
+    num_edges = graph.graph.number_of_edges()
+    print(f"{num_nodes} nodes, {num_edges} edges")
+
+    for fraction in (0.01, 0.1, 0.5, 1.0):
+        selected = set(rng.sample(models, max(1, int(len(models) * fraction))))
+        start = time.perf_counter()
+        subset = graph.get_subset_graph(selected)
+        elapsed = time.perf_counter() - start
+        print(
+            f"selected {len(selected)} models: "
+            f"{subset.graph.number_of_edges()} edges in {elapsed:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
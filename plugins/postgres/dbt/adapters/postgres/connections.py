@@ -6,12 +6,12 @@ from psycopg2.extensions import string_types
 import dbt.exceptions
 from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
-from dbt.contracts.connection import AdapterResponse
+from dbt.contracts.connection import AdapterResponse, Connection
 from dbt.events import AdapterLogger
 
 from dbt.helper_types import Port
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple
 from typing_extensions import Annotated
 from mashumaro.jsonschema.annotations import Maximum, Minimum
 
@@ -67,6 +67,48 @@ class PostgresCredentials(Credentials):
         )
 
 
+# Escapes for the text format of "copy ... from stdin"
+COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+class CopyRowsReader:
+    """A file-like object that renders rows in the text format of
+    "copy ... from stdin" as they are read, so the rows to load never have
+    to be rendered into one large string.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        self._lines: Iterator[str] = (self.format_row(row) for row in rows)
+        self._buffer = ""
+
+    @staticmethod
+    def format_value(value: Any) -> str:
+        if value is None:
+            return "\\N"
+        elif isinstance(value, bool):
+            return "t" if value else "f"
+        return str(value).translate(COPY_TEXT_ESCAPES)
+
+    @classmethod
+    def format_row(cls, row: Sequence[Any]) -> str:
+        return "\t".join(cls.format_value(value) for value in row) + "\n"
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            length += len(line)
+        data = "".join(chunks)
+        if size < 0:
+            size = len(data)
+        self._buffer = data[size:]
+        return data[:size]
+
+
 class PostgresConnectionManager(SQLConnectionManager):
     TYPE = "postgres"
 
@@ -193,6 +235,38 @@ class PostgresConnectionManager(SQLConnectionManager):
     def get_credentials(cls, credentials):
         return credentials
 
+    @classmethod
+    def reset_pooled_handle(cls, connection: Connection) -> None:
+        super().reset_pooled_handle(connection)
+        # Reset the session, so that settings, temp tables and the like from
+        # one node don't leak into the next one that leases the handle.
+        # "discard all" can't run in a transaction, so end the one psycopg2
+        # may have started implicitly and run it in autocommit mode.
+        handle = connection.handle
+        handle.rollback()
+        handle.autocommit = True
+        try:
+            cursor = handle.cursor()
+            cursor.execute("discard all")
+            # that also resets the role set when the connection was opened
+            credentials = cls.get_credentials(connection.credentials)
+            if credentials.role:
+                cursor.execute("set role {}".format(credentials.role))
+        finally:
+            handle.autocommit = False
+
+    def copy_from(
+        self, sql: str, rows: Iterable[Sequence[Any]], auto_begin: bool = True
+    ) -> Tuple[Connection, Any]:
+        """Run a "copy ... from stdin" statement in the current transaction,
+        streaming the given rows to it.
+        """
+        return self.run_with_cursor(
+            sql,
+            lambda cursor: cursor.copy_expert(sql, CopyRowsReader(rows)),
+            auto_begin=auto_begin,
+        )
+
     @classmethod
     def get_response(cls, cursor) -> AdapterResponse:
         message = str(cursor.statusmessage)
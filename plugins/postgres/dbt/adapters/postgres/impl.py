@@ -2,6 +2,8 @@ from datetime import datetime
 from dataclasses import dataclass
 from typing import Any, Optional, Set, List
 
+import agate
+
 from dbt.adapters.base.meta import available
 from dbt.adapters.base.impl import AdapterConfig, ConstraintSupport
 from dbt.adapters.capability import CapabilitySupport, Support, CapabilityDict, Capability
@@ -9,6 +11,7 @@ from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.postgres import PostgresConnectionManager
 from dbt.adapters.postgres.column import PostgresColumn
 from dbt.adapters.postgres import PostgresRelation
+from dbt.clients import agate_helper
 from dbt.dataclass_schema import dbtClassMixin, ValidationError
 from dbt.contracts.graph.nodes import ConstraintType
 from dbt.exceptions import (
@@ -62,6 +65,7 @@ class PostgresConfig(AdapterConfig):
 class PostgresAdapter(SQLAdapter):
     Relation = PostgresRelation
     ConnectionManager = PostgresConnectionManager
+    connections: PostgresConnectionManager
     Column = PostgresColumn
 
     AdapterSpecificConfigs = PostgresConfig
@@ -98,6 +102,19 @@ class PostgresAdapter(SQLAdapter):
     def parse_index(self, raw_index: Any) -> Optional[PostgresIndexConfig]:
         return PostgresIndexConfig.parse(raw_index)
 
+    @available
+    def bulk_load_csv_rows(
+        self, relation: PostgresRelation, column_names_sql: str, agate_table: agate.Table
+    ) -> Optional[str]:
+        # Inserted timestamps with a time zone are converted to the session's
+        # time zone, but copy ignores the offset for columns without one, so
+        # keep inserting those to load the same values.
+        if any(isinstance(t, agate_helper.ISODateTime) for t in agate_table.column_types):
+            return None
+        sql = f"copy {relation.render()} ({column_names_sql}) from stdin"
+        self.connections.copy_from(sql, agate_table.rows)
+        return sql
+
     def _link_cached_database_relations(self, schemas: Set[str]):
         """
         :param schemas: The set of schemas that should have links added.
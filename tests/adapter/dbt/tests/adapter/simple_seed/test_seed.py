@@ -125,6 +125,19 @@ class TestSeedConfigFullRefreshOff(SeedTestBase):
         )
 
 
+class TestSeedConfigBulkLoadOff(SeedTestBase):
+    @pytest.fixture(scope="class")
+    def project_config_update(self):
+        return {
+            "seeds": {"quote_columns": False, "bulk_load": False},
+        }
+
+    def test_simple_seed_bulk_load_config(self, project):
+        """Seeds that opt out of bulk loading are inserted in batches with the same result"""
+        self._build_relations_for_test(project)
+        self._check_relation_end_state(run_result=run_dbt(["seed"]), project=project, exists=True)
+
+
 class TestSeedCustomSchema(SeedTestBase):
     @pytest.fixture(scope="class", autouse=True)
     def setUp(self, project):
@@ -4,6 +4,7 @@ from dbt.tests.util import run_dbt, run_dbt_and_capture
 
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import RefArgs
+from dbt.parser.manifest import read_partial_parse_header, read_partial_parse_manifest
 import os
 
 
@@ -11,8 +12,8 @@ def get_manifest():
     path = "./target/partial_parse.msgpack"
     if os.path.exists(path):
         with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+            read_partial_parse_header(fp)
+            manifest: Manifest = read_partial_parse_manifest(fp)
         return manifest
     else:
         return None
@@ -1,4 +1,7 @@
+import threading
+import time
 import unittest
+from argparse import Namespace
 from unittest import mock
 import sys
 
@@ -8,6 +11,7 @@ import psycopg2
 
 from dbt.contracts.connection import Connection
 from dbt.adapters.base import BaseConnectionManager
+from dbt.adapters.base.connections import ConnectionPool
 from dbt.adapters.postgres import PostgresCredentials, PostgresConnectionManager
 from dbt.events import AdapterLogger
 
@@ -492,3 +496,167 @@ class PostgresConnectionManagerTest(unittest.TestCase):
         assert attempt == 3
         assert conn.state == "open"
         assert conn.handle is True
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.credentials = PostgresCredentials(
+            host="localhost",
+            user="test-user",
+            port=1111,
+            password="test-password",
+            database="test-db",
+            schema="test-schema",
+        )
+        self.profile = mock.MagicMock(credentials=self.credentials)
+        self.opened = []
+
+        def open_connection(connection):
+            handle = mock.MagicMock()
+            self.opened.append(handle)
+            connection.handle = handle
+            connection.state = "open"
+            return connection
+
+        patcher = mock.patch.object(PostgresConnectionManager, "open", side_effect=open_connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_manager(self, pool_size):
+        flags = Namespace(CONNECTION_POOL_SIZE=pool_size)
+        with mock.patch("dbt.flags.get_flags", return_value=flags):
+            return PostgresConnectionManager(self.profile)
+
+    def in_worker_thread(self, func):
+        # connections of the main thread aren't pooled
+        errors = []
+
+        def run():
+            try:
+                func()
+            except BaseException as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join(5)
+        if errors:
+            raise errors[0]
+
+    def test_not_pooled_by_default(self):
+        manager = self.make_manager(None)
+        assert manager.pool is None
+
+        for name in ("a", "b"):
+            manager.set_connection_name(name).handle
+            manager.release()
+
+        assert len(self.opened) == 2
+        for handle in self.opened:
+            handle.close.assert_called_once()
+
+    def test_handles_are_reused(self):
+        manager = self.make_manager(2)
+
+        def first():
+            conn = manager.set_connection_name("a")
+            handle = conn.handle
+            conn.transaction_open = True
+            manager.release()
+
+            assert conn.state == "closed"
+            assert conn.transaction_open is False
+            handle.rollback.assert_called()
+            handle.cursor.return_value.execute.assert_called_once_with("discard all")
+            handle.close.assert_not_called()
+
+        def second():
+            conn = manager.set_connection_name("b")
+            assert conn.handle is self.opened[0]
+            manager.release()
+
+        self.in_worker_thread(first)
+        self.in_worker_thread(second)
+        handle = self.opened[0]
+
+        assert len(self.opened) == 1
+        assert manager.pool.stats.leases == 2
+        assert manager.pool.stats.connects == 1
+
+        manager.cleanup_all()
+        handle.close.assert_called_once()
+
+    def test_broken_handles_are_closed(self):
+        manager = self.make_manager(1)
+
+        def first():
+            conn = manager.set_connection_name("a")
+            handle = conn.handle
+            handle.rollback.side_effect = psycopg2.errors.AdminShutdown("gone")
+            conn.transaction_open = True
+            manager.release()
+            handle.close.assert_called_once()
+
+        def second():
+            conn = manager.set_connection_name("b")
+            assert conn.handle is not self.opened[0]
+
+        self.in_worker_thread(first)
+        self.in_worker_thread(second)
+        assert len(self.opened) == 2
+
+    def test_reset_restores_role(self):
+        self.credentials.role = "transformer"
+        manager = self.make_manager(1)
+
+        def lease():
+            manager.set_connection_name("a").handle
+            manager.release()
+
+        self.in_worker_thread(lease)
+        execute = self.opened[0].cursor.return_value.execute
+        assert execute.call_args_list == [mock.call("discard all"), mock.call("set role transformer")]
+
+    def test_main_thread_does_not_take_a_slot(self):
+        manager = self.make_manager(1)
+        main_handle = manager.set_connection_name("master").handle
+        # a worker can still lease the only handle while the main thread holds its own
+        self.in_worker_thread(lambda: manager.set_connection_name("worker").handle)
+        assert manager.pool.stats.leases == 1
+        assert len(self.opened) == 2
+
+        manager.release()
+        main_handle.close.assert_called_once()
+        assert not manager.pool.drain()
+
+    def test_leases_are_bounded(self):
+        manager = self.make_manager(1)
+        first_leased = threading.Event()
+        second_waiting = threading.Event()
+
+        def first():
+            manager.set_connection_name("first").handle
+            first_leased.set()
+            second_waiting.wait(5)
+            time.sleep(0.05)
+            manager.release()
+
+        def second():
+            first_leased.wait(5)
+            second_waiting.set()
+            manager.set_connection_name("second").handle
+            manager.release()
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(self.opened) == 1
+        assert manager.pool.stats.leases == 2
+        assert manager.pool.stats.max_acquire_wait > 0
+
+    def test_pool_size_must_be_positive(self):
+        with self.assertRaises(dbt.exceptions.DbtRuntimeError):
+            ConnectionPool(0)
@@ -1,4 +1,6 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import agate
 
@@ -70,6 +72,29 @@ class TestAgateHelper(unittest.TestCase):
         for idx, row in enumerate(tbl):
             self.assertEqual(list(row), EXPECTED[idx])
 
+    def test_from_csv_types_from_sample(self):
+        path = os.path.join(self.tempdir, "input.csv")
+        with open(path, "wb") as fp:
+            fp.write(SAMPLE_CSV_DATA.encode("utf-8"))
+        with mock.patch.object(agate_helper, "CSV_TYPE_INFERENCE_SAMPLE_SIZE", 1):
+            tbl = agate_helper.from_csv(path, ())
+        self.assertEqual(len(tbl), len(EXPECTED))
+        for idx, row in enumerate(tbl):
+            self.assertEqual(list(row), EXPECTED[idx])
+
+    def test_from_csv_sample_types_do_not_fit(self):
+        path = os.path.join(self.tempdir, "input.csv")
+        with open(path, "wb") as fp:
+            fp.write("a,b\n1,2020-01-01\n2,2020-01-02\nthree,2020-01-03 10:00:00".encode("utf-8"))
+        with mock.patch.object(agate_helper, "CSV_TYPE_INFERENCE_SAMPLE_SIZE", 2):
+            tbl = agate_helper.from_csv(path, ())
+        for column_type in tbl.column_types:
+            self.assertIsInstance(column_type, agate.data_types.Text)
+        self.assertEqual(list(tbl.columns["a"]), ["1", "2", "three"])
+        self.assertEqual(
+            list(tbl.columns["b"]), ["2020-01-01", "2020-01-02", "2020-01-03 10:00:00"]
+        )
+
     def test_from_csv_all_reserved(self):
         path = os.path.join(self.tempdir, "input.csv")
         with open(path, "wb") as fp:
@@ -106,6 +131,45 @@ class TestAgateHelper(unittest.TestCase):
         for idx, row in enumerate(tbl):
             self.assertEqual(list(row), EXPECTED[idx])
 
+    def test_table_from_rows_flat(self):
+        column_names = ["a", "b", "c", "d"]
+        rows = [(1, "0005", [1, 2], True), (2, "null", None, False)]
+
+        with mock.patch.object(
+            agate_helper, "table_from_rows", wraps=agate_helper.table_from_rows
+        ) as m:
+            tbl = agate_helper.table_from_rows_flat(rows, column_names)
+            m.assert_not_called()
+            self.assertIsInstance(tbl, agate.Table)
+            self.assertEqual(len(tbl), 2)
+            m.assert_called_once()
+
+        self.assertEqual(tbl.column_names, tuple(column_names))
+        assert isinstance(tbl.column_types[0], agate_helper.Integer)
+        assert isinstance(tbl.column_types[1], agate.data_types.Text)
+        assert isinstance(tbl.column_types[2], agate.data_types.Text)
+        assert isinstance(tbl.column_types[3], agate.data_types.Boolean)
+        self.assertEqual(
+            [list(row) for row in tbl], [[1, "0005", "[1, 2]", True], [2, "null", None, False]]
+        )
+
+    def test_table_from_rows_flat_build_failure_is_retried(self):
+        tbl = agate_helper.table_from_rows_flat([(1, "a")], ["a", "b"])
+        with mock.patch.object(agate_helper, "table_from_rows", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                len(tbl)
+        self.assertEqual([list(row) for row in tbl], [[1, "a"]])
+
+    def test_table_from_rows_flat_builds_once_across_threads(self):
+        tbl = agate_helper.table_from_rows_flat([(1, "a")], ["a", "b"])
+        with mock.patch.object(
+            agate_helper, "table_from_rows", wraps=agate_helper.table_from_rows
+        ) as m:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                lengths = list(pool.map(lambda _: len(tbl), range(32)))
+            m.assert_called_once()
+        self.assertEqual(lengths, [1] * 32)
+
     def test_datetime_formats(self):
         path = os.path.join(self.tempdir, "input.csv")
         datetimes = [
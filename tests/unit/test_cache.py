@@ -522,3 +522,46 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 1)
         self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+    def assert_references_consistent(self):
+        expected = {key: set() for key in self.cache.relations}
+        for key, relation in self.cache.relations.items():
+            self.assertEqual(relation.key(), key)
+            for dependent_key in relation.referenced_by:
+                self.assertIn(dependent_key, self.cache.relations)
+                expected[dependent_key].add(key)
+        for key, relation in self.cache.relations.items():
+            self.assertEqual(relation.references, expected[key])
+
+    def test_references_follow_renames_and_drops(self):
+        self.assert_references_consistent()
+        self.cache.rename(
+            make_relation("dbt", "foo", "table3"), make_relation("dbt", "bar", "table5")
+        )
+        self.assert_references_consistent()
+        self.assertEqual(
+            self.cache.relations[("dbt", "bar", "table3")].references,
+            {("dbt", "bar", "table5")},
+        )
+        self.cache.drop(make_relation("dbt", "foo", "table4"))
+        self.assert_references_consistent()
+        self.assertEqual(
+            set(self.cache.relations[("dbt", "foo", "table1")].referenced_by),
+            {("dbt", "bar", "table5"), ("dbt_2", "foo", "table1")},
+        )
+        self.cache.drop(make_relation("dbt", "bar", "table5"))
+        self.assert_references_consistent()
+        self.assertEqual(len(self.cache.relations), 4)
+
+    def test_drop_schema(self):
+        self.cache.drop_schema("dbt", "foo")
+        self.assertEqual(len(self.cache.get_relations("dbt", "foo")), 0)
+        self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 1)
+        self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 1)
+        self.assertEqual(self.cache.schemas, {("dbt", "bar"), ("dbt_2", "foo")})
+        self.assert_references_consistent()
+
+    def test_clear(self):
+        self.cache.clear()
+        self.assertEqual(self.cache.get_relations("dbt", "foo"), [])
+        self.assertEqual(self.cache.relations, {})
@@ -494,6 +494,54 @@ def test_macro_namespace(config_postgres, manifest_fx):
         assert result["some_macro"].macro is package_macro
 
 
+def test_macro_namespace_index_is_shared(config_postgres, manifest_fx):
+    index = macros.get_macro_namespace_index(manifest_fx, "root", ["dbt_postgres", "dbt"])
+    assert macros.get_macro_namespace_index(manifest_fx, "root", ["dbt_postgres", "dbt"]) is index
+
+    # a different set of internal packages can't reuse the index
+    other = macros.get_macro_namespace_index(manifest_fx, "root", ["dbt"])
+    assert other is not index
+
+    # removing a macro from the manifest resets the index, like
+    # Manifest.remove_macro does
+    manifest_fx.macros.pop("macro.root.macro_b")
+    manifest_fx._macro_namespace_index = None
+    index = macros.get_macro_namespace_index(manifest_fx, "root", ["dbt"])
+    assert index is not other
+    assert set(index.packages["root"]) == {"macro_a"}
+
+
+def test_macro_namespace_binds_lazily(config_postgres, manifest_fx):
+    index = macros.MacroNamespaceIndex.from_macros(
+        manifest_fx.macros.values(), "root", ["dbt_postgres", "dbt"]
+    )
+    ctx = {}
+    namespace = macros.MacroNamespace.from_index(index, "root", ctx)
+    assert namespace._bound == {}
+
+    macro_a = namespace["macro_a"]
+    assert macro_a.macro is manifest_fx.macros["macro.root.macro_a"]
+    assert macro_a.context is ctx
+    assert list(namespace._bound) == ["macro.root.macro_a"]
+    # the same generator is returned through the package namespace
+    assert namespace["root"]["macro_a"] is macro_a
+    assert namespace.get_from_package("root", "macro_a") is macro_a
+
+
+def test_macro_namespace_root_overrides_internal_search_package(config_postgres, manifest_fx):
+    dbt_macro = mock_macro("some_macro", "dbt")
+    root_macro = mock_macro("some_macro", "root")
+    index = macros.MacroNamespaceIndex.from_macros(
+        itertools.chain(manifest_fx.macros.values(), [dbt_macro, root_macro]),
+        "root",
+        ["dbt_postgres", "dbt"],
+    )
+    # e.g. execute_macro with project="dbt"
+    namespace = macros.MacroNamespace.from_index(index, "dbt", {})
+    assert namespace["some_macro"].macro is root_macro
+    assert namespace["dbt"]["some_macro"].macro is dbt_macro
+
+
 def test_dbt_metadata_envs(
     monkeypatch, config_postgres, manifest_fx, get_adapter, get_include_paths
 ):
@@ -1,7 +1,11 @@
+from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest import mock
 import unittest
 
+import dbt.utils
+from dbt.clients import agate_helper
+from dbt.node_types import NodeType
 from dbt.task import generate
 
 
@@ -329,3 +333,175 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+    def test__from_table_matches_columns(self):
+        column_names = [
+            "table_database",
+            "table_schema",
+            "table_name",
+            "table_type",
+            "table_comment",
+            "table_owner",
+            "column_name",
+            "column_index",
+            "column_type",
+            "column_comment",
+            "stats:rows:label",
+            "stats:rows:value",
+            "stats:rows:description",
+            "stats:rows:include",
+        ]
+        rows = [
+            ("db", "sch", "a", "BASE TABLE", None, "me", "id", 1, "integer", None)
+            + ("Rows", 10, "Row count", True),
+            ("db", "sch", "a", "BASE TABLE", None, "me", "name", 2, "text", "the name")
+            + ("Rows", 10, "Row count", True),
+            ("db", "sch", "b", "VIEW", "a view", "me", "id", 1, "integer", None)
+            + ("Rows", None, "Row count", False),
+        ]
+        table = agate_helper.table_from_rows(rows, column_names)
+        columns = [dict(zip(column_names, map(dbt.utils._coerce_decimal, row))) for row in table]
+
+        result = generate.Catalog.from_table(table)
+
+        expected = generate.Catalog(columns)
+        self.assertEqual(list(result), list(expected))
+        for key, catalog_table in expected.items():
+            self.assertEqual(result[key].to_dict(), catalog_table.to_dict())
+        self.assertEqual(result[generate.CatalogKey("db", "sch", "a")].columns["id"].index, 1)
+
+
+def make_catalog_table(schema, name, unique_id):
+    return generate.CatalogTable(
+        metadata=generate.TableMetadata(type="BASE TABLE", schema=schema, name=name),
+        columns={},
+        stats={},
+        unique_id=unique_id,
+    )
+
+
+class IncrementalCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.previous_catalog = generate.CatalogArtifact.from_results(
+            generated_at=datetime.utcnow(),
+            nodes={
+                "model.a": make_catalog_table("sch", "a", "model.a"),
+                "model.b": make_catalog_table("sch", "b", "model.b"),
+                "model.gone": make_catalog_table("sch", "gone", "model.gone"),
+            },
+            sources={"source.s": make_catalog_table("raw", "s", "source.s")},
+            compile_results=None,
+            errors=None,
+        )
+
+    def make_node(self, unique_id, schema, identifier, resource_type=NodeType.Model):
+        return mock.MagicMock(
+            unique_id=unique_id,
+            resource_type=resource_type,
+            database=None,
+            schema=schema,
+            identifier=identifier,
+        )
+
+    def test_needs_catalog_update(self):
+        needs_update = generate.GenerateTask._needs_catalog_update
+        self.assertFalse(
+            needs_update(self.make_node("model.a", "sch", "a"), self.previous_catalog, set())
+        )
+        self.assertTrue(
+            needs_update(self.make_node("model.a", "sch", "a"), self.previous_catalog, {"model.a"})
+        )
+        # moved to another schema
+        self.assertTrue(
+            needs_update(self.make_node("model.b", "other", "b"), self.previous_catalog, set())
+        )
+        # not in the previous catalog
+        self.assertTrue(
+            needs_update(self.make_node("model.c", "sch", "c"), self.previous_catalog, set())
+        )
+        source = self.make_node("source.s", "raw", "s", NodeType.Source)
+        self.assertFalse(needs_update(source, self.previous_catalog, set()))
+
+    def test_merge_previous_catalog(self):
+        manifest = mock.MagicMock(
+            nodes={"model.a": None, "model.b": None, "model.c": None},
+            sources={"source.s": None},
+        )
+        new_b = make_catalog_table("other", "b", "model.b")
+        nodes, sources = generate.GenerateTask._merge_previous_catalog(
+            manifest,
+            self.previous_catalog,
+            {"model.b", "model.c"},
+            {"model.b": new_b},
+            {},
+        )
+        self.assertEqual(
+            nodes, {"model.a": self.previous_catalog.nodes["model.a"], "model.b": new_b}
+        )
+        self.assertEqual(sources, self.previous_catalog.sources)
+
+    def make_task(self, supports_last_modified=False, last_modified_rows=()):
+        task = generate.GenerateTask.__new__(generate.GenerateTask)
+        task.config = mock.MagicMock(project_target_path="target")
+        task.manifest = mock.MagicMock()
+        adapter = mock.MagicMock()
+        adapter.supports.return_value = supports_last_modified
+        adapter.Relation.create_from.side_effect = lambda config, node: mock.MagicMock(
+            schema=node.schema, identifier=node.identifier
+        )
+        adapter.execute_macro.return_value = mock.MagicMock(
+            table=agate_helper.table_from_data_flat(
+                [
+                    {"schema": s, "identifier": i, "last_modified": m}
+                    for s, i, m in last_modified_rows
+                ],
+                ["schema", "identifier", "last_modified"],
+            )
+        )
+        return task, adapter
+
+    def test_changed_ids_when_nothing_run_since(self):
+        task, adapter = self.make_task()
+        nodes = [self.make_node("model.a", "sch", "a")]
+        with mock.patch.object(generate, "get_adapter", return_value=adapter):
+            self.assertEqual(task._get_changed_ids(nodes, self.previous_catalog, True), set())
+        adapter.execute_macro.assert_not_called()
+
+    def test_changed_ids_unknown_without_last_modified(self):
+        task, adapter = self.make_task(supports_last_modified=False)
+        nodes = [self.make_node("model.a", "sch", "a")]
+        with mock.patch.object(generate, "get_adapter", return_value=adapter):
+            self.assertIsNone(task._get_changed_ids(nodes, self.previous_catalog, False))
+
+    def test_changed_ids_from_last_modified(self):
+        generated_at = self.previous_catalog.metadata.generated_at
+        before = generated_at - timedelta(hours=1)
+        after = generated_at + timedelta(hours=1)
+        task, adapter = self.make_task(
+            supports_last_modified=True,
+            last_modified_rows=[("SCH", "A", before), ("sch", "b", after)],
+        )
+        nodes = [
+            self.make_node("model.a", "sch", "a"),
+            self.make_node("model.b", "sch", "b"),
+            # not reported by the database
+            self.make_node("source.s", "raw", "s", NodeType.Source),
+        ]
+        with mock.patch.object(generate, "get_adapter", return_value=adapter):
+            self.assertEqual(
+                task._get_changed_ids(nodes, self.previous_catalog, False),
+                {"model.b", "source.s"},
+            )
+
+    def test_nothing_run_since(self):
+        task, _ = self.make_task()
+        run_results = mock.MagicMock()
+        run_results.metadata.invocation_id = self.previous_catalog.metadata.invocation_id
+        with mock.patch("os.path.isfile", return_value=True), mock.patch.object(
+            generate.RunResultsArtifact, "read_and_check_versions", return_value=run_results
+        ):
+            self.assertTrue(task._nothing_run_since(self.previous_catalog))
+            run_results.metadata.invocation_id = "another-invocation"
+            self.assertFalse(task._nothing_run_since(self.previous_catalog))
+        with mock.patch("os.path.isfile", return_value=False):
+            self.assertFalse(task._nothing_run_since(self.previous_catalog))
@@ -6,12 +6,14 @@ from typing import TypeVar
 import pytest
 
 from dbt.contracts.results import TimingInfo, RunResult, RunStatus
+import dbt.events.eventmgr
 from dbt.events import AdapterLogger, types
 from dbt.events.base_types import (
     BaseEvent,
     DebugLevel,
     DynamicLevel,
     ErrorLevel,
+    EventLevel,
     InfoLevel,
     TestLevel,
     WarnLevel,
@@ -546,3 +548,38 @@ def test_single_run_error():
         # attempt at unit testing events, and we need to think about how it
         # could be done in a thread safe way in the long run.
         ctx_set_event_manager(EventManager())
+
+
+def test_event_manager_skips_unconsumed_events(mocker):
+    from io import StringIO
+    from dbt.events.logger import LoggerConfig
+
+    stream = StringIO()
+    event_mgr = EventManager()
+    event_mgr.add_logger(
+        LoggerConfig(
+            name="test_event_manager_log",
+            level=EventLevel.INFO,
+            output_stream=stream,
+            ignored_event_names=["CacheAction"],
+        )
+    )
+    msg_from_base_event_spy = mocker.spy(dbt.events.eventmgr, "msg_from_base_event")
+
+    # below the logger's level: the message is never built
+    event_mgr.fire_event(types.Note(msg="hidden"), level=EventLevel.DEBUG)
+    # ignored by name: the message is never built
+    event_mgr.fire_event(types.CacheAction(action="add_relation"), level=EventLevel.INFO)
+    assert msg_from_base_event_spy.call_count == 0
+    assert stream.getvalue() == ""
+
+    event_mgr.fire_event(types.Note(msg="shown"), level=EventLevel.INFO)
+    assert msg_from_base_event_spy.call_count == 1
+    assert "shown" in stream.getvalue()
+
+    # callbacks always receive the message
+    received = []
+    event_mgr.callbacks.append(received.append)
+    event_mgr.fire_event(types.Note(msg="hidden"), level=EventLevel.DEBUG)
+    assert [msg.info.msg for msg in received] == ["hidden"]
+    assert "hidden" not in stream.getvalue()
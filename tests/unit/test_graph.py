@@ -30,7 +30,7 @@ from .utils import config_from_parts_or_dicts, generate_name_macros, inject_plug
 
 class GraphTest(unittest.TestCase):
     def tearDown(self):
-        self.mock_filesystem_search.stop()
+        self.filesystem_search.stop()
         self.mock_hook_constructor.stop()
         self.load_state_check.stop()
         self.load_source_file_patcher.stop()
@@ -61,9 +61,9 @@ class GraphTest(unittest.TestCase):
         self.mock_models = []  # used by filesystem_searcher
 
         # Create file filesystem searcher
-        self.filesystem_search = patch("dbt.parser.read_files.filesystem_search")
+        self.filesystem_search = patch("dbt.parser.read_files.ProjectFileIndex.search")
 
-        def mock_filesystem_search(project, relative_dirs, extension, ignore_spec):
+        def mock_filesystem_search(relative_dirs, extension):
             if "sql" not in extension:
                 return []
             if "models" not in relative_dirs:
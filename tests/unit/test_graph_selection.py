@@ -137,6 +137,44 @@ def test_run_specs(include, exclude, expected):
     assert selected == expected
 
 
+def test_reachable():
+    # Edges: [(X.a, Y.b), (X.a, X.c), (Y.b, Y.d), (Y.b, X.e), (X.c, Y.f), (X.c, X.g)]
+    graph = _get_graph()
+    graph.graph.add_edge("m.Y.d", "m.X.e", edge_type="parent_test")
+
+    assert graph.reachable({"m.X.a"}) == {
+        "m.Y.b": 1,
+        "m.X.c": 1,
+        "m.Y.d": 2,
+        "m.X.e": 2,
+        "m.Y.f": 2,
+        "m.X.g": 2,
+    }
+    # selected nodes are only included when reached from another one
+    assert graph.reachable({"m.X.a", "m.Y.b"}, max_depth=1) == {
+        "m.Y.b": 1,
+        "m.X.c": 1,
+        "m.Y.d": 1,
+        "m.X.e": 1,
+    }
+    assert graph.reachable({"m.Y.d", "m.X.g"}, reverse=True) == {
+        "m.Y.b": 1,
+        "m.X.c": 1,
+        "m.X.a": 2,
+    }
+    assert graph.reachable({"m.X.e", "m.X.g"}, max_depth=0) == {}
+    assert graph.select_children({"m.Y.b", "m.X.c"}) == {"m.Y.d", "m.X.e", "m.Y.f", "m.X.g"}
+    assert graph.select_parents({"m.X.e"}, 1) == {"m.Y.b"}
+    assert graph.ancestors("m.X.e") == {"m.Y.b", "m.X.a"}
+
+    # the adjacency lists are rebuilt if the graph changes
+    graph.graph.add_edge("m.X.g", "m.X.h")
+    assert graph.descendants("m.X.c") == {"m.Y.f", "m.X.g", "m.X.h"}
+
+    with pytest.raises(dbt.exceptions.DbtInternalError):
+        graph.reachable({"m.X.z"})
+
+
 param_specs = [
     ("a", False, None, False, None, "fqn", "a", False),
     ("+a", True, None, False, None, "fqn", "a", False),
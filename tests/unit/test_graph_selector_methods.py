@@ -29,7 +29,12 @@ from dbt.contracts.graph.nodes import (
     ColumnInfo,
     AccessType,
 )
-from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
+from dbt.contracts.graph.manifest import (
+    LazyArtifactResourceDict,
+    Manifest,
+    ManifestMetadata,
+    WritableManifest,
+)
 from dbt.contracts.graph.saved_queries import QueryParams
 from dbt.contracts.graph.unparsed import ExposureType, Owner
 from dbt.contracts.state import PreviousState
@@ -53,6 +58,7 @@ from dbt.graph.selector_methods import (
     VersionSelectorMethod,
     SavedQuerySelectorMethod,
     SemanticModelSelectorMethod,
+    SelectorIndex,
 )
 import dbt.exceptions
 import dbt.contracts.graph.nodes
@@ -981,6 +987,75 @@ def test_select_tag(manifest):
     }
 
 
+@pytest.mark.parametrize(
+    "method_name,arguments,selectors",
+    [
+        (
+            "fqn",
+            [],
+            [
+                "pkg",
+                "pkg.unions",
+                "ext.unions",
+                "unions",
+                "mynamespace",
+                "union_model",
+                "versioned_model",
+                "versioned_model.v1",
+                "versioned_model_v1",
+                "pkg.versioned_model.v2",
+                "*.*.*_model",
+                "*unions*",
+                "pkg.t*",
+                "pkg.mynamespace.*",
+                "pkg.?nions",
+                "missing",
+            ],
+        ),
+        ("tag", [], ["uses_ephemeral", "uses_eph*", "*", "missing"]),
+        ("package", [], ["pkg", "ext", "p*", "*", "missing"]),
+        ("config", ["materialized"], ["view", "table", "ephemeral", "incremental", "true"]),
+        ("config", ["meta", "string_property"], ["some_string", "other_string"]),
+        ("config", ["meta", "truthy_bool_property"], ["true", "True", "false", "other"]),
+        ("config", ["meta", "falsy_bool_property"], ["false", "FALSE", "true"]),
+        ("config", ["meta", "list_property"], ["some_value", "true", "false", "other"]),
+        ("config", ["severity"], ["error", "ERROR", "warn"]),
+    ],
+)
+def test_select_with_index(manifest, method_name, arguments, selectors):
+    included_nodes = set(manifest.nodes) | set(manifest.sources) | set(manifest.exposures)
+    included_nodes.remove("model.pkg.table_model")
+    methods = MethodManager(manifest, None)
+    methods.index = SelectorIndex(manifest)
+    indexed_method = methods.get_method(method_name, arguments)
+    scan_method = MethodManager(manifest, None).get_method(method_name, arguments)
+    assert indexed_method.index is methods.index
+    assert scan_method.index is None
+
+    for selector in selectors:
+        for included in (included_nodes, set(manifest.nodes) | set(manifest.sources)):
+            expected = set(scan_method.search(included, selector))
+            assert set(indexed_method.search(included, selector)) == expected, selector
+
+
+def test_select_path_with_index(manifest, tmp_path):
+    for node in manifest.nodes.values():
+        path = tmp_path / node.original_file_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    methods = MethodManager(manifest, None)
+    methods.index = SelectorIndex(manifest)
+    indexed_method = methods.get_method("path", [])
+    scan_method = MethodManager(manifest, None).get_method("path", [])
+    included = set(manifest.nodes) | set(manifest.sources)
+
+    with mock.patch("dbt.graph.selector_methods.get_project_root", return_value=str(tmp_path)):
+        for selector in ["models", "models/*.sql", "subdirectory", "*", "missing"]:
+            expected = set(scan_method.search(included, selector))
+            assert set(indexed_method.search(included, selector)) == expected, selector
+        assert set(indexed_method.search(included, "models"))
+
+
 def test_select_group(manifest, view_model):
     group_name = "my_group"
     group = make_group("test", group_name)
@@ -1415,6 +1490,43 @@ def test_select_state_no_change(manifest, previous_state):
     assert not search_manifest_using_method(manifest, method, "modified.macros")
 
 
+def test_select_state_from_artifacts(
+    seed, ephemeral_model, source, macro_test_unique, macro_default_test_unique, tmp_path
+):
+    manifest = Manifest(
+        nodes={n.unique_id: n for n in (seed, ephemeral_model)},
+        sources={source.unique_id: source},
+        macros={m.unique_id: m for m in (macro_test_unique, macro_default_test_unique)},
+        metadata=ManifestMetadata(adapter_type="postgres"),
+    )
+    manifest.writable_manifest().write(str(tmp_path / "manifest.json"))
+    with mock.patch.object(
+        WritableManifest,
+        "read_and_check_versions",
+        wraps=WritableManifest.read_and_check_versions,
+    ) as read_manifest:
+        state = PreviousState(
+            state_path=tmp_path,
+            target_path=tmp_path / "target",
+            project_root=tmp_path,
+        )
+        # the artifacts are only read when they're first used
+        read_manifest.assert_not_called()
+        assert state.results is None
+        assert state.manifest is state.manifest
+        read_manifest.assert_called_once()
+
+    # and the nodes are only deserialized when they're looked up
+    assert isinstance(state.manifest.nodes, LazyArtifactResourceDict)
+    assert all(isinstance(node, dict) for node in dict.values(state.manifest.nodes))
+    for unique_id, node in manifest.nodes.items():
+        assert type(state.manifest.nodes[unique_id]) is type(node)
+
+    method = statemethod(manifest, state)
+    assert not search_manifest_using_method(manifest, method, "modified")
+    assert not search_manifest_using_method(manifest, method, "new")
+
+
 def test_select_state_nothing(manifest, previous_state):
     previous_state.manifest = None
     method = statemethod(manifest, previous_state)
@@ -1793,3 +1905,54 @@ def test_select_state_changed_test_macros_with_upstream_change(manifest, previou
     assert "model1" and "model2" not in search_manifest_using_method(
         manifest, method, "unmodified"
     )
+
+
+def test_select_state_changed_test_macros_transitive(manifest, previous_state):
+    changed_macro = make_macro("dbt", "changed_macro", "blablabla")
+    add_macro(manifest, changed_macro)
+    add_macro(previous_state.manifest, changed_macro.replace(macro_sql="something different"))
+
+    deleted_macro = make_macro("dbt", "deleted_macro", "blablabla")
+    add_macro(previous_state.manifest, deleted_macro)
+
+    # a chain of unchanged macros, each calling the one before it
+    callers = []
+    for i, upstream in enumerate((changed_macro.unique_id, deleted_macro.unique_id)):
+        middle = make_macro("dbt", f"middle_{i}", "blablabla", depends_on_macros=[upstream])
+        top = make_macro("dbt", f"top_{i}", "blablabla", depends_on_macros=[middle.unique_id])
+        for macro in (middle, top):
+            add_macro(manifest, macro)
+            add_macro(previous_state.manifest, macro)
+        callers.append(top)
+
+    unchanged_macro = make_macro("dbt", "unchanged_macro", "blablabla")
+    add_macro(manifest, unchanged_macro)
+    add_macro(previous_state.manifest, unchanged_macro)
+
+    models = {
+        "model1": [callers[0].unique_id],
+        "model2": [unchanged_macro.unique_id, callers[1].unique_id],
+        "model3": [deleted_macro.unique_id],
+        "model4": [unchanged_macro.unique_id],
+    }
+    for name, depends_on_macros in models.items():
+        model = make_model("dbt", name, "blablabla", depends_on_macros=depends_on_macros)
+        add_node(manifest, model)
+        add_node(previous_state.manifest, model)
+
+    method = statemethod(manifest, previous_state)
+
+    assert search_manifest_using_method(manifest, method, "modified.macros") == {
+        "model1",
+        "model2",
+        "model3",
+    }
+    assert method.affected_macros == {
+        changed_macro.unique_id,
+        deleted_macro.unique_id,
+        "macro.dbt.middle_0",
+        "macro.dbt.middle_1",
+        "macro.dbt.top_0",
+        "macro.dbt.top_1",
+    }
+    assert "model4" in search_manifest_using_method(manifest, method, "unmodified")
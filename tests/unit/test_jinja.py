@@ -1,12 +1,19 @@
 from contextlib import contextmanager
+import os
 import pytest
+import tempfile
 import unittest
+from unittest import mock
 import yaml
 
 from dbt.clients.jinja import get_rendered
 from dbt.clients.jinja import get_template
+from dbt.clients.jinja import get_environment
+from dbt.clients.jinja import bytecode_cache
+from dbt.clients.jinja import TemplateBytecodeCache
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.exceptions import CompilationError, JinjaRenderingError
+from dbt.utils import md5
 
 
 @contextmanager
@@ -416,6 +423,54 @@ class TestJinja(unittest.TestCase):
         value = get_rendered(s, {}, native=True)
         assert value == "1991"
 
+    def test_environments_are_reused(self):
+        assert get_environment() is get_environment()
+        assert get_environment(native=True) is get_environment(native=True)
+        assert get_environment(native=True) is not get_environment()
+
+        node = mock.Mock()
+        env = get_environment(node, capture_macros=True)
+        assert env.linked_to is get_environment(capture_macros=True)
+        assert get_template("{{ missing }}", {}, node, capture_macros=True).render() == ""
+        assert env.undefined(name="missing").node is node
+
+    def test_bytecode_cache(self):
+        with tempfile.TemporaryDirectory() as target_path:
+            with bytecode_cache(target_path) as cache:
+                assert get_rendered("{{ a + 1 }}", {"a": 1}, native=True) == 2
+                assert get_rendered("{{ a + 1 }}", {"a": 2}, native=False) == "3"
+                assert len(cache.codes) == 2
+            assert os.path.exists(cache.path)
+
+            with bytecode_cache(target_path) as cache:
+                assert len(cache.codes) == 2
+                with mock.patch.object(
+                    get_environment(native=True), "compile", side_effect=AssertionError
+                ):
+                    assert get_rendered("{{ a + 1 }}", {"a": 3}, native=True) == 4
+
+            # a cache written by another version of dbt is ignored
+            with mock.patch("dbt.clients.jinja.__version__", "0.0.0"):
+                with bytecode_cache(target_path) as cache:
+                    assert cache.codes == {}
+
+    def test_bytecode_cache_is_bounded(self):
+        with tempfile.TemporaryDirectory() as target_path:
+            with bytecode_cache(target_path):
+                for i in range(3):
+                    get_rendered(f"{{{{ {i} }}}}", {})
+
+            with mock.patch.object(TemplateBytecodeCache, "max_entries", 2):
+                with bytecode_cache(target_path) as cache:
+                    assert len(cache.codes) == 3
+                    get_rendered("{{ 2 }}", {})
+                    get_rendered("{{ 3 }}", {})
+
+                # the templates used by the last invocation are kept first
+                with bytecode_cache(target_path) as cache:
+                    used = {md5(f"False:{{{{ {i} }}}}") for i in (2, 3)}
+                    assert set(cache.codes) == used
+
 
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
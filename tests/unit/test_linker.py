@@ -1,15 +1,22 @@
 import os
+import random
 import tempfile
 import unittest
+from itertools import product
 from unittest import mock
 
+import networkx as nx
+import pytest
+
 from dbt import compilation
+from dbt.node_types import NodeType
 
 try:
     from queue import Empty
 except ImportError:
     from Queue import Empty
 
+from dbt.graph.queue import GraphQueue
 from dbt.graph.selector import NodeSelector
 from dbt.graph.cli import parse_difference
 
@@ -174,6 +181,55 @@ class LinkerTest(unittest.TestCase):
         queue_2.mark_done("A")
         self.assert_would_join(queue_2)
 
+    def test_linker_queue_scores_by_depth(self):
+        # A -> B -> D, A -> D, C -> D, E alone
+        actual_deps = [("B", "A"), ("D", "B"), ("D", "A"), ("D", "C")]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        self.linker.add_node("E")
+
+        queue = self._get_graph_queue(_mock_manifest("ABCDE"))
+        graph = queue.graph.copy()
+
+        scores = {queue._node_ids[idx]: score for idx, score in enumerate(queue._scores)}
+        self.assertEqual(scores, {"A": 0, "C": 0, "E": 0, "B": 1, "D": 2})
+
+        done = []
+        while not queue.empty():
+            got = queue.get(block=False)
+            done.append(got.unique_id)
+            queue.mark_done(got.unique_id)
+        self.assertEqual(done, ["A", "C", "E", "B", "D"])
+        self.assert_would_join(queue)
+        # the graph is no longer consumed as nodes are done
+        self.assertEqual(set(queue.graph.edges()), set(graph.edges()))
+        self.assertGreater(queue.lock_hold_time, 0)
+        self.assertGreaterEqual(queue.lock_hold_time, queue.max_lock_hold_time)
+
+    def test_linker_queue_critical_path(self):
+        # B depends on A, C is alone but slow
+        self.linker.dependency("B", "A")
+        self.linker.add_node("C")
+        graph = compilation.Graph(self.linker.graph)
+        manifest = _mock_manifest("ABC")
+
+        queue = GraphQueue(graph.graph, manifest, set("ABC"))
+        self.assertEqual(queue.get(block=False).unique_id, "A")
+        self.assertIsNone(queue.predicted_makespan(1))
+
+        execution_times = {"A": 1.0, "B": 1.0, "C": 10.0, "E": 100.0}
+        queue = GraphQueue(graph.graph, manifest, set("ABC"), execution_times)
+        self.assertEqual(queue.get(block=False).unique_id, "C")
+        self.assertEqual(queue.predicted_makespan(1), 12.0)
+        self.assertEqual(queue.predicted_makespan(2), 10.0)
+
+        # D never ran, so it's expected to take the average time of A, B and C
+        self.linker.dependency("D", "C")
+        graph = compilation.Graph(self.linker.graph)
+        queue = GraphQueue(graph.graph, manifest, set("ABCD"), execution_times)
+        self.assertEqual(queue.predicted_makespan(2), 14.0)
+
     def test__find_cycles__cycles(self):
         actual_deps = [("A", "B"), ("B", "C"), ("C", "A")]
 
@@ -189,3 +245,169 @@ class LinkerTest(unittest.TestCase):
             self.linker.dependency(l, r)
 
         self.assertIsNone(self.linker.find_cycles())
+
+
+def _mock_manifest_with_tests(graph, test_depends_on):
+    """Build a manifest for a graph of models and sources, where
+    test_depends_on maps test unique ids to the nodes they depend on"""
+    nodes = {}
+    child_map = {}
+    for node_id in graph:
+        if node_id.startswith("source."):
+            continue
+        resource_type = NodeType.Test if node_id.startswith("test.") else NodeType.Model
+        nodes[node_id] = mock.MagicMock(
+            unique_id=node_id,
+            resource_type=resource_type,
+            depends_on_nodes=test_depends_on.get(node_id, []),
+        )
+    for test_id, depends_on in test_depends_on.items():
+        for dependency in depends_on:
+            child_map.setdefault(dependency, []).append(test_id)
+    return mock.MagicMock(nodes=nodes, child_map=child_map)
+
+
+def _reference_test_edges(linker, manifest):
+    """The original, quadratic implementation of add_test_edges"""
+    edges = set()
+    for node_id in linker.graph:
+        if node_id in manifest.nodes and manifest.nodes[node_id].resource_type != NodeType.Test:
+            upstream_nodes = set(nx.ancestors(linker.graph, node_id))
+            upstream_tests = []
+            for upstream_node in upstream_nodes:
+                upstream_tests += compilation._get_tests_for_node(manifest, upstream_node)
+            for upstream_test in upstream_tests:
+                test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
+                if test_depends_on.issubset(upstream_nodes):
+                    edges.add((upstream_test, node_id))
+    return edges
+
+
+class TestAddTestEdges:
+    def _parent_test_edges(self, linker):
+        return {
+            (parent, child)
+            for parent, child, edge_type in linker.graph.edges(data="edge_type")
+            if edge_type == "parent_test"
+        }
+
+    def test_add_test_edges(self):
+        # model1 --> model2 --> model3, with a test on model1, a test on model2
+        # and a relationship test between model2 and a source
+        linker = compilation.Linker()
+        linker.dependency("model.model2", "model.model1")
+        linker.dependency("model.model3", "model.model2")
+        test_depends_on = {
+            "test.test1": ["model.model1"],
+            "test.test2": ["model.model2"],
+            "test.rel": ["model.model2", "source.src"],
+        }
+        for test_id, depends_on in test_depends_on.items():
+            for dependency in depends_on:
+                linker.dependency(test_id, dependency)
+        manifest = _mock_manifest_with_tests(linker.graph, test_depends_on)
+
+        linker.add_test_edges(manifest)
+
+        assert self._parent_test_edges(linker) == {
+            ("test.test1", "model.model2"),
+            ("test.test1", "model.model3"),
+            ("test.test2", "model.model3"),
+        }
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_add_test_edges_matches_reference(self, seed):
+        rng = random.Random(seed)
+        linker = compilation.Linker()
+        node_ids = [f"source.src{i}" for i in range(10)] + [f"model.m{i}" for i in range(150)]
+        for i, node_id in enumerate(node_ids):
+            linker.add_node(node_id)
+            if node_id.startswith("model."):
+                for parent_id in rng.sample(node_ids[:i], min(i, rng.randint(0, 3))):
+                    linker.dependency(node_id, parent_id)
+        test_depends_on = {}
+        for i in range(120):
+            depends_on = rng.sample(node_ids, rng.choice([1, 1, 1, 2]))
+            test_depends_on[f"test.t{i}"] = depends_on
+            for dependency in depends_on:
+                linker.dependency(f"test.t{i}", dependency)
+        manifest = _mock_manifest_with_tests(linker.graph, test_depends_on)
+
+        expected = _reference_test_edges(linker, manifest)
+        linker.add_test_edges(manifest)
+
+        assert self._parent_test_edges(linker) == expected
+
+
+def _reference_subset_graph(graph, selected):
+    """The original implementation of Graph.get_subset_graph, which
+    eliminates the unselected nodes one at a time
+    """
+    new_graph = graph.copy()
+    include_nodes = set(selected)
+    nodes_to_remove = True
+    while nodes_to_remove:
+        nodes_to_remove = [
+            node
+            for node in new_graph
+            if node not in include_nodes
+            and (new_graph.in_degree(node) * new_graph.out_degree(node)) == 0
+        ]
+        new_graph.remove_nodes_from(nodes_to_remove)
+
+    remaining_nodes = list(new_graph.nodes())
+    remaining_nodes.sort(key=lambda node: new_graph.in_degree(node) * new_graph.out_degree(node))
+    for node in remaining_nodes:
+        if node not in include_nodes:
+            source_nodes = [x for x, _ in new_graph.in_edges(node)]
+            target_nodes = [x for _, x in new_graph.out_edges(node)]
+            new_graph.add_edges_from(
+                (source, target)
+                for source, target in product(source_nodes, target_nodes)
+                if source != target and not new_graph.has_edge(source, target)
+            )
+            new_graph.remove_node(node)
+    return new_graph
+
+
+class TestGetSubsetGraph:
+    def test_get_subset_graph(self):
+        # A -> B -> C -> D, A -> D, with a parent_test edge from A to C
+        linker = compilation.Linker()
+        linker.dependency("B", "A")
+        linker.dependency("C", "B")
+        linker.dependency("D", "C")
+        linker.dependency("D", "A")
+        linker.graph.add_edge("A", "C", edge_type="parent_test")
+        graph = compilation.Graph(linker.graph)
+
+        subset = graph.get_subset_graph({"A", "C", "D"}).graph
+
+        assert list(subset.nodes()) == ["A", "C", "D"]
+        assert set(subset.edges(data="edge_type")) == {
+            ("A", "C", "parent_test"),
+            ("A", "D", None),
+            ("C", "D", None),
+        }
+        # the original graph is left alone
+        assert set(linker.graph.nodes()) == {"A", "B", "C", "D"}
+
+        with pytest.raises(ValueError):
+            graph.get_subset_graph({"A", "E"})
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_get_subset_graph_matches_reference(self, seed):
+        rng = random.Random(seed)
+        linker = compilation.Linker()
+        node_ids = [f"model.m{i}" for i in range(150)]
+        for i, node_id in enumerate(node_ids):
+            linker.add_node(node_id)
+            for parent_id in rng.sample(node_ids[:i], min(i, rng.randint(0, 3))):
+                linker.dependency(node_id, parent_id)
+        selected = set(rng.sample(node_ids, 30))
+
+        expected = _reference_subset_graph(linker.graph, selected)
+        subset = compilation.Graph(linker.graph).get_subset_graph(selected).graph
+
+        assert list(subset.nodes()) == list(expected.nodes())
+        assert set(subset.edges()) == set(expected.edges())
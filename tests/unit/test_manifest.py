@@ -1,21 +1,26 @@
+import json
 import os
+import random
+import tempfile
 import unittest
 from argparse import Namespace
 from collections import namedtuple
 from copy import deepcopy
 from datetime import datetime
-from itertools import product
+from itertools import chain, product
 from unittest import mock
 
 import freezegun
 import pytest
 
+import dbt.clients.system
 import dbt.flags
+import dbt.utils
 import dbt.version
 from dbt import tracking
 from dbt.adapters.base.plugin import AdapterPlugin
 from dbt.contracts.files import FileHash
-from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
+from dbt.contracts.graph.manifest import Manifest, ManifestMetadata, build_node_edges
 from dbt.contracts.graph.nodes import (
     ModelNode,
     DependsOn,
@@ -457,6 +462,35 @@ class ManifestTest(unittest.TestCase):
         )
         self.assertEqual(child_map["model.snowplow.events"], [])
 
+    @freezegun.freeze_time("2018-02-14T09:15:13Z")
+    def test_write_streams_artifact(self):
+        manifest = Manifest(
+            nodes=deepcopy(self.nested_nodes),
+            sources=deepcopy(self.sources),
+            macros={},
+            docs={},
+            disabled={},
+            files={},
+            exposures=deepcopy(self.exposures),
+            metrics=deepcopy(self.metrics),
+            selectors={},
+            metadata=ManifestMetadata(generated_at=datetime.utcnow()),
+        )
+        writable = manifest.writable_manifest()
+        expected = json.dumps(writable.to_dict(omit_none=False), cls=dbt.utils.JSONEncoder)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "manifest.json")
+            # without orjson, the output is the same as json.dumps
+            with mock.patch.object(dbt.clients.system, "orjson", None):
+                writable.write(path)
+            with open(path) as fp:
+                self.assertEqual(fp.read(), expected)
+
+            if dbt.clients.system.orjson is not None:
+                writable.write(path)
+                with open(path) as fp:
+                    self.assertEqual(json.load(fp), json.loads(expected))
+
     def test_build_flat_graph(self):
         exposures = deepcopy(self.exposures)
         metrics = deepcopy(self.metrics)
@@ -508,6 +542,40 @@ class ManifestTest(unittest.TestCase):
         for node in flat_nodes.values():
             self.assertEqual(frozenset(node), REQUIRED_PARSED_NODE_KEYS)
 
+    def test_flat_graph_is_serialized_lazily(self):
+        nodes = deepcopy(self.nested_nodes)
+        manifest = make_manifest(nodes=list(nodes.values()))
+        manifest.build_flat_graph()
+        flat_nodes = manifest.flat_graph["nodes"]
+
+        with mock.patch.object(ModelNode, "to_dict", autospec=True) as to_dict:
+            to_dict.side_effect = lambda node, omit_none: {"unique_id": node.unique_id}
+            self.assertEqual(set(flat_nodes), set(nodes))
+            self.assertIn("model.root.dep", flat_nodes)
+            to_dict.assert_not_called()
+
+            node_dict = flat_nodes["model.root.dep"]
+            self.assertEqual(node_dict, {"unique_id": "model.root.dep"})
+            self.assertIs(flat_nodes.get("model.root.dep"), node_dict)
+            self.assertEqual(to_dict.call_count, 1)
+
+            self.assertIsNone(flat_nodes.get("model.root.missing"))
+            self.assertEqual(json.loads(json.dumps(flat_nodes)), dict(flat_nodes))
+            self.assertEqual({**flat_nodes}, {k: {"unique_id": k} for k in nodes})
+            self.assertEqual(to_dict.call_count, len(nodes))
+
+    def test_flat_graph_is_a_snapshot(self):
+        nodes = deepcopy(self.nested_nodes)
+        manifest = make_manifest(nodes=list(nodes.values()))
+        manifest.build_flat_graph()
+
+        # compiling after the graph is built doesn't change it
+        manifest.nodes["model.root.dep"].compiled_code = "select 1"
+        manifest.nodes["model.root.dep"].compiled = True
+        node_dict = manifest.flat_graph["nodes"]["model.root.dep"]
+        self.assertIsNone(node_dict.get("compiled_code"))
+        self.assertFalse(node_dict.get("compiled"))
+
     @mock.patch.object(tracking, "active_user")
     def test_metadata(self, mock_user):
         mock_user.id = "cfc9500f-dc7f-4c83-9ea7-2c581c1b38cf"
@@ -1174,6 +1242,26 @@ def test_find_macro_by_name(macros, expectations):
             assert result.package_name == expected
 
 
+def test_find_macro_by_name_lookup_is_reused_and_invalidated():
+    manifest = make_manifest(macros=[MockMacro("dep")])
+    assert manifest.find_macro_by_name("my_macro", "root", None).package_name == "dep"
+    lookup = manifest._macro_name_lookup
+    assert manifest.find_macro_by_name("other_macro", "root", None) is None
+    assert manifest._macro_name_lookup is lookup
+
+    # adding a macro resets the lookup
+    manifest.add_macro(mock.MagicMock(macros=[]), MockMacro("root"))
+    assert manifest.find_macro_by_name("my_macro", "root", None).package_name == "root"
+    assert manifest._macro_name_lookup is not lookup
+
+    # as does removing one, like partial parsing
+    lookup = manifest._macro_name_lookup
+    manifest.remove_macro("macro.root.my_macro")
+    assert manifest._macro_name_lookup is None
+    assert manifest.find_macro_by_name("my_macro", "root", None).package_name == "dep"
+    assert manifest._macro_name_lookup is not lookup
+
+
 generate_name_parameter_sets = [
     # empty
     FindMacroSpec(
@@ -1802,3 +1890,74 @@ def test_resolve_doc(docs, package, expected):
         expected_package, expected_name = expected
         assert result.name == expected_name
         assert result.package_name == expected_package
+
+
+class TestIncrementalParentAndChildMaps:
+    def _expected_maps(self, manifest):
+        members = list(chain(manifest.nodes.values(), manifest.sources.values()))
+        forward_edges, backward_edges = build_node_edges(members)
+        return forward_edges, backward_edges
+
+    def _assert_maps(self, manifest):
+        manifest.build_parent_and_child_maps()
+        child_map, parent_map = self._expected_maps(manifest)
+        assert manifest.child_map == child_map
+        assert manifest.parent_map == parent_map
+
+    def test_in_place_changes_to_added_nodes(self):
+        manifest = make_manifest(
+            nodes=[MockNode("root", "a", depends_on_nodes=["source.root.raw.t"])],
+            sources=[MockSource("root", "raw", "t", depends_on_nodes=[])],
+        )
+        self._assert_maps(manifest)
+        node = MockNode("root", "b", depends_on_nodes=[])
+        manifest.add_node_nofile(node)
+        self._assert_maps(manifest)
+        # like process_refs, after the maps were built
+        node.depends_on_nodes.append("model.root.a")
+        manifest.mark_edges_changed(node.unique_id)
+        self._assert_maps(manifest)
+        assert manifest.child_map["model.root.a"] == ["model.root.b"]
+        assert manifest._edge_changes == set()
+
+    def test_removed_parent_is_relinked(self):
+        a = MockNode("root", "a", depends_on_nodes=[])
+        manifest = make_manifest(
+            nodes=[a, MockNode("root", "b", depends_on_nodes=["model.root.a"])],
+        )
+        self._assert_maps(manifest)
+        manifest.nodes.pop("model.root.a")
+        self._assert_maps(manifest)
+        assert "model.root.a" not in manifest.child_map
+        manifest.add_node_nofile(MockNode("root", "a", depends_on_nodes=[]))
+        self._assert_maps(manifest)
+        assert manifest.child_map["model.root.a"] == ["model.root.b"]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_changes_match_full_build(self, seed):
+        rng = random.Random(seed)
+        names = [f"n{i}" for i in range(60)]
+        unique_ids = [f"model.root.{name}" for name in names] + ["model.root.missing"]
+
+        def random_node(name):
+            parents = rng.sample(unique_ids, rng.randint(0, 3))
+            return MockNode("root", name, depends_on_nodes=parents)
+
+        manifest = make_manifest(nodes=[random_node(name) for name in names[:40]])
+        self._assert_maps(manifest)
+        for _ in range(40):
+            for _ in range(rng.randint(1, 3)):
+                name = rng.choice(names)
+                unique_id = f"model.root.{name}"
+                action = rng.choice(["add", "remove", "replace", "mutate"])
+                if unique_id not in manifest.nodes:
+                    manifest.add_node_nofile(random_node(name))
+                elif action == "remove":
+                    manifest.nodes.pop(unique_id)
+                elif action == "replace":
+                    manifest.nodes[unique_id] = random_node(name)
+                elif action == "mutate":
+                    node = manifest.nodes[unique_id]
+                    node.depends_on_nodes[:] = rng.sample(unique_ids, rng.randint(0, 3))
+                    manifest.mark_edges_changed(unique_id)
+            self._assert_maps(manifest)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from dbt.dataclass_schema import dbtClassMixin
+import pytest
+from dbt.dataclass_schema import dbtClassMixin, ValidationError
 from typing import List, Dict
 from dbt.contracts.graph.model_config import MergeBehavior, ShowBehavior, CompareBehavior
 
@@ -89,3 +90,15 @@ def test_compare_behavior_from_field():
     assert CompareBehavior.from_field(fields["default_behavior"]) == CompareBehavior.Include
     assert CompareBehavior.from_field(fields["included"]) == CompareBehavior.Include
     assert CompareBehavior.from_field(fields["excluded"]) == CompareBehavior.Exclude
+
+
+def test_validator_is_cached_per_class():
+    @dataclass
+    class OtherThing(dbtClassMixin):
+        name: str
+
+    assert ThingWithMergeBehavior._validator() is ThingWithMergeBehavior._validator()
+    assert OtherThing._validator() is not ThingWithMergeBehavior._validator()
+    OtherThing.validate({"name": "foo"})
+    with pytest.raises(ValidationError):
+        OtherThing.validate({"name": 1})
@@ -1,3 +1,6 @@
+import os
+import tempfile
+from copy import deepcopy
 import unittest
 from unittest import mock
 from unittest.mock import patch, MagicMock
@@ -5,10 +8,11 @@ from argparse import Namespace
 
 from .utils import config_from_parts_or_dicts, normalize
 
-from dbt.contracts.files import SourceFile, FileHash, FilePath
+from dbt.contracts.files import SourceFile, FileHash, FilePath, ParseFileType
 from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
 from dbt.parser import manifest
 from dbt.parser.manifest import ManifestLoader
+from dbt.parser.read_files import load_source_file, load_source_file_contents
 from dbt.config import RuntimeConfig
 from dbt.flags import set_from_args
 
@@ -121,3 +125,104 @@ class TestPartialParse(unittest.TestCase):
         ManifestLoader(mock_project, {})
         # if specified in flags, we use the specified path
         patched_open.assert_called_with("specified_partial_parse_path", "rb")
+
+
+class TestPartialParseFile(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "target", "partial_parse.msgpack")
+        self.manifest = Manifest()
+        self.manifest.state_check = ManifestStateCheck(
+            vars_hash=FileHash.from_contents("vars"),
+            project_env_vars_hash=FileHash.from_contents("project env vars"),
+            profile_env_vars_hash=FileHash.from_contents("profile env vars"),
+            profile_hash=FileHash.from_contents("profile"),
+            project_hashes={"root": FileHash.from_contents("dbt_project.yml")},
+        )
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_header_is_read_before_manifest(self):
+        manifest.write_partial_parse_file(self.path, self.manifest)
+        with open(self.path, "rb") as fp:
+            header = manifest.read_partial_parse_header(fp)
+            saved_manifest = manifest.read_partial_parse_manifest(fp)
+        self.assertEqual(header.dbt_version, self.manifest.metadata.dbt_version)
+        self.assertEqual(header.state_check, self.manifest.state_check)
+        self.assertEqual(saved_manifest.state_check, self.manifest.state_check)
+
+    def test_file_without_header(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as fp:
+            fp.write(self.manifest.to_msgpack(manifest.extended_mashumaro_encoder))
+        with open(self.path, "rb") as fp:
+            self.assertIsNone(manifest.read_partial_parse_header(fp))
+            saved_manifest = manifest.read_partial_parse_manifest(fp)
+        self.assertEqual(saved_manifest.state_check, self.manifest.state_check)
+
+    @patch("dbt.parser.manifest.ManifestLoader.build_manifest_state_check")
+    @patch("dbt.parser.manifest.read_partial_parse_manifest")
+    def test_manifest_not_decoded_on_state_mismatch(self, patched_read, patched_state_check):
+        manifest.write_partial_parse_file(self.path, self.manifest)
+        patched_state_check.return_value = deepcopy(self.manifest.state_check)
+        patched_state_check.return_value.vars_hash = FileHash.from_contents("other vars")
+        mock_project = MagicMock(RuntimeConfig)
+        set_from_args(Namespace(partial_parse_file_path=self.path), {})
+        loader = ManifestLoader(mock_project, {})
+        self.assertIsNone(loader.saved_manifest)
+        patched_read.assert_not_called()
+
+    @patch("dbt.parser.manifest.ManifestLoader.build_manifest_state_check")
+    def test_manifest_decoded_on_state_match(self, patched_state_check):
+        manifest.write_partial_parse_file(self.path, self.manifest)
+        patched_state_check.return_value = self.manifest.state_check
+        mock_project = MagicMock(RuntimeConfig)
+        set_from_args(Namespace(partial_parse_file_path=self.path), {})
+        loader = ManifestLoader(mock_project, {})
+        self.assertIsNotNone(loader.saved_manifest)
+        self.assertEqual(loader.saved_manifest.state_check, self.manifest.state_check)
+
+
+class TestLoadSourceFile(unittest.TestCase):
+    def setUp(self):
+        self.path = FilePath(
+            searched_path="models",
+            relative_path="model.sql",
+            modification_time=1234.0,
+            project_root=normalize("/usr/src/app"),
+        )
+        self.saved_file = SourceFile(
+            path=FilePath(
+                searched_path="models",
+                relative_path="model.sql",
+                modification_time=1234.0,
+                project_root=normalize("/usr/src/app"),
+            ),
+            checksum=FileHash.from_contents("select 1"),
+            project_name="root",
+            parse_file_type=ParseFileType.Model,
+        )
+        self.saved_files = {self.saved_file.file_id: self.saved_file}
+
+    @patch("dbt.parser.read_files.load_file_contents")
+    def test_unmodified_file_is_not_read(self, load_file_contents):
+        load_file_contents.return_value = "select 1"
+        source_file = load_source_file(self.path, ParseFileType.Model, "root", self.saved_files)
+        load_file_contents.assert_not_called()
+        self.assertEqual(source_file.checksum, self.saved_file.checksum)
+        self.assertIsNone(source_file.contents)
+
+        # contents are only read when the file is going to be parsed
+        load_source_file_contents(source_file)
+        load_file_contents.assert_called_once_with(self.path.absolute_path, strip=True)
+        self.assertEqual(source_file.contents, "select 1")
+
+    @patch("dbt.parser.read_files.load_file_contents")
+    def test_modified_file_is_read(self, load_file_contents):
+        load_file_contents.return_value = "select 2"
+        self.path.modification_time = 5678.0
+        source_file = load_source_file(self.path, ParseFileType.Model, "root", self.saved_files)
+        load_file_contents.assert_called_once_with(self.path.absolute_path, strip=True)
+        self.assertEqual(source_file.checksum, FileHash.from_contents("select 2"))
+        self.assertEqual(source_file.contents, "select 2")
@@ -1,14 +1,22 @@
 import os
+import shutil
+import tempfile
 import unittest
 from copy import deepcopy
+from functools import partial
 from unittest import mock
 
+import pathspec
 import yaml
 
 import dbt.flags
 import dbt.parser
 from dbt import tracking
-from dbt.context.context_config import ContextConfig
+from dbt.context.context_config import (
+    BaseContextConfigGenerator,
+    ContextConfig,
+    ContextConfigGenerator,
+)
 from dbt.contracts.files import SourceFile, FileHash, FilePath, SchemaSourceFile
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.model_config import NodeConfig, TestConfig, SnapshotConfig, ModelConfig
@@ -49,7 +57,8 @@ from dbt.parser.schemas import (
     MacroPatchParser,
     yaml_from_file,
 )
-from dbt.parser.search import FileBlock
+from dbt.clients.system import find_files
+from dbt.parser.search import FileBlock, ProjectFileIndex, filesystem_search
 from dbt.parser.sources import SourcePatcher
 from .utils import config_from_parts_or_dicts, normalize, generate_name_macros, MockNode
 from dbt.flags import set_from_args
@@ -943,6 +952,18 @@ class ModelParserTest(BaseParserTest):
         self.assertIn(file_id, self.parser.manifest.files)
         self.assertEqual(self.parser.manifest.files[file_id].nodes, ["model.snowplow.model_1"])
 
+    def test_parsed_node_validation_can_be_skipped(self):
+        block = self.file_block_for(sql_model, "nested/model_1.sql")
+        self.parser.manifest.files[block.file.file_id] = block.file
+        set_from_args(Namespace(WARN_ERROR=False, VALIDATE_PARSED_NODES=False), None)
+        try:
+            with mock.patch.object(ModelNode, "validate") as validate:
+                self.parser.parse_file(block)
+        finally:
+            set_from_args(Namespace(WARN_ERROR=False), None)
+        validate.assert_not_called()
+        self.assert_has_manifest_lengths(self.parser.manifest, nodes=1)
+
     def test_sql_model_parse_error(self):
         block = self.file_block_for(sql_model_parse_error, "nested/model_1.sql")
         with self.assertRaises(CompilationError):
@@ -1283,6 +1304,63 @@ class StaticModelParserUnitTest(BaseParserTest):
         self.assertEqual(["80_stable_exact_match"], result)
 
 
+class ContextConfigGeneratorTest(BaseParserTest):
+    def setUp(self):
+        super().setUp()
+        self.root_project_config.models = {
+            "+materialized": "view",
+            "root": {
+                "+tags": ["root"],
+                "staging": {
+                    "+materialized": "table",
+                    "+meta": {"owner": "staging"},
+                    "deep": {"+tags": ["deep"], "model_b": {"+enabled": False}},
+                },
+            },
+        }
+
+    def _calculate(self, fqn, generator=None):
+        generator = generator or ContextConfigGenerator(self.root_project_config)
+        return generator.calculate_node_config_dict(
+            config_call_dict={"tags": ["call"]},
+            fqn=fqn,
+            resource_type=NodeType.Model,
+            project_name="root",
+            base=False,
+        )
+
+    def test_project_configs_are_reused(self):
+        fqns = [
+            ["root", "staging", "deep", "model_a"],
+            ["root", "staging", "deep", "model_b"],
+            ["root", "staging", "model_c"],
+            ["root", "other", "model_d"],
+            ["root", "model_e"],
+        ]
+        # resolve every level for each node, like before the configs were cached
+        uncached = ContextConfigGenerator(self.root_project_config)
+        uncached._calculate_project_config = partial(  # type: ignore
+            BaseContextConfigGenerator._calculate_project_config, uncached
+        )
+        expected = [self._calculate(fqn, uncached) for fqn in fqns]
+
+        with mock.patch.object(
+            NodeConfig, "update_from", autospec=True, side_effect=NodeConfig.update_from
+        ) as update_from:
+            got = [self._calculate(fqn) for fqn in fqns]
+            first_pass = update_from.call_count
+            self.assertEqual([self._calculate(fqn) for fqn in fqns], got)
+            # only the config calls are merged the second time around
+            self.assertEqual(update_from.call_count - first_pass, len(fqns))
+
+        self.assertEqual(got, expected)
+        self.assertEqual(got[0]["tags"], ["root", "deep", "call"])
+        self.assertEqual(got[0]["materialized"], "table")
+        self.assertEqual(got[0]["meta"], {"owner": "staging"})
+        self.assertFalse(got[1]["enabled"])
+        self.assertEqual(got[3]["materialized"], "view")
+
+
 class SnapshotParserTest(BaseParserTest):
     def setUp(self):
         super().setUp()
@@ -1661,3 +1739,51 @@ class AnalysisParserTest(BaseParserTest):
         self.assertEqual(
             self.parser.manifest.files[file_id].nodes, ["analysis.snowplow.analysis_1"]
         )
+
+
+class ProjectFileIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.project_root = tempfile.mkdtemp()
+        for relative_path in (
+            "models/a.sql",
+            "models/b.py",
+            "models/sub/schema.yml",
+            "models/sub/c.SQL",
+            "models/.hidden.sql",
+            "models/ignored/d.sql",
+            "seeds/s.csv",
+            "seeds/seeds.yaml",
+        ):
+            path = os.path.join(self.project_root, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w"):
+                pass
+        self.project = mock.MagicMock(project_root=self.project_root)
+        self.ignore_spec = pathspec.PathSpec.from_lines(
+            pathspec.patterns.GitWildMatchPattern, ["ignored"]
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.project_root, ignore_errors=True)
+
+    def test_search_matches_filesystem_search(self):
+        file_index = ProjectFileIndex(self.project, self.ignore_spec)
+        for relative_dirs, extension in (
+            (["models"], ".sql"),
+            (["models"], ".py"),
+            (["seeds"], ".csv"),
+            (["models", "seeds", "missing"], ".yml"),
+            (["models", "seeds", "missing"], ".yaml"),
+        ):
+            self.assertEqual(
+                file_index.search(relative_dirs, extension),
+                filesystem_search(self.project, relative_dirs, extension, self.ignore_spec),
+            )
+
+    def test_directories_are_listed_once(self):
+        file_index = ProjectFileIndex(self.project, self.ignore_spec)
+        with mock.patch("dbt.parser.search.find_files", wraps=find_files) as patched:
+            file_index.search(["models"], ".sql")
+            file_index.search(["models"], ".py")
+            file_index.search(["models", "seeds"], ".yml")
+        self.assertEqual([c.args[1] for c in patched.call_args_list], ["models", "seeds"])
@@ -12,6 +12,7 @@ from dbt.task.debug import DebugTask
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.adapters.postgres import Plugin as PostgresPlugin
+from dbt.adapters.postgres.connections import CopyRowsReader
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import ManifestStateCheck
 from dbt.clients import agate_helper
@@ -512,6 +513,41 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
             ]
         )
 
+    def test_bulk_load_csv_rows(self):
+        relation = self.adapter.Relation.create(
+            database="postgres",
+            schema="test_schema",
+            identifier="test_seed",
+            type="table",
+            quote_policy=self.adapter.config.quoting,
+        )
+        table = agate.Table(
+            [[1, "a\tb", True, None], [2, "c\\d\ne", False, decimal.Decimal("1.5")]],
+            ["id", "name", "flag", "amount"],
+            [agate_helper.Number(), agate.Text(), agate.Boolean(), agate_helper.Number()],
+        )
+        copied = []
+        self.cursor.copy_expert.side_effect = lambda sql, fp: copied.append(fp.read())
+
+        sql = self.adapter.bulk_load_csv_rows(relation, "id, name, flag, amount", table)
+
+        expected_sql = (
+            'copy "postgres"."test_schema".test_seed (id, name, flag, amount) from stdin'
+        )
+        self.assertEqual(sql, expected_sql)
+        self.cursor.copy_expert.assert_called_once_with(expected_sql, mock.ANY)
+        self.assertEqual(copied, ["1\ta\\tb\tt\t\\N\n2\tc\\\\d\\ne\tf\t1.5\n"])
+
+    def test_bulk_load_csv_rows_skips_timestamps_with_time_zones(self):
+        relation = self.adapter.Relation.create(
+            database="postgres", schema="test_schema", identifier="test_seed"
+        )
+        table = agate.Table(
+            [["2020-01-01T00:00:00Z"]], ["loaded_at"], [agate_helper.ISODateTime()]
+        )
+        self.assertIsNone(self.adapter.bulk_load_csv_rows(relation, "loaded_at", table))
+        self.cursor.copy_expert.assert_not_called()
+
     def test_debug_connection_ok(self):
         DebugTask.validate_connection(self.target_dict)
         self.mock_execute.assert_has_calls([mock.call("/* dbt */\nselect 1 as id", None)])
@@ -649,3 +685,23 @@ class TestPostgresAdapterConversions(TestAdapterConversions):
         expected = ["time", "time", "time"]
         for col_idx, expect in enumerate(expected):
             assert PostgresAdapter.convert_time_type(agate_table, col_idx) == expect
+
+
+class TestCopyRowsReader(unittest.TestCase):
+    def test_read_in_chunks(self):
+        rows = [[i, f"name_{i}"] for i in range(100)]
+        expected = "".join(f"{i}\tname_{i}\n" for i in range(100))
+
+        reader = CopyRowsReader(rows)
+        chunks = []
+        chunk = reader.read(7)
+        while chunk:
+            self.assertLessEqual(len(chunk), 7)
+            chunks.append(chunk)
+            chunk = reader.read(7)
+        self.assertEqual("".join(chunks), expected)
+
+    def test_read_all(self):
+        reader = CopyRowsReader([[None, "x"], ["y", None]])
+        self.assertEqual(reader.read(), "\\N\tx\ny\t\\N\n")
+        self.assertEqual(reader.read(), "")
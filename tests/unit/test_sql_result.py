@@ -1,5 +1,10 @@
 import unittest
+from unittest import mock
+
+import agate
+
 from dbt.adapters.sql.connections import SQLConnectionManager
+from dbt.clients import agate_helper
 
 
 class TestProcessSQLResult(unittest.TestCase):
@@ -17,3 +22,54 @@ class TestProcessSQLResult(unittest.TestCase):
             SQLConnectionManager.process_results(cols_with_more_dupes, rows),
             [{"a": 1, "a_2": 2, "a_3": 3, "b": 4}],
         )
+
+    def test_result_from_cursor(self):
+        cursor = mock.MagicMock()
+        cursor.description = [("a",), ("b",), ("a",), ("c",)]
+        cursor.fetchall.return_value = [
+            (1, "0005", {"x": 1}, 1.5),
+            (2, "", None, None),
+        ]
+
+        table = SQLConnectionManager.get_result_from_cursor(cursor, None)
+
+        expected = agate_helper.table_from_data_flat(
+            [
+                {"a": 1, "b": "0005", "a_2": {"x": 1}, "c": 1.5},
+                {"a": 2, "b": "", "a_2": None, "c": None},
+            ],
+            ["a", "b", "a_2", "c"],
+        )
+        self.assertIsInstance(table, agate.Table)
+        self.assertEqual(table.column_names, expected.column_names)
+        self.assertEqual(
+            [type(t) for t in table.column_types], [type(t) for t in expected.column_types]
+        )
+        self.assertEqual(agate_helper.as_matrix(table), agate_helper.as_matrix(expected))
+
+    def test_result_from_cursor_without_results(self):
+        cursor = mock.MagicMock()
+        cursor.description = None
+
+        table = SQLConnectionManager.get_result_from_cursor(cursor, None)
+
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.column_names, ())
+
+    def test_result_from_cursor_with_processed_results(self):
+        class UpperConnectionManager(SQLConnectionManager):
+            @classmethod
+            def process_results(cls, column_names, rows):
+                return [
+                    {k: v.upper() for k, v in row.items()}
+                    for row in super().process_results(column_names, rows)
+                ]
+
+        cursor = mock.MagicMock()
+        cursor.description = [("a",)]
+        cursor.fetchmany.return_value = [("x",)]
+
+        table = UpperConnectionManager.get_result_from_cursor(cursor, 1)
+
+        cursor.fetchmany.assert_called_once_with(1)
+        self.assertEqual(agate_helper.as_matrix(table), [("X",)])
@@ -1,7 +1,9 @@
+import json
 import os
 import shutil
 import stat
 import unittest
+import unittest.mock
 import tarfile
 import pathspec
 from pathlib import Path
@@ -63,6 +65,48 @@ class SystemClient(unittest.TestCase):
         dbt.clients.system.make_directory(test_dir_pathobj)
         self.assertTrue(test_dir_pathobj.is_dir())
 
+    def test__write_json_stream(self):
+        path = os.path.join(self.tmp_dir, "artifact.json")
+        data = dbt.clients.system.StreamedObject(
+            [
+                ("metadata", {"version": 1}),
+                (
+                    "nodes",
+                    dbt.clients.system.StreamedObject(
+                        (str(i), {"id": i, "name": "é"}) for i in range(3)
+                    ),
+                ),
+                ("results", dbt.clients.system.StreamedArray(iter([1, 2**70, "three"]))),
+                ("empty", dbt.clients.system.StreamedArray([])),
+            ]
+        )
+        expected = {
+            "metadata": {"version": 1},
+            "nodes": {str(i): {"id": i, "name": "é"} for i in range(3)},
+            "results": [1, 2**70, "three"],
+            "empty": [],
+        }
+        with unittest.mock.patch.object(dbt.clients.system, "orjson", None):
+            dbt.clients.system.write_json_stream(path, data)
+        with open(path) as f:
+            self.assertEqual(f.read(), json.dumps(expected))
+
+    def test__write_json_stream_failure_keeps_previous_file(self):
+        path = os.path.join(self.tmp_dir, "artifact.json")
+        dbt.clients.system.write_file(path, '{"previous": true}')
+
+        def failing_items():
+            yield ("ok", 1)
+            raise RuntimeError("serialization failed")
+
+        with self.assertRaises(RuntimeError):
+            dbt.clients.system.write_json_stream(
+                path, dbt.clients.system.StreamedObject(failing_items())
+            )
+        with open(path) as f:
+            self.assertEqual(f.read(), '{"previous": true}')
+        self.assertEqual(os.listdir(self.tmp_dir), ["artifact.json"])
+
 
 class TestRunCmd(unittest.TestCase):
     """Test `run_cmd`.
@@ -207,6 +251,40 @@ class TestFindMatching(unittest.TestCase):
             )
             self.assertEqual(out, [])
 
+    def _make_files(self, *relative_paths):
+        for relative_path in relative_paths:
+            path = os.path.join(self.tempdir, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            Path(path).touch()
+
+    def test_find_files_order_matches_os_walk(self):
+        self._make_files("a.sql", "sub/b.sql", "sub/deeper/c.sql", "sub2/d.yml", "e.py")
+        out = dbt.clients.system.find_files(self.base_dir, os.path.basename(self.tempdir))
+        expected = []
+        for current_path, _, local_files in os.walk(self.tempdir):
+            for local_file in local_files:
+                expected.append(
+                    os.path.relpath(os.path.join(current_path, local_file), self.tempdir)
+                )
+        self.assertEqual(out, expected)
+
+    def test_find_files_skips_ignored_directories(self):
+        self._make_files("a.sql", "ignored/b.sql", "ignored/deeper/c.sql")
+        spec = pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, ["ignored/"])
+        with unittest.mock.patch("os.scandir", wraps=os.scandir) as scandir:
+            out = dbt.clients.system.find_files(self.tempdir, "", spec)
+        self.assertEqual(out, ["a.sql"])
+        scanned = [os.path.relpath(c.args[0], self.tempdir) for c in scandir.call_args_list]
+        self.assertEqual(scanned, ["."])
+
+    def test_find_matching_negated_ignore_pattern(self):
+        self._make_files("ignored/b.sql", "ignored/keep.sql")
+        spec = pathspec.PathSpec.from_lines(
+            pathspec.patterns.GitWildMatchPattern, ["ignored/", "!ignored/keep.sql"]
+        )
+        out = dbt.clients.system.find_matching(self.tempdir, [""], "*.sql", spec)
+        self.assertEqual([o["relative_path"] for o in out], [os.path.join("ignored", "keep.sql")])
+
     def tearDown(self):
         try:
             shutil.rmtree(self.base_dir)
@@ -220,6 +298,40 @@ class TestUntarPackage(unittest.TestCase):
         self.tempdir = mkdtemp(dir=self.base_dir)
         self.tempdest = mkdtemp(dir=self.base_dir)
 
+    def _make_files(self, *relative_paths):
+        for relative_path in relative_paths:
+            path = os.path.join(self.tempdir, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            Path(path).touch()
+
+    def test_find_files_order_matches_os_walk(self):
+        self._make_files("a.sql", "sub/b.sql", "sub/deeper/c.sql", "sub2/d.yml", "e.py")
+        out = dbt.clients.system.find_files(self.base_dir, os.path.basename(self.tempdir))
+        expected = []
+        for current_path, _, local_files in os.walk(self.tempdir):
+            for local_file in local_files:
+                expected.append(
+                    os.path.relpath(os.path.join(current_path, local_file), self.tempdir)
+                )
+        self.assertEqual(out, expected)
+
+    def test_find_files_skips_ignored_directories(self):
+        self._make_files("a.sql", "ignored/b.sql", "ignored/deeper/c.sql")
+        spec = pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, ["ignored/"])
+        with unittest.mock.patch("os.scandir", wraps=os.scandir) as scandir:
+            out = dbt.clients.system.find_files(self.tempdir, "", spec)
+        self.assertEqual(out, ["a.sql"])
+        scanned = [os.path.relpath(c.args[0], self.tempdir) for c in scandir.call_args_list]
+        self.assertEqual(scanned, ["."])
+
+    def test_find_matching_negated_ignore_pattern(self):
+        self._make_files("ignored/b.sql", "ignored/keep.sql")
+        spec = pathspec.PathSpec.from_lines(
+            pathspec.patterns.GitWildMatchPattern, ["ignored/", "!ignored/keep.sql"]
+        )
+        out = dbt.clients.system.find_matching(self.tempdir, [""], "*.sql", spec)
+        self.assertEqual([o["relative_path"] for o in out], [os.path.join("ignored", "keep.sql")])
+
     def tearDown(self):
         try:
             shutil.rmtree(self.base_dir)